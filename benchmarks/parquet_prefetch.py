@@ -0,0 +1,193 @@
+"""Benchmark the read-ahead of ``read_parquet(..., filesystem="arrow")``
+
+Writes parquet files to a temporary directory and reads them through a
+pyarrow filesystem that adds a fixed latency to opening a file and limits
+the bandwidth of reads, with a CPU-bound function applied to every partition.
+The computation runs with and without ``dataframe.parquet.prefetch``.
+
+The defaults reproduce the numbers of the change that added prefetching:
+16 files of 6.5 MB, 50 ms latency, 100 MB/s and 150 ms of CPU per partition
+on the synchronous scheduler::
+
+    python benchmarks/parquet_prefetch.py
+    python benchmarks/parquet_prefetch.py --prefetch 2 4 8 --latency 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import tempfile
+import time
+
+import dask
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.fs as pa_fs
+
+from dask_expr import read_parquet
+from dask_expr.io._prefetch import get_prefetcher
+
+
+class SlowFile(io.RawIOBase):
+    """A file of which every read waits for the transfer of its bytes"""
+
+    def __init__(self, file, bandwidth):
+        super().__init__()
+        self.file = file
+        self.bandwidth = bandwidth
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.file.tell()
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self.file.seek(offset, whence)
+
+    def size(self):
+        return self.file.size()
+
+    def read(self, size=-1):
+        data = self.file.read(None if size is None or size < 0 else size)
+        time.sleep(len(data) / self.bandwidth)
+        return data
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+
+class SlowFileSystemHandler(pa_fs.FileSystemHandler):
+    """A local filesystem with the latency and bandwidth of a remote one
+
+    Listing and opening a file wait for the latency, reads wait for the
+    transfer of their bytes.
+
+    Parameters
+    ----------
+    latency: float
+        Seconds that listing and opening a file take.
+    bandwidth: float
+        Bytes per second at which data is read.
+    """
+
+    def __init__(self, latency, bandwidth):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.fs = pa_fs.LocalFileSystem()
+
+    def __reduce__(self):
+        return type(self), (self.latency, self.bandwidth)
+
+    def _wait(self):
+        time.sleep(self.latency)
+
+    def get_type_name(self):
+        return "slow-local"
+
+    def normalize_path(self, path):
+        return self.fs.normalize_path(path)
+
+    def equals(self, other):
+        return (
+            isinstance(other, SlowFileSystemHandler)
+            and self.__reduce__() == other.__reduce__()
+        )
+
+    def get_file_info(self, paths):
+        self._wait()
+        return self.fs.get_file_info(paths)
+
+    def get_file_info_selector(self, selector):
+        self._wait()
+        return self.fs.get_file_info(selector)
+
+    def open_input_file(self, path):
+        self._wait()
+        file = self.fs.open_input_file(path)
+        return pa.PythonFile(SlowFile(file, self.bandwidth), mode="r")
+
+    def open_input_stream(self, path):
+        return self.open_input_file(path)
+
+    def create_dir(self, path, recursive):
+        raise NotImplementedError("The filesystem is read-only")
+
+    delete_dir = delete_dir_contents = delete_root_dir_contents = create_dir
+    delete_file = move = copy_file = create_dir
+    open_output_stream = open_append_stream = create_dir
+
+
+def write_files(path, nfiles, nbytes):
+    # Random floats don't compress, without dictionaries the files are about
+    # nbytes large
+    ncolumns = 4
+    nrows = nbytes // (8 * ncolumns)
+    rng = np.random.default_rng(42)
+    for i in range(nfiles):
+        pdf = pd.DataFrame(rng.random((nrows, ncolumns)), columns=list("abcd"))
+        pdf.to_parquet(
+            os.path.join(path, f"part.{i}.parquet"), index=False, use_dictionary=False
+        )
+
+
+def burn(df, seconds):
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        pass
+    return df
+
+
+def run(path, filesystem, cpu, prefetch):
+    prefetcher = get_prefetcher()
+    prefetcher.clear()
+    hits = prefetcher.hits
+    with dask.config.set({"dataframe.parquet.prefetch": prefetch}):
+        df = read_parquet(path, filesystem=filesystem)
+        result = df.map_partitions(burn, cpu, meta=df._meta).sum()
+        start = time.perf_counter()
+        result.compute(scheduler="sync")
+        elapsed = time.perf_counter() - start
+    return elapsed, prefetcher.hits - hits, df.npartitions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=16)
+    parser.add_argument("--file-size", default="6.5 MB")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds")
+    parser.add_argument("--bandwidth", default="100 MB", help="bytes per second")
+    parser.add_argument("--cpu", type=float, default=0.15, help="seconds")
+    parser.add_argument("--prefetch", type=int, nargs="+", default=[4])
+    args = parser.parse_args(argv)
+
+    filesystem = pa_fs.PyFileSystem(
+        SlowFileSystemHandler(args.latency, dask.utils.parse_bytes(args.bandwidth))
+    )
+    with tempfile.TemporaryDirectory() as path:
+        write_files(path, args.files, dask.utils.parse_bytes(args.file_size))
+        size = sum(
+            os.path.getsize(os.path.join(path, name)) for name in os.listdir(path)
+        )
+        print(
+            f"{args.files} files of {size / args.files / 1e6:.1f} MB, "
+            f"{args.latency * 1000:g} ms latency, {args.bandwidth}/s, "
+            f"{args.cpu * 1000:g} ms CPU per partition"
+        )
+        for prefetch in [0] + args.prefetch:
+            elapsed, hits, npartitions = run(path, filesystem, args.cpu, prefetch)
+            print(
+                f"prefetch={prefetch}: {elapsed:.2f}s, "
+                f"{hits} of {npartitions} partitions served from memory"
+            )
+
+
+if __name__ == "__main__":
+    main()
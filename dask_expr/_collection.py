@@ -45,6 +45,7 @@ from dask.dataframe.utils import (
     pyarrow_strings_enabled,
 )
 from dask.delayed import delayed
+from dask.highlevelgraph import HighLevelGraph, MaterializedLayer
 from dask.utils import (
     IndexCallable,
     M,
@@ -75,7 +76,11 @@ from dask_expr._categorical import CategoricalAccessor, Categorize, GetCategorie
 from dask_expr._concat import Concat
 from dask_expr._core import OptimizerStage
 from dask_expr._datetime import DatetimeAccessor
-from dask_expr._describe import DescribeNonNumeric, DescribeNumeric
+from dask_expr._describe import (
+    DescribeNonNumeric,
+    DescribeNumeric,
+    single_pass_supported,
+)
 from dask_expr._dispatch import get_collection_type
 from dask_expr._expr import (
     BFill,
@@ -92,7 +97,7 @@ from dask_expr._expr import (
 )
 from dask_expr._merge import JoinRecursive, Merge
 from dask_expr._quantile import SeriesQuantile
-from dask_expr._quantiles import RepartitionQuantiles
+from dask_expr._quantiles import RepartitionQuantiles, configured_sketch_size
 from dask_expr._reductions import (
     Corr,
     Cov,
@@ -285,13 +290,87 @@ _WARN_ANNOTATIONS = True
 #
 
 
+class _ExprLayer(MaterializedLayer):
+    """The graph of a collection, along with its expression
+
+    ``dask.compute`` merges the graphs of all collections before passing them
+    to ``__dask_optimize__``, the expressions are kept so that they can be
+    optimized together by ``_optimize_together``.
+    """
+
+    def __init__(self, mapping, expr, expr_keys):
+        super().__init__(mapping)
+        self.expr = expr
+        self.expr_keys = expr_keys
+
+    def __reduce__(self):
+        # Expressions are only needed for optimizing, they aren't serialized
+        return MaterializedLayer, (self.mapping,)
+
+
+def _optimize_together(dsk, keys, **kwargs):
+    """Optimize the expressions of all collections that are computed together
+
+    Optimizing them as one ``_ExprSequence`` lets the collections share work,
+    e.g. ``dask.compute(df.x.sum(), df.y.max())`` reads every partition of
+    ``df`` once. The keys of the collections then refer to the keys of their
+    optimized expressions. Collections that are optimized already, like the
+    result of ``optimize``, are left as they are. So are collections whose
+    keys can't refer to their optimized expression, because their expression
+    is fused into a task of its own, or because the number of partitions
+    changed.
+    """
+    if not isinstance(dsk, HighLevelGraph):
+        return dsk
+    layers = [
+        layer
+        for layer in dsk.layers.values()
+        if isinstance(layer, _ExprLayer)
+        and layer.expr._name not in expr._optimized_exprs
+    ]
+    if not layers:
+        return dsk
+    exprs = [layer.expr for layer in layers]
+    if len(exprs) == 1:
+        optimized = [exprs[0].optimize()]
+    else:
+        optimized = expr._ExprSequence(*exprs).optimize().operands
+
+    # Fused tasks refer to the keys of the expressions within them, these
+    # keys can't refer to anything else
+    fused = set()
+    stack = [node for e in optimized for node in e.walk()]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, expr.Fused):
+            fused.update(x._name for x in node.exprs)
+            stack.extend(node.exprs)
+
+    graph = {}
+    aliases = {}
+    for layer, e in zip(layers, optimized):
+        old_keys, new_keys = layer.expr_keys, e.__dask_keys__()
+        if len(old_keys) != len(new_keys) or old_keys[0][0] in fused:
+            graph.update(layer)
+        else:
+            graph.update(e.__dask_graph__())
+            aliases.update(zip(old_keys, new_keys))
+    for layer in dsk.layers.values():
+        if not any(layer is other for other in layers):
+            graph.update(layer)
+    for old, new in aliases.items():
+        if old not in graph:
+            graph[old] = new
+    return graph
+
+
 class FrameBase(DaskMethodsMixin):
     """Base class for Expr-backed Collections"""
 
     __dask_scheduler__ = staticmethod(
         named_schedulers.get("threads", named_schedulers["sync"])
     )
-    __dask_optimize__ = staticmethod(lambda dsk, keys, **kwargs: dsk)
+    __dask_optimize__ = staticmethod(_optimize_together)
 
     def __init__(self, expr):
         global _WARN_ANNOTATIONS
@@ -460,12 +539,14 @@ Expr={expr}"""
 
     @property
     def dask(self):
-        return self.__dask_graph__()
+        # The plain graph, without the expression needed for optimizing
+        return self.expr.lower_completely().__dask_graph__()
 
     def __dask_graph__(self):
         out = self.expr
         out = out.lower_completely()
-        return out.__dask_graph__()
+        layer = _ExprLayer(out.__dask_graph__(), self.expr, out.__dask_keys__())
+        return HighLevelGraph({out._name: layer}, {out._name: set()})
 
     def __dask_keys__(self):
         out = self.expr
@@ -481,10 +562,6 @@ Expr={expr}"""
     def optimize(self, fuse: bool = True):
         return new_collection(self.expr.optimize(fuse=fuse))
 
-    @property
-    def dask(self):
-        return self.__dask_graph__()
-
     def __dask_postcompute__(self):
         state = new_collection(self.expr.lower_completely())
         if type(self) != type(state):
@@ -2681,7 +2758,7 @@ class DataFrame(FrameBase):
         Parameters
         ----------
         right: dask.dataframe.DataFrame
-        how : {'left', 'right', 'outer', 'inner', 'leftsemi'}, default: 'inner'
+        how : {'left', 'right', 'outer', 'inner', 'leftsemi', 'leftanti'}, default: 'inner'
             How to handle the operation of the two objects:
 
             - left: use calling frame's index (or column if on is specified)
@@ -2695,6 +2772,8 @@ class DataFrame(FrameBase):
             - leftsemi: Choose all rows in left where the join keys can be found
               in right. Won't duplicate rows if the keys are duplicated in right.
               Drops all columns from right.
+            - leftanti: Choose all rows in left where the join keys can't be found
+              in right. Drops all columns from right.
 
         on : label or list
             Column or index level names to join on. These must be found in both
@@ -3135,6 +3214,7 @@ class DataFrame(FrameBase):
         upsample: float = 1.0,
         partition_size: float = 128e6,
         append: bool = False,
+        divisions_method: str = "default",
         **options,
     ):
         """Set the DataFrame index (row labels) using an existing column.
@@ -3205,6 +3285,11 @@ class DataFrame(FrameBase):
         partition_size: int, optional
             Desired size of each partitions in bytes.
             Only used when ``npartitions='auto'``
+        divisions_method: {'default', 'sketch'}, optional
+            How the divisions are computed if they aren't given. ``'default'``
+            merges percentile summaries of the partitions, ``'sketch'``
+            merges quantile sketches of bounded size instead, see
+            ``quantile``.
 
         Examples
         --------
@@ -3270,6 +3355,7 @@ class DataFrame(FrameBase):
 
         if divisions is not None:
             check_divisions(divisions)
+        sketch_size = _divisions_sketch_size(divisions_method)
 
         if (sorted or not sort) and npartitions is not None:
             raise ValueError(
@@ -3312,6 +3398,7 @@ class DataFrame(FrameBase):
                 shuffle_method=get_specified_shuffle(shuffle_method),
                 append=append,
                 options=options,
+                sketch_size=sketch_size,
             )
         )
 
@@ -3327,6 +3414,7 @@ class DataFrame(FrameBase):
         upsample: float = 1.0,
         ignore_index: bool | None = False,
         shuffle_method: str | None = None,
+        divisions_method: str = "default",
         **options,
     ):
         """Sort the dataset by a single column.
@@ -3354,6 +3442,8 @@ class DataFrame(FrameBase):
         sort_function_kwargs: dict, optional
             Additional keyword arguments to pass to the partition sorting function.
             By default, ``by``, ``ascending``, and ``na_position`` are provided.
+        divisions_method: {'default', 'sketch'}, optional
+            How the divisions are computed, see ``set_index``.
 
         Examples
         --------
@@ -3372,6 +3462,7 @@ class DataFrame(FrameBase):
 
         if not isinstance(ascending, bool) and not len(ascending) == len(by):
             raise ValueError(f"Length of {ascending=} != length of {by=}")
+        sketch_size = _divisions_sketch_size(divisions_method)
 
         return new_collection(
             SortValues(
@@ -3387,6 +3478,7 @@ class DataFrame(FrameBase):
                 ignore_index,
                 get_specified_shuffle(shuffle_method),
                 options=options,
+                sketch_size=sketch_size,
             )
         )
 
@@ -3621,14 +3713,20 @@ class DataFrame(FrameBase):
             Iterable of numbers ranging from 0 to 1 for the desired quantiles
         axis : {0, 1, 'index', 'columns'} (default 0)
             0 or 'index' for row-wise, 1 or 'columns' for column-wise
-        method : {'default', 'tdigest', 'dask'}, optional
+        method : {'default', 'tdigest', 'dask', 'sketch'}, optional
             What method to use. By default will use dask's internal custom
             algorithm (``'dask'``).  If set to ``'tdigest'`` will use tdigest
             for floats and ints and fallback to the ``'dask'`` otherwise.
+            ``'sketch'`` tree-reduces mergeable quantile sketches of bounded
+            size for floats and ints and falls back to ``'dask'`` otherwise,
+            the size is set by the ``dataframe.quantile.sketch-size`` config
+            option.
         """
-        allowed_methods = ["default", "dask", "tdigest"]
+        allowed_methods = ["default", "dask", "tdigest", "sketch"]
         if method not in allowed_methods:
-            raise ValueError("method can only be 'default', 'dask' or 'tdigest'")
+            raise ValueError(
+                "method can only be 'default', 'dask', 'tdigest' or 'sketch'"
+            )
         meta = make_meta(
             meta_nonempty(self._meta).quantile(
                 q=q, numeric_only=numeric_only, axis=axis
@@ -3681,10 +3779,11 @@ class DataFrame(FrameBase):
         ----------
         axis : {0, 1, "index", "columns"} (default 0)
             0 or ``"index"`` for row-wise, 1 or ``"columns"`` for column-wise
-        method : {'default', 'tdigest', 'dask'}, optional
+        method : {'default', 'tdigest', 'dask', 'sketch'}, optional
             What method to use. By default will use Dask's internal custom
             algorithm (``"dask"``).  If set to ``"tdigest"`` will use tdigest
             for floats and ints and fallback to the ``"dask"`` otherwise.
+            ``"sketch"`` uses mergeable quantile sketches, see ``quantile``.
         """
         return self.quantile(
             axis=axis, method=method, numeric_only=numeric_only
@@ -3712,8 +3811,25 @@ class DataFrame(FrameBase):
         else:
             columns = self._meta.select_dtypes(include=include, exclude=exclude).columns
 
+        # Numeric columns are described together in a single pass
+        single_pass = [
+            col
+            for col in columns
+            if single_pass_supported(self._meta[col].dtype, percentiles_method)
+        ]
+        if single_pass:
+            numeric = new_collection(
+                DescribeNumeric(
+                    self[single_pass], split_every, percentiles, percentiles_method
+                )
+            )
+            if len(single_pass) == len(columns):
+                return numeric
+
         stats = [
-            self[col].describe(
+            numeric[col]
+            if col in single_pass
+            else self[col].describe(
                 split_every=split_every,
                 percentiles=percentiles,
                 percentiles_method=percentiles_method,
@@ -4215,9 +4331,18 @@ class Series(FrameBase):
     dt = CachedAccessor("dt", DatetimeAccessor)
     str = CachedAccessor("str", StringAccessor)
 
-    def _repartition_quantiles(self, npartitions, upsample=1.0, random_state=None):
+    def _repartition_quantiles(
+        self, npartitions, upsample=1.0, random_state=None, method="default"
+    ):
         return new_collection(
-            RepartitionQuantiles(self, npartitions, upsample, random_state)
+            RepartitionQuantiles(
+                self,
+                npartitions,
+                upsample,
+                random_state,
+                method,
+                configured_sketch_size(),
+            )
         )
 
     @derived_from(pd.Series)
@@ -4270,15 +4395,21 @@ class Series(FrameBase):
         ----------
         q : list/array of floats, default 0.5 (50%)
             Iterable of numbers ranging from 0 to 1 for the desired quantiles
-        method : {'default', 'tdigest', 'dask'}, optional
+        method : {'default', 'tdigest', 'dask', 'sketch'}, optional
             What method to use. By default will use dask's internal custom
             algorithm (``'dask'``).  If set to ``'tdigest'`` will use tdigest
             for floats and ints and fallback to the ``'dask'`` otherwise.
+            ``'sketch'`` tree-reduces mergeable quantile sketches of bounded
+            size for floats and ints and falls back to ``'dask'`` otherwise,
+            the size is set by the ``dataframe.quantile.sketch-size`` config
+            option.
         """
         _raise_if_object_series(self, "quantile")
-        allowed_methods = ["default", "dask", "tdigest"]
+        allowed_methods = ["default", "dask", "tdigest", "sketch"]
         if method not in allowed_methods:
-            raise ValueError("method can only be 'default', 'dask' or 'tdigest'")
+            raise ValueError(
+                "method can only be 'default', 'dask', 'tdigest' or 'sketch'"
+            )
         return new_collection(SeriesQuantile(self, q, method))
 
     @derived_from(pd.Series)
@@ -4295,10 +4426,11 @@ class Series(FrameBase):
 
         Parameters
         ----------
-        method : {'default', 'tdigest', 'dask'}, optional
+        method : {'default', 'tdigest', 'dask', 'sketch'}, optional
             What method to use. By default will use Dask's internal custom
             algorithm (``"dask"``).  If set to ``"tdigest"`` will use tdigest
             for floats and ints and fallback to the ``"dask"`` otherwise.
+            ``"sketch"`` uses mergeable quantile sketches, see ``quantile``.
         """
         return self.quantile(method=method)
 
@@ -4740,10 +4872,28 @@ def read_csv(
     storage_options=None,
     **kwargs,
 ):
-    from dask_expr.io.csv import ReadCSV
+    from dask_expr.io.csv import ReadCSV, ReadCSVPyarrow, _use_pyarrow_reader
 
     if not isinstance(path, str):
         path = stringify_path(path)
+    if _use_pyarrow_reader(header, usecols, kwargs):
+        # Plan and parse the blocks natively instead of through the legacy
+        # reader, other keywords aren't supported by it
+        kwargs = kwargs.copy()
+        kwargs.pop("engine")
+        if "delimiter" in kwargs:
+            kwargs["sep"] = kwargs.pop("delimiter")
+        return new_collection(
+            ReadCSVPyarrow(
+                path,
+                columns=usecols,
+                header=header,
+                dtype_backend=dtype_backend,
+                storage_options=storage_options,
+                pyarrow_strings_enabled=pyarrow_strings_enabled(),
+                **kwargs,
+            )
+        )
     return new_collection(
         ReadCSV(
             path,
@@ -4858,13 +5008,10 @@ def read_parquet(
             raise NotImplementedError(
                 "metadata_task_size is not supported when using the pyarrow filesystem."
             )
-        if split_row_groups != "infer":
+        if split_row_groups == "adaptive":
             raise NotImplementedError(
-                "split_row_groups is not supported when using the pyarrow filesystem."
-            )
-        if blocksize is not None and blocksize != "default":
-            raise NotImplementedError(
-                "blocksize is not supported when using the pyarrow filesystem."
+                "split_row_groups='adaptive' is not supported when using the "
+                "pyarrow filesystem."
             )
         if aggregate_files is not None:
             raise NotImplementedError(
@@ -4893,6 +5040,8 @@ def read_parquet(
                 arrow_to_pandas=arrow_to_pandas,
                 pyarrow_strings_enabled=pyarrow_strings_enabled(),
                 kwargs=kwargs,
+                split_row_groups=split_row_groups,
+                blocksize=blocksize,
                 _series=isinstance(columns, str),
             )
         )
@@ -4985,19 +5134,22 @@ def merge(
     if on and not left_on and not right_on:
         left_on = right_on = on
 
-    supported_how = ("left", "right", "outer", "inner", "leftsemi")
+    supported_how = ("left", "right", "outer", "inner", "leftsemi", "leftanti")
     if how not in supported_how:
         raise ValueError(
             f"dask.dataframe.merge does not support how='{how}'."
             f"Options are: {supported_how}."
         )
 
-    if how == "leftsemi":
+    if how == "leftanti" and indicator:
+        raise NotImplementedError("how='leftanti' does not support indicator=True")
+
+    if how in ("leftsemi", "leftanti"):
         if right_index or any(
             o not in right.columns for o in _convert_to_list(right_on)
         ):
             raise NotImplementedError(
-                "how='leftsemi' does not support right_index=True or on columns from the index"
+                f"how='{how}' does not support right_index=True or on columns from the index"
             )
         else:
             right = right[_convert_to_list(right_on)].rename(
@@ -5057,7 +5209,22 @@ def merge_asof(
     tolerance=None,
     allow_exact_matches=True,
     direction="backward",
+    shuffle_by_key=False,
 ):
+    """Perform an asof merge, see ``pandas.merge_asof``
+
+    Both inputs have to be sorted by ``on``, or by their index, and the
+    result is ordered the same way.
+
+    Parameters
+    ----------
+    shuffle_by_key : bool, default False
+        Hash-partition both inputs by the ``by`` keys and merge every
+        partition independently instead. The inputs don't have to be sorted,
+        but the result isn't ordered by ``on`` either and has unknown
+        divisions. Inputs that are indexed with known divisions on both sides
+        are merged in order regardless.
+    """
     if direction not in ["backward", "forward", "nearest"]:
         raise ValueError(
             "Invalid merge_asof direction. Choose from 'backward'"
@@ -5121,10 +5288,14 @@ def merge_asof(
         raise ValueError("Must specify both left_on and right_on if one is specified.")
     if left_by is not None and right_by is None:
         raise ValueError("Must specify both left_on and right_on if one is specified.")
+    if shuffle_by_key and kwargs["left_by"] is None:
+        raise ValueError("shuffle_by_key requires by, or left_by and right_by")
 
     from dask_expr._merge_asof import MergeAsof
 
-    return new_collection(MergeAsof(left, right, **kwargs))
+    return new_collection(
+        MergeAsof(left, right, **kwargs, shuffle_by_key=shuffle_by_key)
+    )
 
 
 def from_map(
@@ -5362,6 +5533,15 @@ def to_timedelta(arg, unit=None, errors="raise"):
     return new_collection(ToTimedelta(frame=arg, unit=unit, errors=errors))
 
 
+def _divisions_sketch_size(divisions_method):
+    # The size of the quantile sketches to compute divisions from, if any
+    if divisions_method not in ("default", "sketch"):
+        raise ValueError("divisions_method can only be 'default' or 'sketch'")
+    if divisions_method == "sketch":
+        return configured_sketch_size()
+    return None
+
+
 def _from_scalars(scalars, meta, names):
     return new_collection(FromScalars(meta, names, *scalars))
 
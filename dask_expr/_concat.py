@@ -228,6 +228,21 @@ class Concat(Expr):
             *cast_dfs,
         )
 
+    @property
+    def _arrow_partitions(self):
+        # Partitions are produced by the lowered expression, which casts the
+        # inputs to common dtypes
+        return self.axis == 0 and self._lower()._arrow_partitions
+
+    def _arrow_task(self, index: int):
+        return self._lower()._arrow_task(index)
+
+    @property
+    def _arrow_meta(self):
+        if not self._arrow_partitions:
+            return self._meta
+        return self._lower()._arrow_meta
+
     def _simplify_up(self, parent, dependents):
         if isinstance(parent, Projection):
 
@@ -305,8 +320,38 @@ class StackPartition(Concat):
     def _lower(self):
         return
 
+    @functools.cached_property
+    def _arrow_partitions(self):
+        # Partitions are only passed through when all inputs have the same
+        # columns, no missing columns are added in Arrow
+        if self.axis != 0 or not all(
+            df.ndim == 2 and df._arrow_partitions for df in self._frames
+        ):
+            return False
+        metas = [df._arrow_meta for df in self._frames]
+        return all(
+            list(meta.columns) == list(self._meta.columns)
+            and meta.dtypes.equals(metas[0].dtypes)
+            for meta in metas
+        )
+
+    def _arrow_task(self, index: int):
+        for df in self._frames:
+            if index < df.npartitions:
+                return df._arrow_task(index)
+            index -= df.npartitions
+        raise IndexError(index)
+
+    @property
+    def _arrow_meta(self):
+        if not self._arrow_partitions:
+            return self._meta
+        return self._frames[0]._arrow_meta
+
 
 class StackPartitionInterleaved(StackPartition):
+    _arrow_partitions = False
+
     def _divisions(self):
         return self._frames[0].divisions
 
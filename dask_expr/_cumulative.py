@@ -60,7 +60,7 @@ class TakeLast(Blockwise):
             if a.ndim == 1 and (a.empty or a.isna().all()):
                 return None
             a = a.ffill()
-        return a.tail(n=1).squeeze()
+        return a.tail(n=1).squeeze(axis=0)
 
 
 class CumulativeFinalize(Expr):
@@ -74,30 +74,94 @@ class CumulativeFinalize(Expr):
         return self.frame._meta
 
     def _layer(self) -> dict:
-        dsk = {}
         frame, previous_partitions = self.frame, self.previous_partitions
-        dsk[(self._name, 0)] = (frame._name, 0)
-
-        intermediate_name = self._name + "-intermediate"
-        for i in range(1, self.frame.npartitions):
-            if i == 1:
-                dsk[(intermediate_name, i)] = (previous_partitions._name, i - 1)
+        dsk, carried = prefix_scan(
+            self._name + "-intermediate",
+            [(previous_partitions._name, i) for i in range(frame.npartitions)],
+            lambda left, right: (_combine_carried, self.aggregator, left, right),
+        )
+        for i, carry in enumerate(carried):
+            if carry is None:
+                dsk[(self._name, i)] = (frame._name, i)
             else:
-                # aggregate with previous cumulation results
-                dsk[(intermediate_name, i)] = (
+                dsk[(self._name, i)] = (
                     methods._cum_aggregate_apply,
                     self.aggregator,
-                    (intermediate_name, i - 1),
-                    (previous_partitions._name, i - 1),
+                    (frame._name, i),
+                    carry,
                 )
-            dsk[(self._name, i)] = (
-                self.aggregator,
-                (self.frame._name, i),
-                (intermediate_name, i),
-            )
         return dsk
 
 
+def _combine_carried(aggregator, left, right):
+    # Partitions without any valid value carry None
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return aggregator(left, right)
+
+
+def prefix_scan(name, keys, combine):
+    """Exclusive prefix scan over the results of ``keys`` in log depth
+
+    This is a Blelloch scan: an up-sweep combines neighbouring keys into a
+    balanced tree and a down-sweep hands every subtree the combination of all
+    keys to its left. The critical path is ``2 * log2(len(keys))`` tasks
+    instead of ``len(keys)`` for a sequential carry, at about twice as many
+    tasks in total.
+
+    Parameters
+    ----------
+    name : str
+        Name of the intermediate tasks.
+    keys : list
+        Keys to scan over, in order.
+    combine : callable
+        Called with two keys (the left one first) and returns a task that
+        combines their results. The combination must be associative.
+
+    Returns
+    -------
+    dsk : dict
+        The intermediate tasks.
+    prefixes : list
+        For each of ``keys`` the key that holds the combination of all keys
+        before it, or None for the first one.
+    """
+    dsk = {}
+    n = len(keys)
+    size = 1 << max(n - 1, 0).bit_length()
+
+    def _combine(key, left, right):
+        # None stands for the (empty) padding beyond the last key
+        if left is None:
+            return right
+        if right is None:
+            return left
+        dsk[key] = combine(left, right)
+        return key
+
+    # Up-sweep, ``up[i, d]`` combines the ``d`` keys ending at ``i``
+    up = {(i, 1): keys[i] if i < n else None for i in range(size)}
+    d = 1
+    while d < size:
+        for i in range(2 * d - 1, size, 2 * d):
+            up[i, 2 * d] = _combine((name + "-up", i, 2 * d), up[i - d, d], up[i, d])
+        d *= 2
+
+    # Down-sweep, ``down[i, d]`` combines all keys left of ``up[i, d]``
+    down = {(size - 1, size): None}
+    while d > 1:
+        for i in range(d - 1, size, d):
+            down[i - d // 2, d // 2] = down[i, d]
+            down[i, d // 2] = _combine(
+                (name + "-down", i, d // 2), down[i, d], up[i - d // 2, d // 2]
+            )
+        d //= 2
+    return dsk, [down[i, 1] for i in range(n)]
+
+
 class CumSum(CumulativeAggregations):
     chunk_operation = M.cumsum
     aggregate_operation = staticmethod(methods.cumsum_aggregate)
@@ -1,16 +1,44 @@
 import functools
 
 import numpy as np
+import pandas as pd
+from dask import config
+from dask.array.dispatch import percentile_lookup
+from dask.array.percentile import merge_percentiles
+from dask.dataframe import methods
 from dask.dataframe.dispatch import make_meta, meta_nonempty
 from dask.dataframe.methods import (
     describe_nonnumeric_aggregate,
     describe_numeric_aggregate,
 )
+from dask.utils import is_series_like
 from pandas.core.dtypes.common import is_datetime64_any_dtype, is_timedelta64_dtype
 
 from dask_expr._expr import Blockwise, DropnaSeries, Filter, Head, Sqrt, ToNumeric
 from dask_expr._quantile import SeriesQuantile
 from dask_expr._reductions import Reduction, Size, ValueCounts
+from dask_expr._sketch import (
+    DEFAULT_SKETCH_SIZE,
+    create_sketch,
+    merge_sketches,
+    sketch_quantiles,
+)
+
+
+def single_pass_supported(dtype, percentile_method):
+    """Whether describe of a column can be part of a ``DescribeNumericMoments``"""
+    return (
+        percentile_method in ("default", "dask", "sketch")
+        and isinstance(dtype, np.dtype)
+        and dtype.kind in "iufmM"
+    )
+
+
+def _percentiles(percentiles):
+    if percentiles is None:
+        return [0.25, 0.5, 0.75]
+    percentiles = np.append(np.array(percentiles), 0.5)
+    return list(np.unique(percentiles))
 
 
 class DescribeNumeric(Reduction):
@@ -30,13 +58,20 @@ class DescribeNumeric(Reduction):
 
     def _lower(self):
         frame = self.frame
-        if self.percentiles is None:
-            percentiles = self.percentiles or [0.25, 0.5, 0.75]
-        else:
-            percentiles = np.array(self.percentiles)
-            percentiles = np.append(percentiles, 0.5)
-            percentiles = np.unique(percentiles)
-            percentiles = list(percentiles)
+        percentiles = _percentiles(self.percentiles)
+        dtypes = (
+            [frame._meta.dtype]
+            if is_series_like(frame._meta)
+            else list(frame._meta.dtypes)
+        )
+        if all(single_pass_supported(dt, self.percentile_method) for dt in dtypes):
+            return DescribeNumericMoments(
+                frame,
+                self.split_every,
+                percentiles,
+                self.percentile_method,
+                config.get("dataframe.quantile.sketch-size", DEFAULT_SKETCH_SIZE),
+            )
 
         is_td_col = is_timedelta64_dtype(frame._meta.dtype)
         is_dt_col = is_datetime64_any_dtype(frame._meta.dtype)
@@ -56,6 +91,157 @@ class DescribeNumeric(Reduction):
         )
 
 
+def _describe_chunk_column(s, calc_qs, k):
+    s = s.dropna()
+    if s.dtype.kind in "mM":
+        s = pd.to_numeric(s)
+    values = s.to_numpy()
+    if not len(values):
+        return 0, 0.0, 0.0, None, None, create_sketch(values, k) if k else []
+    mean = values.mean(dtype="f8")
+    m2 = np.square(values - mean).sum()
+    if k:
+        quantiles = create_sketch(values, k)
+    else:
+        quantiles = [percentile_lookup(s, calc_qs)]
+    return len(values), mean, m2, values.min(), values.max(), quantiles
+
+
+def _describe_combine_column(states, k):
+    counts, means, m2s, mins, maxs, quantiles = zip(*states)
+    counts = np.array(counts)
+    count = counts.sum()
+    if not count:
+        return states[0]
+    means = np.array(means)
+    mean = (counts * means).sum() / count
+    # Pairwise update of the sum of squared deviations
+    m2 = np.sum(m2s) + (counts * np.square(means - mean)).sum()
+    if k:
+        quantile = merge_sketches(quantiles, k)
+    else:
+        quantile = [part for parts in quantiles for part in parts]
+    return (
+        count,
+        mean,
+        m2,
+        min(m for m in mins if m is not None),
+        max(m for m in maxs if m is not None),
+        quantile,
+    )
+
+
+class DescribeNumericMoments(Reduction):
+    """Describe all numeric columns of a frame in a single tree reduction
+
+    Every partition returns the count, mean, sum of squared deviations,
+    minimum and maximum of each column, together with a quantile sketch for
+    ``percentile_method="sketch"`` or the partition's percentiles otherwise.
+    Those are merged into the describe result, so that the data is only
+    read once no matter how many columns there are.
+    """
+
+    _parameters = [
+        "frame",
+        "split_every",
+        "percentiles",
+        "percentile_method",
+        "sketch_size",
+    ]
+    _defaults = {
+        "split_every": None,
+        "percentiles": None,
+        "percentile_method": "default",
+        "sketch_size": DEFAULT_SKETCH_SIZE,
+    }
+
+    @functools.cached_property
+    def _meta(self):
+        meta = meta_nonempty(self.frame._meta)
+        chunk = self.chunk(meta, **self.chunk_kwargs)
+        return make_meta(self.aggregate([chunk], **self.aggregate_kwargs))
+
+    def _divisions(self):
+        return (None, None)
+
+    @functools.cached_property
+    def _q(self):
+        return np.array(_percentiles(self.percentiles))
+
+    @classmethod
+    def chunk(cls, df, calc_qs, k):
+        if is_series_like(df):
+            return [_describe_chunk_column(df, calc_qs, k)]
+        return [
+            _describe_chunk_column(df.iloc[:, i], calc_qs, k)
+            for i in range(len(df.columns))
+        ]
+
+    @classmethod
+    def combine(cls, inputs, calc_qs, k):
+        return [_describe_combine_column(states, k) for states in zip(*inputs)]
+
+    @classmethod
+    def aggregate(cls, inputs, calc_qs, k, q, columns, constructor, is_series):
+        results = []
+        for states, (name, dtype) in zip(zip(*inputs), columns):
+            count, mean, m2, min, max, quantiles = _describe_combine_column(states, k)
+            if k:
+                quantiles = sketch_quantiles(quantiles, q)
+            elif quantiles:
+                qs = [calc_qs] * len(quantiles)
+                quantiles = merge_percentiles(q * 100, qs, quantiles, "lower")
+            else:
+                quantiles = np.full(len(q), np.nan)
+            std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+            stats = [
+                count,
+                mean if count else np.nan,
+                std,
+                np.nan if min is None else min,
+                constructor(quantiles, q, None, name),
+                np.nan if max is None else max,
+            ]
+            results.append(
+                describe_numeric_aggregate(
+                    stats, name, dtype.kind == "m", dtype.kind == "M"
+                )
+            )
+        if is_series:
+            return results[0]
+        return methods.concat(results, axis=1)
+
+    @property
+    def chunk_kwargs(self):
+        if self.percentile_method == "sketch":
+            return {"calc_qs": None, "k": self.sketch_size}
+        # Add 0 and 100 during calculation like ``SeriesQuantileDask``
+        calc_qs = np.pad(self._q * 100, 1, mode="constant")
+        calc_qs[-1] = 100
+        return {"calc_qs": calc_qs, "k": None}
+
+    @property
+    def combine_kwargs(self):
+        return self.chunk_kwargs
+
+    @property
+    def aggregate_kwargs(self):
+        meta = self.frame._meta
+        if is_series_like(meta):
+            columns = [(meta.name, meta.dtype)]
+            constructor = meta._constructor
+        else:
+            columns = list(meta.dtypes.items())
+            constructor = meta._constructor_sliced
+        return {
+            **self.chunk_kwargs,
+            "q": self._q,
+            "columns": columns,
+            "constructor": constructor,
+            "is_series": is_series_like(meta),
+        }
+
+
 class DescribeNumericAggregate(Blockwise):
     _parameters = ["name", "is_timedelta_col", "is_datetime_col"]
     _defaults = {"is_timedelta_col": False, "is_datetime_col": False}
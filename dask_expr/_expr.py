@@ -5,12 +5,15 @@ import functools
 import numbers
 import operator
 import warnings
+import weakref
 from collections import defaultdict
 from collections.abc import Callable, Mapping
 
 import dask
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from dask.array import Array
 from dask.base import normalize_token
 from dask.core import flatten
@@ -78,6 +81,50 @@ class Expr(core.Expr):
             self, parent, dependents
         )
 
+    @property
+    def _arrow_partitions(self) -> bool:
+        """Whether ``_arrow_task`` can produce partitions as ``pyarrow.Table``
+
+        An Arrow partition holds the columns of a DataFrame partition whose
+        index is a default ``RangeIndex``. Consumers that work on Arrow, like
+        ``to_parquet``, use them to skip the conversion to pandas and back.
+        """
+        return False
+
+    def _arrow_task(self, index: int):
+        """Task that produces partition ``index`` as a ``pyarrow.Table``"""
+        raise NotImplementedError()
+
+    def _arrow_dependencies(self) -> list:
+        """Expressions whose outputs the tasks of ``_arrow_task`` refer to
+
+        Most expressions inline the tasks of their inputs, which then refer to
+        whatever the tasks of the inputs refer to.
+        """
+        deps = {}
+        for frame in self.dependencies():
+            deps.update((dep._name, dep) for dep in frame._arrow_dependencies())
+        return list(deps.values())
+
+    @property
+    def _arrow_lowered(self):
+        """Replacement that keeps producing Arrow partitions when lowered
+
+        Expressions that are lowered to ones that can't produce Arrow
+        partitions, like shuffles, return a replacement that can here.
+        Consumers substitute it through ``lower_arrow_partitions``.
+        """
+        return None
+
+    @property
+    def _arrow_meta(self):
+        """What converting the Arrow partitions to pandas would produce
+
+        This is usually ``_meta``, but may differ in dtypes that depend on
+        how the partitions are converted.
+        """
+        return self._meta
+
     @functools.cached_property
     def ndim(self):
         meta = self._meta
@@ -462,6 +509,11 @@ class Blockwise(Expr):
         args = [op._meta if isinstance(op, Expr) else op for op in self._args]
         return self.operation(*args, **self._kwargs)
 
+    @functools.cached_property
+    def _arrow_meta(self):
+        args = [op._arrow_meta if isinstance(op, Expr) else op for op in self._args]
+        return self.operation(*args, **self._kwargs)
+
     @functools.cached_property
     def _kwargs(self) -> dict:
         if self._keyword_only:
@@ -1201,6 +1253,16 @@ class RenameFrame(Elemwise):
     def operation(df, columns):
         return df.rename(columns=columns)
 
+    @property
+    def _arrow_partitions(self):
+        return self.frame._arrow_partitions and all(
+            isinstance(col, str) for col in self._meta.columns
+        )
+
+    def _arrow_task(self, index: int):
+        columns = list(self._meta.columns)
+        return (M.rename_columns, self.frame._arrow_task(index), columns)
+
     def _simplify_up(self, parent, dependents):
         if isinstance(parent, Projection) and isinstance(
             self.operand("columns"), Mapping
@@ -1442,6 +1504,64 @@ class AsType(Elemwise):
                 return result
             return type(parent)(result, *parent.operands[1:])
 
+    @functools.cached_property
+    def _arrow_casts(self):
+        # Arrow type and cast safety of every column that changes its dtype,
+        # or None if a cast in Arrow wouldn't match ``astype``
+        if (
+            self.ndim != 2
+            or not self.frame._arrow_partitions
+            or not self._meta.columns.is_unique
+        ):
+            return None
+        before, after = self.frame._arrow_meta.dtypes, self._arrow_meta.dtypes
+        casts = {}
+        for col, dtype in after.items():
+            if dtype == before[col]:
+                continue
+            cast = _arrow_cast(before[col], dtype)
+            if cast is None:
+                return None
+            casts[col] = cast
+        return casts
+
+    @property
+    def _arrow_partitions(self):
+        return self._arrow_casts is not None
+
+    def _arrow_task(self, index: int):
+        return (_arrow_astype, self.frame._arrow_task(index), self._arrow_casts)
+
+
+def _arrow_cast(source, target):
+    """``(type, safe)`` for which ``pyarrow.compute.cast`` matches ``astype``
+
+    ``astype`` to numpy dtypes wraps integers and loses precision silently,
+    to Arrow dtypes it casts safely. Casts with other semantics in pandas,
+    like floats to integers or anything to strings, return None.
+    """
+    if isinstance(target, pd.ArrowDtype):
+        # pandas turns NaN into nulls when converting floats
+        if isinstance(source, pd.ArrowDtype) or (
+            isinstance(source, np.dtype) and source.kind in "biu"
+        ):
+            return target.pyarrow_dtype, True
+        return None
+    if not isinstance(source, np.dtype) or not isinstance(target, np.dtype):
+        return None
+    if (target.kind == "f" and source.kind in "biuf") or (
+        target.kind in "iu" and source.kind in "biu"
+    ):
+        return pa.from_numpy_dtype(target), False
+    return None
+
+
+def _arrow_astype(table, casts):
+    for col, (typ, safe) in casts.items():
+        i = table.schema.get_field_index(col)
+        table = table.set_column(i, col, pc.cast(table.column(i), typ, safe=safe))
+    return table
+
 
 class IsNa(Elemwise):
     _projection_passthrough = True
@@ -1944,6 +2064,13 @@ class Projection(Elemwise):
     def _node_label_args(self):
         return [self.frame, self.operand("columns")]
 
+    @property
+    def _arrow_partitions(self):
+        return self.frame._arrow_partitions and self.ndim == 2
+
+    def _arrow_task(self, index: int):
+        return (M.select, self.frame._arrow_task(index), self.columns)
+
     def __str__(self):
         base = str(self.frame)
         if " " in base:
@@ -2174,6 +2301,32 @@ class ResetIndex(Elemwise):
                 return
             return plain_column_projection(self, parent, dependents)
 
+    @property
+    def _arrow_partitions(self):
+        return (
+            self.frame._arrow_partitions
+            and self.frame.ndim == 2
+            and (self.drop or isinstance(self._meta.columns[0], str))
+        )
+
+    def _arrow_task(self, index: int):
+        if self.drop:
+            return self.frame._arrow_task(index)
+        name = self._meta.columns[0]
+        return (_arrow_reset_index, self.frame._arrow_task(index), name)
+
+
+def _arrow_reset_index(table, name):
+    return table.add_column(0, name, [np.arange(table.num_rows)])
+
+
+def lower_arrow_partitions(expr):
+    """Substitute the ``_arrow_lowered`` replacements within ``expr``"""
+    for node in list(expr.walk()):
+        if (new := node._arrow_lowered) is not None:
+            expr = expr.substitute(node, new)
+    return expr
+
 
 class AddPrefixSeries(Elemwise):
     _parameters = ["frame", "prefix"]
@@ -2807,6 +2960,30 @@ class _DelayedExpr(Expr):
         return 0
 
 
+class _ExprSequence(Expr):
+    """A sequence of expressions
+
+    This is used to optimize several expressions together, e.g. when they
+    are computed at the same time, so that they can share work.
+    """
+
+    @functools.cached_property
+    def _meta(self):
+        return tuple(op._meta for op in self.operands)
+
+    def _divisions(self):
+        return (None, None)
+
+    def __dask_keys__(self):
+        return [op.__dask_keys__() for op in self.operands]
+
+    def _layer(self) -> dict:
+        return {}
+
+    def __str__(self):
+        return "ExprSequence(" + ", ".join(map(str, self.operands)) + ")"
+
+
 @normalize_token.register(Expr)
 def normalize_expression(expr):
     return expr._name
@@ -2838,6 +3015,9 @@ def optimize_until(expr: Expr, stage: core.OptimizerStage) -> Expr:
         return expr
 
     # Final graph-specific optimizations
+    if isinstance(expr, _ExprSequence):
+        # Only outputs that are computed together share reductions
+        expr = fuse_reductions(expr)
     expr = optimize_blockwise_fusion(expr)
     if stage == "fused":
         return expr
@@ -2867,7 +3047,14 @@ def optimize(expr: Expr, fuse: bool = True) -> Expr:
     """
     stage: core.OptimizerStage = "fused" if fuse else "simplified-physical"
 
-    return optimize_until(expr, stage)
+    result = optimize_until(expr, stage)
+    _optimized_exprs[result._name] = result
+    return result
+
+
+# Results of ``optimize``, collections around them aren't optimized again
+# when they are computed
+_optimized_exprs: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 
 
 def is_broadcastable(dfs, s):
@@ -2961,15 +3148,14 @@ def optimize_blockwise_fusion(expr):
                     dependents[next._name] = set()
                     expr_mapping[next._name] = next
 
-            for operand in next.operands:
-                if isinstance(operand, Expr):
-                    stack.append(operand)
-                    if is_valid_blockwise_op(operand):
-                        if next._name in dependencies:
-                            dependencies[next._name].add(operand._name)
-                        dependents[operand._name].add(next._name)
-                        expr_mapping[operand._name] = operand
-                        expr_mapping[next._name] = next
+            for operand in next.dependencies():
+                stack.append(operand)
+                if is_valid_blockwise_op(operand):
+                    if next._name in dependencies:
+                        dependencies[next._name].add(operand._name)
+                    dependents[operand._name].add(next._name)
+                    expr_mapping[operand._name] = operand
+                    expr_mapping[next._name] = next
 
         # Traverse each "root" until we find a fusable sub-group.
         # Here we use root to refer to a Blockwise Expr node that
@@ -3875,5 +4061,6 @@ from dask_expr._reductions import (
     Sum,
     TreeReduce,
     Var,
+    fuse_reductions,
 )
 from dask_expr.io import IO, BlockwiseIO, FromArray, FromPandas
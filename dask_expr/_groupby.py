@@ -1,11 +1,14 @@
 import functools
 import math
 import warnings
+from numbers import Integral
 from typing import Callable
 
 import numpy as np
 import pandas as pd
-from dask import is_dask_collection
+import pyarrow as pa
+import pyarrow.compute as pc
+from dask import config, is_dask_collection
 from dask.core import flatten
 from dask.dataframe.core import (
     GROUP_KEYS_DEFAULT,
@@ -19,6 +22,7 @@ from dask.dataframe.groupby import (
     _agg_finalize,
     _aggregate_docstring,
     _apply_chunk,
+    _apply_func_to_column,
     _build_agg_args,
     _cov_agg,
     _cov_chunk,
@@ -48,14 +52,16 @@ from dask.dataframe.groupby import (
     _var_agg,
     _var_chunk,
 )
-from dask.dataframe.utils import insert_meta_param_description
+from dask.dataframe.utils import has_known_categories, insert_meta_param_description
 from dask.utils import M, apply, derived_from, is_index_like
 
 from dask_expr._collection import FrameBase, Index, Series, new_collection
+from dask_expr._cumulative import prefix_scan
 from dask_expr._expr import (
     Assign,
     Blockwise,
     Expr,
+    Filter,
     MapPartitions,
     Projection,
     RenameFrame,
@@ -67,8 +73,13 @@ from dask_expr._expr import (
     determine_column_projection,
     no_default,
 )
-from dask_expr._reductions import ApplyConcatApply, Chunk, Reduction
-from dask_expr._shuffle import RearrangeByColumn
+from dask_expr._reductions import ApplyConcatApply, Chunk, NuniqueApprox, Reduction
+from dask_expr._shuffle import (
+    AssignPartitioningIndex,
+    RearrangeByColumn,
+    ShuffleBase,
+    _bucketed_by,
+)
 from dask_expr._util import (
     PANDAS_GE_300,
     _convert_to_list,
@@ -87,6 +98,163 @@ def _adjust_split_out_for_group_keys(npartitions, by):
     return math.ceil(npartitions / (10 / (len(by) - 1)))
 
 
+# Target number of groups per output partition for ``split_out="auto"``
+_AUTO_SPLIT_OUT_GROUPS_PER_PARTITION = 1_000_000
+
+# pyarrow hash aggregations used by the ``"pyarrow"`` groupby engine
+_ARROW_HASH_AGGREGATIONS = ("sum", "min", "max", "count")
+
+
+def _groupby_engine():
+    return config.get("dataframe.groupby.engine", None) or "pandas"
+
+
+def _arrow_aggregation(column, how):
+    if how == "sum":
+        # pandas sums empty and all-NA groups to 0
+        return (column, how, pc.ScalarAggregateOptions(min_count=0))
+    if how == "count":
+        return (column, how, pc.CountOptions(mode="only_valid"))
+    return (column, how)
+
+
+def _arrow_groupby_key_dtype(dtype):
+    if isinstance(dtype, pd.StringDtype):
+        return True
+    return isinstance(dtype, np.dtype) and dtype.kind in "iufbM"
+
+
+def _arrow_groupby_value_dtype(dtype):
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(
+        dtype
+    )
+
+
+def _arrow_agg_funcs(funcs):
+    """Translate ``_build_agg_args`` functions to pyarrow hash aggregations
+
+    Returns ``(result_column, input_column, aggregation)`` triples, or None
+    if any of the functions has no pyarrow equivalent.
+    """
+    arrow_funcs = []
+    for result_column, func, func_kwargs in funcs:
+        how = getattr(func_kwargs.get("func"), "method", None)
+        if func is not _apply_func_to_column or how not in _ARROW_HASH_AGGREGATIONS:
+            return None
+        arrow_funcs.append((result_column, func_kwargs["column"], how))
+    return arrow_funcs
+
+
+def _finalize_aggregation(
+    df, finalize_funcs, arg=None, columns=None, is_series=False, **kwargs
+):
+    # The finalization step of ``_agg_finalize`` for already aggregated data
+    result = df.__class__(
+        {
+            result_column: func(df, **finalize_kwargs)
+            for result_column, func, finalize_kwargs in finalize_funcs
+        }
+    )
+    if columns is not None:
+        try:
+            result = result[columns]
+        except KeyError:
+            pass
+    if (
+        is_series
+        and arg is not None
+        and not isinstance(arg, (list, dict))
+        and result.ndim == 2
+    ):
+        result = result[result.columns[0]]
+    return result
+
+
+def _pandas_to_arrow(series):
+    array = pa.array(series, from_pandas=True)
+    if pa.types.is_large_string(array.type):
+        # Hashing large_string keys (pandas' "string[pyarrow]") is a lot
+        # slower than hashing string keys
+        try:
+            array = array.cast(pa.string())
+        except pa.ArrowInvalid:
+            # More than 2GB of string data
+            pass
+    return array
+
+
+def _arrow_to_pandas(array, dtype):
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        # Convert straight to the extension array, strings don't make
+        # a round-trip through Python objects this way
+        return array.to_pandas(types_mapper=lambda _: dtype)
+    return array.to_pandas().astype(dtype)
+
+
+def _arrow_groupby_aggregate(df, by, arrow_funcs, meta, sort=False, dropna=None):
+    """Group ``df`` and aggregate it with ``pyarrow.compute``
+
+    Parameters
+    ----------
+    df: pandas.DataFrame or pandas.Series
+        The data to aggregate.
+    by: list or None
+        The key columns, or None to group by all levels of the index.
+    arrow_funcs: list
+        ``(result_column, input_column, aggregation)`` triples.
+    meta: pandas.DataFrame or pandas.Series
+        The empty result of the equivalent pandas aggregation, used to match
+        the output dtypes and type.
+    """
+    if is_series_like(df):
+        df = df.to_frame()
+    if by is None:
+        by = list(df.index.names)
+        df = df.reset_index()
+    inputs = list(dict.fromkeys(column for _, column, _ in arrow_funcs))
+
+    # Use positional names, pyarrow needs unique string column names
+    key_names = [f"k{i}" for i in range(len(by))]
+    input_names = {column: f"v{i}" for i, column in enumerate(inputs)}
+    arrays = [_pandas_to_arrow(df[key]) for key in by]
+    table = pa.Table.from_arrays(
+        arrays + [_pandas_to_arrow(df[column]) for column in inputs],
+        names=key_names + list(input_names.values()),
+    )
+    if dropna is not False and any(array.null_count for array in arrays):
+        mask = functools.reduce(pc.and_, [pc.is_valid(array) for array in arrays])
+        table = table.filter(mask)
+
+    aggregations = list(
+        dict.fromkeys((input_names[column], how) for _, column, how in arrow_funcs)
+    )
+    grouped = table.group_by(key_names).aggregate(
+        [_arrow_aggregation(name, how) for name, how in aggregations]
+    )
+
+    keys = [
+        _arrow_to_pandas(grouped[name], df[key].dtype)
+        for name, key in zip(key_names, by)
+    ]
+    if len(keys) == 1:
+        index = pd.Index(keys[0], name=by[0])
+    else:
+        index = pd.MultiIndex.from_arrays(keys, names=by)
+    result = pd.DataFrame(
+        {
+            result_column: grouped[f"{input_names[column]}_{how}"].to_pandas()
+            for result_column, column, how in arrow_funcs
+        }
+    )
+    result.index = index
+    if sort is not False:
+        result = result.sort_index()
+
+    if is_series_like(meta):
+        return result.iloc[:, 0].rename(meta.name).astype(meta.dtype)
+    return result[meta.columns].astype(meta.dtypes.to_dict())
+
+
 class Aggregation:
     """User defined groupby-aggregation.
 
@@ -182,6 +350,117 @@ class GroupByBase:
     def shuffle_by_index(self):
         return True
 
+    def _auto_split_out(self):
+        """The ``split_out`` to use for ``split_out="auto"``
+
+        The number of groups is estimated with a HyperLogLog sketch of the
+        group keys. Aggregations with few groups are reduced with a tree
+        (``split_out=1``), larger ones are shuffled into one output partition
+        per ``_AUTO_SPLIT_OUT_GROUPS_PER_PARTITION`` groups, bounded by the
+        number of input partitions. This computes the sketch, see
+        ``_resolve_split_out``.
+        """
+        if self._groups_are_partition_local:
+            return self.frame.npartitions
+        by_columns = self._by_columns
+        if len(by_columns) != len(self.by) or not set(by_columns).issubset(
+            self.frame.columns
+        ):
+            # Can only sketch plain column keys
+            if len(self.by) > 1:
+                return _adjust_split_out_for_group_keys(self.frame.npartitions, self.by)
+            return 1
+        keys = self.frame[by_columns[0] if len(by_columns) == 1 else by_columns]
+        ngroups = new_collection(NuniqueApprox(keys)).compute()
+        split_out = math.ceil(ngroups / _AUTO_SPLIT_OUT_GROUPS_PER_PARTITION)
+        return max(1, min(split_out, self.frame.npartitions))
+
+    @functools.cached_property
+    def _groups_are_partition_local(self):
+        """Whether every group is contained in a single partition
+
+        This is the case when grouping by an index with known divisions, or
+        by a superset of the columns that the frame was hash-partitioned by.
+        Such groupbys can be computed partition-wise without combining
+        intermediate results across partitions.
+        """
+        frame = self.frame
+        meta = frame._meta
+        if getattr(self, "observed", None) is not True:
+            # Unobserved categories show up in the result of every partition
+            keys = [meta.index] + [
+                meta[c]
+                for c in self._by_columns
+                if is_dataframe_like(meta) and c in meta
+            ]
+            if any(isinstance(k.dtype, pd.CategoricalDtype) for k in keys):
+                return False
+        if frame.known_divisions and any(
+            _contains_index_name(meta.index.name, b) for b in self.by
+        ):
+            return True
+        if getattr(self, "sort", False):
+            # Partitions have to be ordered as well
+            return False
+        partitioned_by = _partitioned_by(frame)
+        return partitioned_by is not None and set(partitioned_by).issubset(
+            self._by_columns
+        )
+
+    @functools.cached_property
+    def _partition_local_divisions(self):
+        if len(self.by) == 1 and _contains_index_name(
+            self.frame._meta.index.name, self.by[0]
+        ):
+            # The result is indexed by the index of the frame
+            return self.frame.divisions
+        return (None,) * (self.frame.npartitions + 1)
+
+    def _tune_split_out(self):
+        if len(self.by) > 1 and self.operand("split_out") is None:
+            return self.substitute_parameters(
+                {
+                    "split_out": functools.partial(
+                        _adjust_split_out_for_group_keys, by=self.by
+                    )
+                }
+            )
+
+
+def _resolve_split_out(expr):
+    """Replace ``split_out="auto"`` by the estimated number of output partitions
+
+    Like the divisions of ``set_index``, the estimate is computed right away,
+    so that ``npartitions`` and ``divisions`` match the computed result.
+    """
+    if "split_out" in expr._parameters and expr.operand("split_out") == "auto":
+        return expr.substitute_parameters({"split_out": expr._auto_split_out()})
+    return expr
+
+
+def _partitioned_by(frame):
+    """The columns ``frame`` is known to be hash-partitioned by, or None"""
+    if (bucketing := _bucketed_by(frame)) is not None:
+        return bucketing[0]
+    while isinstance(frame, (Filter, Projection)):
+        frame = frame.frame
+    if not isinstance(frame, ShuffleBase) or getattr(frame, "index_shuffle", None):
+        return None
+    partitioning_index = frame.partitioning_index
+    if (
+        isinstance(frame.frame, AssignPartitioningIndex)
+        and frame.frame.index_name == partitioning_index
+    ):
+        # Lowered shuffle, the partitioning column was assigned from the keys
+        if frame.frame.index_shuffle:
+            return None
+        partitioning_index = frame.frame.partitioning_index
+    if isinstance(partitioning_index, (str, int)):
+        return [partitioning_index]
+    if isinstance(partitioning_index, list):
+        return partitioning_index
+    return None
+
 
 class GroupByChunk(Chunk, GroupByBase):
     @functools.cached_property
@@ -218,15 +497,38 @@ class GroupByApplyConcatApply(ApplyConcatApply, GroupByBase):
     def _projection_columns(self):
         return self.frame.columns
 
+    def _divisions(self):
+        if self._groups_are_partition_local:
+            return self._partition_local_divisions
+        return super()._divisions()
+
     def _tune_down(self):
-        if len(self.by) > 1 and self.operand("split_out") is None:
-            return self.substitute_parameters(
-                {
-                    "split_out": functools.partial(
-                        _adjust_split_out_for_group_keys, by=self.by
-                    )
-                }
-            )
+        return self._tune_split_out()
+
+    def _use_arrow_engine(self, columns):
+        """Whether to aggregate ``columns`` with the ``"pyarrow"`` engine
+
+        The engine is opt-in through the ``engine`` operand and limited to
+        numeric values grouped by column keys with dtypes that round-trip
+        through Arrow. Everything else keeps using pandas.
+        """
+        if self.engine != "pyarrow":
+            return False
+        meta = self.frame._meta
+        by = self.by
+        if (
+            not isinstance(meta, pd.DataFrame)
+            or self.dropna is False
+            or not by
+            or any(isinstance(key, Expr) for key in by)
+            or not set(by).issubset(meta.columns)
+            or set(by).intersection(columns)
+            or meta.columns.has_duplicates
+        ):
+            return False
+        return all(_arrow_groupby_key_dtype(meta[key].dtype) for key in by) and all(
+            _arrow_groupby_value_dtype(meta[column].dtype) for column in columns
+        )
 
 
 class SingleAggregation(GroupByApplyConcatApply, GroupByBase):
@@ -254,6 +556,9 @@ class SingleAggregation(GroupByApplyConcatApply, GroupByBase):
         Key-word arguments to pass to `groupby_chunk`.
     aggregate_kwargs:
         Key-word arguments to pass to `aggregate_chunk`.
+    engine:
+        ``"pyarrow"`` to aggregate with pyarrow where possible, pandas is
+        used otherwise.
     """
 
     _parameters = [
@@ -267,6 +572,7 @@ class SingleAggregation(GroupByApplyConcatApply, GroupByBase):
         "split_out",
         "sort",
         "shuffle_method",
+        "engine",
     ]
     _defaults = {
         "observed": None,
@@ -278,18 +584,65 @@ class SingleAggregation(GroupByApplyConcatApply, GroupByBase):
         "split_out": None,
         "sort": None,
         "shuffle_method": None,
+        "engine": None,
     }
 
     groupby_chunk = None
     groupby_aggregate = None
+    # Names of the pyarrow hash aggregations equivalent to
+    # `groupby_chunk` and `groupby_aggregate`, if any
+    arrow_chunk = None
+    arrow_aggregate = None
 
     @classmethod
-    def chunk(cls, df, *by, **kwargs):
+    def chunk(cls, df, *by, arrow_funcs=None, **kwargs):
+        if arrow_funcs is not None:
+            meta = _apply_chunk(df.iloc[:0], *by, **kwargs)
+            return _arrow_groupby_aggregate(
+                df, list(by), arrow_funcs, meta, dropna=kwargs.get("dropna")
+            )
         return _apply_chunk(df, *by, **kwargs)
 
     @classmethod
-    def aggregate(cls, inputs, **kwargs):
-        return _groupby_aggregate(_concat(inputs), **kwargs)
+    def aggregate(cls, inputs, arrow_funcs=None, **kwargs):
+        df = _concat(inputs)
+        if arrow_funcs is not None:
+            meta = _groupby_aggregate(df.iloc[:0], **kwargs)
+            return _arrow_groupby_aggregate(
+                df,
+                None,
+                arrow_funcs,
+                meta,
+                sort=kwargs.get("sort"),
+                dropna=kwargs.get("dropna"),
+            )
+        return _groupby_aggregate(df, **kwargs)
+
+    @property
+    def _arrow_columns(self):
+        # The aggregated columns if the "pyarrow" engine can be used
+        if self.arrow_chunk is None or self.engine != "pyarrow":
+            return None
+        for kwargs in (self.operand("chunk_kwargs"), self.operand("aggregate_kwargs")):
+            if set(kwargs or {}) - {"numeric_only"}:
+                return None
+        if self._slice is None:
+            columns = [c for c in self.frame.columns if c not in self._by_columns]
+            if (self.operand("chunk_kwargs") or {}).get("numeric_only"):
+                dtypes = self.frame._meta.dtypes
+                columns = [
+                    c for c in columns if pd.api.types.is_numeric_dtype(dtypes[c])
+                ]
+        elif is_scalar(self._slice):
+            columns = [self._slice]
+        else:
+            columns = list(self._slice)
+        return columns if self._use_arrow_engine(columns) else None
+
+    def _arrow_funcs(self, how):
+        if self._arrow_columns is None:
+            return None
+        return [(column, column, how) for column in self._arrow_columns]
 
     @property
     def chunk_kwargs(self) -> dict:
@@ -300,6 +653,7 @@ class SingleAggregation(GroupByApplyConcatApply, GroupByBase):
             "columns": columns,
             **_as_dict("observed", self.observed),
             **_as_dict("dropna", self.dropna),
+            **_as_dict("arrow_funcs", self._arrow_funcs(self.arrow_chunk)),
             **chunk_kwargs,
         }
 
@@ -307,12 +661,14 @@ class SingleAggregation(GroupByApplyConcatApply, GroupByBase):
     def aggregate_kwargs(self) -> dict:
         aggregate_kwargs = self.operand("aggregate_kwargs") or {}
         groupby_aggregate = self.groupby_aggregate or self.groupby_chunk
+        arrow_aggregate = self.arrow_aggregate or self.arrow_chunk
         return {
             "aggfunc": groupby_aggregate,
             "levels": self.levels,
             "sort": self.sort,
             **_as_dict("observed", self.observed),
             **_as_dict("dropna", self.dropna),
+            **_as_dict("arrow_funcs", self._arrow_funcs(arrow_aggregate)),
             **aggregate_kwargs,
         }
 
@@ -340,6 +696,9 @@ class GroupbyAggregationBase(GroupByApplyConcatApply, GroupByBase):
         Passed through to dataframe backend.
     dropna:
         Whether rows with NA values should be dropped.
+    engine:
+        ``"pyarrow"`` to aggregate with pyarrow where possible, pandas is
+        used otherwise.
     """
 
     _parameters = [
@@ -352,6 +711,7 @@ class GroupbyAggregationBase(GroupByApplyConcatApply, GroupByBase):
         "sort",
         "shuffle_method",
         "_slice",
+        "engine",
     ]
     _defaults = {
         "observed": None,
@@ -361,6 +721,7 @@ class GroupbyAggregationBase(GroupByApplyConcatApply, GroupByBase):
         "sort": None,
         "shuffle_method": None,
         "_slice": None,
+        "engine": None,
     }
 
     @functools.cached_property
@@ -450,6 +811,7 @@ class GroupbyAggregation(GroupbyAggregationBase):
             self.sort,
             self.shuffle_method,
             self._slice,
+            self.engine,
             *self.by,
         )
 
@@ -506,16 +868,63 @@ class DecomposableGroupbyAggregation(GroupbyAggregationBase):
     The results may be calculated via tree or shuffle reduction.
     """
 
-    chunk = staticmethod(_groupby_apply_funcs)
+    @classmethod
+    def chunk(cls, df, *by, arrow_funcs=None, **kwargs):
+        if arrow_funcs is not None:
+            meta = _groupby_apply_funcs(df.iloc[:0], *by, **kwargs)
+            return _arrow_groupby_aggregate(
+                df, list(by), arrow_funcs, meta, dropna=kwargs.get("dropna")
+            )
+        return _groupby_apply_funcs(df, *by, **kwargs)
 
     @classmethod
-    def combine(cls, inputs, **kwargs):
-        return _groupby_apply_funcs(_concat(inputs), **kwargs)
+    def combine(cls, inputs, arrow_funcs=None, **kwargs):
+        df = _concat(inputs)
+        if arrow_funcs is not None:
+            meta = _groupby_apply_funcs(df.iloc[:0], **kwargs)
+            return _arrow_groupby_aggregate(
+                df,
+                None,
+                arrow_funcs,
+                meta,
+                sort=kwargs.get("sort"),
+                dropna=kwargs.get("dropna"),
+            )
+        return _groupby_apply_funcs(df, **kwargs)
 
     @classmethod
-    def aggregate(cls, inputs, **kwargs):
+    def aggregate(cls, inputs, arrow_funcs=None, **kwargs):
+        if arrow_funcs is not None:
+            df = cls.combine(
+                inputs,
+                arrow_funcs=arrow_funcs,
+                funcs=kwargs.pop("aggregate_funcs"),
+                level=kwargs.pop("level"),
+                sort=kwargs.pop("sort", False),
+                **_as_dict("observed", kwargs.pop("observed", None)),
+                **_as_dict("dropna", kwargs.pop("dropna", None)),
+            )
+            return _finalize_aggregation(df, **kwargs)
         return _agg_finalize(_concat(inputs), **kwargs)
 
+    @property
+    def _arrow_engine(self):
+        if self.engine != "pyarrow":
+            return False
+        chunk_funcs = _arrow_agg_funcs(self.agg_args["chunk_funcs"])
+        return (
+            chunk_funcs is not None
+            and _arrow_agg_funcs(self.agg_args["aggregate_funcs"]) is not None
+            and self._use_arrow_engine(
+                list(dict.fromkeys(column for _, column, _ in chunk_funcs))
+            )
+        )
+
+    def _arrow_funcs(self, key):
+        if not self._arrow_engine:
+            return None
+        return _arrow_agg_funcs(self.agg_args[key])
+
     @property
     def chunk_kwargs(self) -> dict:
         return {
@@ -523,6 +932,7 @@ class DecomposableGroupbyAggregation(GroupbyAggregationBase):
             "sort": self.sort,
             **_as_dict("observed", self.observed),
             **_as_dict("dropna", self.dropna),
+            **_as_dict("arrow_funcs", self._arrow_funcs("chunk_funcs")),
         }
 
     @property
@@ -533,11 +943,13 @@ class DecomposableGroupbyAggregation(GroupbyAggregationBase):
             "sort": self.sort,
             **_as_dict("observed", self.observed),
             **_as_dict("dropna", self.dropna),
+            **_as_dict("arrow_funcs", self._arrow_funcs("aggregate_funcs")),
         }
 
     @property
     def aggregate_kwargs(self) -> dict:
         return {
+            **_as_dict("arrow_funcs", self._arrow_funcs("aggregate_funcs")),
             "aggregate_funcs": self.agg_args["aggregate_funcs"],
             "arg": self.arg,
             "columns": self._slice,
@@ -552,6 +964,7 @@ class DecomposableGroupbyAggregation(GroupbyAggregationBase):
 
 class Sum(SingleAggregation):
     groupby_chunk = M.sum
+    arrow_chunk = "sum"
 
 
 class Prod(SingleAggregation):
@@ -560,10 +973,12 @@ class Prod(SingleAggregation):
 
 class Min(SingleAggregation):
     groupby_chunk = M.min
+    arrow_chunk = "min"
 
 
 class Max(SingleAggregation):
     groupby_chunk = M.max
+    arrow_chunk = "max"
 
 
 class First(SingleAggregation):
@@ -574,12 +989,125 @@ class Last(SingleAggregation):
     groupby_chunk = M.last
 
 
-class Count(SingleAggregation):
+def _dense_counts(df, key, columns):
+    # Group sizes followed by the non-null counts of ``columns``, by code
+    codes = df[key].cat.codes.to_numpy()
+    ncategories = len(df[key].cat.categories)
+    valid = codes >= 0
+    counts = [np.bincount(codes[valid], minlength=ncategories)]
+    for column in columns:
+        notna = valid & df[column].notna().to_numpy()
+        counts.append(np.bincount(codes[notna], minlength=ncategories))
+    return np.column_stack(counts)
+
+
+def _dense_counts_to_chunk(counts, meta):
+    # What ``groupby_chunk`` returns for the observed categories
+    observed = counts[:, 0] > 0
+    categories = pd.Categorical.from_codes(
+        np.flatnonzero(observed), dtype=meta.index.dtype
+    )
+    index = pd.CategoricalIndex(categories, name=meta.index.name)
+    counts = counts[observed]
+    if meta.ndim == 1:
+        return pd.Series(counts[:, -1], index=index, name=meta.name)
+    return pd.DataFrame(counts[:, 1:], index=index, columns=meta.columns)
+
+
+class DenseCountAggregation(SingleAggregation):
+    """Groupby aggregation that counts rows per group
+
+    Grouping by a single categorical column with known categories counts
+    the categorical codes with ``np.bincount`` instead of hashing the keys.
+    The intermediate results are arrays of a fixed size that are summed up.
+    """
+
+    # Whether to count the non-null values of every column, not just rows
+    count_values = False
+
+    @functools.cached_property
+    def _dense_meta(self):
+        # The empty result of ``groupby_chunk`` if the codes can be counted
+        meta = self.frame._meta
+        by = self.by
+        if (
+            self.operand("chunk_kwargs")
+            or self.operand("aggregate_kwargs")
+            or not isinstance(meta, pd.DataFrame)
+            or len(by) != 1
+            or isinstance(by[0], Expr)
+            or by[0] not in meta.columns
+            or not isinstance(meta[by[0]].dtype, pd.CategoricalDtype)
+            or not has_known_categories(meta[by[0]])
+            or self.dropna is False
+            or self.split_out != 1
+            or self.split_out is True
+            or self._groups_are_partition_local
+            or self._arrow_columns is not None
+        ):
+            return None
+        return make_meta(
+            _apply_chunk(
+                meta_nonempty(meta),
+                *self._by_meta,
+                chunk=self.groupby_chunk,
+                columns=self._slice,
+                observed=True,
+            )
+        )
+
+    @classmethod
+    def chunk(cls, df, *by, dense_columns=None, **kwargs):
+        if dense_columns is not None:
+            return _dense_counts(df, by[0], dense_columns)
+        return super().chunk(df, *by, **kwargs)
+
+    @classmethod
+    def combine(cls, inputs, dense_meta=None, **kwargs):
+        if dense_meta is not None:
+            return sum(inputs)
+        return cls.aggregate(inputs, **kwargs)
+
+    @classmethod
+    def aggregate(cls, inputs, dense_meta=None, **kwargs):
+        if dense_meta is not None:
+            inputs = [_dense_counts_to_chunk(sum(inputs), dense_meta)]
+        return super().aggregate(inputs, **kwargs)
+
+    @property
+    def chunk_kwargs(self) -> dict:
+        meta = self._dense_meta
+        if meta is None:
+            return super().chunk_kwargs
+        if not self.count_values:
+            columns = []
+        elif meta.ndim == 1:
+            columns = [meta.name]
+        else:
+            columns = list(meta.columns)
+        return {"dense_columns": columns}
+
+    @property
+    def combine_kwargs(self) -> dict:
+        return self.aggregate_kwargs
+
+    @property
+    def aggregate_kwargs(self) -> dict:
+        return {
+            **super().aggregate_kwargs,
+            **_as_dict("dense_meta", self._dense_meta),
+        }
+
+
+class Count(DenseCountAggregation):
     groupby_chunk = M.count
     groupby_aggregate = M.sum
+    arrow_chunk = "count"
+    arrow_aggregate = "sum"
+    count_values = True
 
 
-class Size(SingleAggregation):
+class Size(DenseCountAggregation):
     groupby_chunk = M.size
     groupby_aggregate = M.sum
 
@@ -671,14 +1199,7 @@ class GroupByReduction(Reduction, GroupByBase):
     _chunk_cls = GroupByChunk
 
     def _tune_down(self):
-        if len(self.by) > 1 and self.operand("split_out") is None:
-            return self.substitute_parameters(
-                {
-                    "split_out": functools.partial(
-                        _adjust_split_out_for_group_keys, by=self.by
-                    )
-                }
-            )
+        return self._tune_split_out()
 
     @property
     def split_out(self):
@@ -696,6 +1217,8 @@ class GroupByReduction(Reduction, GroupByBase):
         return self.chunk(meta, *self._by_meta, **self.chunk_kwargs)
 
     def _divisions(self):
+        if self._groups_are_partition_local:
+            return self._partition_local_divisions
         if self.sort:
             return (None, None)
         split_out = self.split_out
@@ -847,6 +1370,117 @@ class NUnique(SingleAggregation):
         return {"levels": self.levels}
 
 
+def _hll_registers(values, b):
+    # HyperLogLog register and rank of every value, see
+    # ``dask.dataframe.hyperloglog.compute_hll_array``
+    hashes = pd.util.hash_pandas_object(values, index=False)._values
+    hashes = hashes.astype(np.uint32)
+    registers = hashes >> np.uint32(32 - b)
+    # Position of the lowest set bit, 33 if there is none
+    lowest = hashes & (~hashes + np.uint32(1))
+    ranks = np.where(lowest == 0, 33, np.frexp(lowest)[1]).astype(np.uint8)
+    return registers, ranks
+
+
+def _check_hll_precision(b):
+    if not isinstance(b, Integral) or not 4 <= b <= 16:
+        raise ValueError(f"b must be an integer between 4 and 16, got {b!r}")
+
+
+def _nunique_approx_chunk(df, *by, name, b, observed=None, dropna=None):
+    values = df if df.ndim == 1 else df[name]
+    registers, ranks = _hll_registers(values, b)
+    # Null values don't count, a rank of 0 leaves a register empty
+    ranks[values.isna().values] = 0
+    registers = pd.Series(registers, index=df.index, name="hll-register")
+    ranks = pd.Series(ranks, index=df.index, name="hll-rank")
+    keys = [df[key] if np.isscalar(key) else key for key in by]
+    g = ranks.groupby(
+        keys + [registers],
+        sort=False,
+        **_as_dict("observed", observed),
+        **_as_dict("dropna", dropna),
+    )
+    return g.max().reset_index(level=-1)
+
+
+def _nunique_approx_combine(dfs, levels):
+    df = concat(dfs)
+    keys = [df.index.get_level_values(i) for i in range(df.index.nlevels)]
+    g = df["hll-rank"].groupby(
+        keys + [df["hll-register"]], sort=False, observed=True, dropna=False
+    )
+    return g.max().reset_index(level=-1)
+
+
+def _nunique_approx_aggregate(
+    dfs, levels, name, b, sort=False, observed=None, dropna=None
+):
+    ranks = _nunique_approx_combine(dfs, levels)["hll-rank"]
+    m = 1 << b
+    present = ranks > 0
+    registers = pd.DataFrame(
+        {
+            "inverse": np.where(present, 2.0 ** -ranks.astype("f8"), 0.0),
+            "count": present.astype("i8"),
+        },
+        index=ranks.index,
+    )
+    registers = registers.groupby(
+        level=levels, sort=sort, dropna=False, **_as_dict("observed", observed)
+    ).sum()
+
+    # Same estimate as ``dask.dataframe.hyperloglog.estimate_count`` for
+    # every group at once
+    empty = m - registers["count"].values
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / (registers["inverse"].values + empty)
+    with np.errstate(divide="ignore"):
+        small = m * np.log(m / empty)
+    estimate = np.where((estimate < 2.5 * m) & (empty > 0), small, estimate)
+    with np.errstate(invalid="ignore"):
+        large = -(2**32) * np.log1p(-estimate / 2**32)
+    estimate = np.where(estimate > 2**32 / 30.0, large, estimate)
+    return pd.Series(estimate, index=registers.index, name=name)
+
+
+class ApproxNUnique(SingleAggregation):
+    """Approximate number of unique values per group
+
+    Every group keeps the non-empty registers of a HyperLogLog sketch, so the
+    intermediate results are bounded by the number of groups times ``2**b``
+    instead of the number of unique values.
+    """
+
+    chunk = staticmethod(_nunique_approx_chunk)
+    combine = staticmethod(_nunique_approx_combine)
+    aggregate = staticmethod(_nunique_approx_aggregate)
+
+    @functools.cached_property
+    def chunk_kwargs(self) -> dict:
+        return {
+            "name": self._slice,
+            "b": self.operand("chunk_kwargs")["b"],
+            **_as_dict("observed", self.observed),
+            **_as_dict("dropna", self.dropna),
+        }
+
+    @functools.cached_property
+    def combine_kwargs(self) -> dict:
+        return {"levels": self.levels}
+
+    @functools.cached_property
+    def aggregate_kwargs(self) -> dict:
+        return {
+            "levels": self.levels,
+            "name": self._slice,
+            "b": self.operand("chunk_kwargs")["b"],
+            "sort": self.sort,
+            **_as_dict("observed", self.observed),
+            **_as_dict("dropna", self.dropna),
+        }
+
+
 class Head(SingleAggregation):
     groupby_chunk = staticmethod(_head_chunk)
     groupby_aggregate = staticmethod(_head_aggregate)
@@ -902,9 +1536,7 @@ class GroupByApply(Expr, GroupByBase):
 
     @property
     def need_to_shuffle(self):
-        return any(div is None for div in self.frame.divisions) or not any(
-            _contains_index_name(self.frame._meta.index.name, b) for b in self.by
-        )
+        return not self._groups_are_partition_local
 
     def _lower(self):
         df = self.frame
@@ -1412,26 +2044,23 @@ class GroupByCumulativeFinalizer(Expr, GroupByBase):
         return self.frame.divisions
 
     def _layer(self) -> dict:
-        dsk = {(self._name, 0): (self.cum_raw._name, 0)}
-        name_cum = "cum-last" + self._name
-
-        for i in range(1, self.frame.npartitions):
-            # store each cumulative step to graph to reduce computation
-            if i == 1:
-                dsk[(name_cum, i)] = (self.cum_last._name, i - 1)
-            else:
-                # aggregate with previous cumulation results
-                dsk[(name_cum, i)] = (
-                    _cum_agg_filled,
-                    (name_cum, i - 1),
-                    (self.cum_last._name, i - 1),
-                    self.aggregate,
-                    self.initial,
-                )
+        dsk, carried = prefix_scan(
+            "cum-last" + self._name,
+            [(self.cum_last._name, i) for i in range(self.frame.npartitions)],
+            lambda left, right: (
+                _cum_agg_filled,
+                left,
+                right,
+                self.aggregate,
+                self.initial,
+            ),
+        )
+        dsk[(self._name, 0)] = (self.cum_raw._name, 0)
+        for i, carry in enumerate(carried[1:], start=1):
             dsk[(self._name, i)] = (
                 _cum_agg_aligned,
                 (self.frame._name, i),
-                (name_cum, i),
+                carry,
                 self.by,
                 self.operand("columns"),
                 self.aggregate,
@@ -1544,18 +2173,21 @@ class GroupBy:
         if split_every is None:
             split_every = 8
         return new_collection(
-            expr_cls(
-                self.obj.expr,
-                self.observed,
-                self.dropna,
-                chunk_kwargs,
-                aggregate_kwargs,
-                self._slice,
-                split_every,
-                split_out,
-                self.sort,
-                get_specified_shuffle(shuffle_method),
-                *self.by,
+            _resolve_split_out(
+                expr_cls(
+                    self.obj.expr,
+                    self.observed,
+                    self.dropna,
+                    chunk_kwargs,
+                    aggregate_kwargs,
+                    self._slice,
+                    split_every,
+                    split_out,
+                    self.sort,
+                    get_specified_shuffle(shuffle_method),
+                    _groupby_engine(),
+                    *self.by,
+                )
             )
         )
 
@@ -1613,6 +2245,59 @@ class GroupBy:
     def count(self, **kwargs):
         return self._single_agg(Count, **kwargs)
 
+    def nunique_approx(
+        self, split_every=None, split_out=None, shuffle_method=None, b=16
+    ):
+        """Approximate number of unique values per group and column
+
+        Every column that isn't a group key is estimated like in
+        ``SeriesGroupBy.nunique_approx``.
+
+        Parameters
+        ----------
+        split_every : int, optional
+            Group partitions into groups of this size while performing a
+            tree-reduction. If set to False, no tree-reduction will be used.
+            Default is 8.
+        split_out : int, optional
+            Number of output partitions. Default is 1.
+        shuffle_method : str, optional
+            Shuffle method to use if ``split_out`` is larger than 1.
+        b : int, optional
+            Number of hash bits that select a register, between 4 and 16.
+            Default is 16.
+
+        Returns
+        -------
+        A DataFrame of floats with the approximate number of unique values of
+        every group and column
+        """
+        from dask_expr._collection import concat
+
+        _check_hll_precision(b)
+        if self._slice is not None:
+            columns = _convert_to_list(self._slice)
+        else:
+            keys = {key for key in self.by if is_scalar(key)}
+            columns = [c for c in self.obj.columns if c not in keys]
+        if not columns:
+            raise ValueError("No columns to estimate the number of unique values of")
+        results = []
+        for c in columns:
+            results.append(
+                self[c].nunique_approx(
+                    split_every=split_every,
+                    split_out=split_out,
+                    shuffle_method=shuffle_method,
+                    b=b,
+                )
+            )
+            if split_out == "auto":
+                # The columns share their keys, only estimate once
+                split_out = results[0].npartitions
+        # Outputs with the same keys are partitioned the same way
+        return concat(results, axis=1, ignore_unknown_divisions=True)
+
     @derived_from(pd.core.groupby.GroupBy)
     def sum(self, numeric_only=False, min_count=None, **kwargs):
         numeric_kwargs = self._numeric_only_kwargs(numeric_only)
@@ -1836,17 +2521,19 @@ class GroupBy:
                 "'numeric_only=False' is not implemented in Dask."
             )
         result = new_collection(
-            Var(
-                self.obj.expr,
-                ddof,
-                numeric_only,
-                split_out,
-                split_every,
-                self.sort,
-                self.dropna,
-                self.observed,
-                shuffle_method,
-                *self.by,
+            _resolve_split_out(
+                Var(
+                    self.obj.expr,
+                    ddof,
+                    numeric_only,
+                    split_out,
+                    split_every,
+                    self.sort,
+                    self.dropna,
+                    self.observed,
+                    shuffle_method,
+                    *self.by,
+                )
             )
         )
         return self._postprocess_series_squeeze(result)
@@ -1865,17 +2552,19 @@ class GroupBy:
                 "'numeric_only=False' is not implemented in Dask."
             )
         result = new_collection(
-            Std(
-                self.obj.expr,
-                ddof,
-                numeric_only,
-                split_out,
-                split_every,
-                self.sort,
-                self.dropna,
-                self.observed,
-                shuffle_method,
-                *self.by,
+            _resolve_split_out(
+                Std(
+                    self.obj.expr,
+                    ddof,
+                    numeric_only,
+                    split_out,
+                    split_every,
+                    self.sort,
+                    self.dropna,
+                    self.observed,
+                    shuffle_method,
+                    *self.by,
+                )
             )
         )
         return self._postprocess_series_squeeze(result)
@@ -1891,17 +2580,20 @@ class GroupBy:
             return self.size()
 
         return new_collection(
-            GroupbyAggregation(
-                self.obj.expr,
-                arg,
-                self.observed,
-                self.dropna,
-                split_every,
-                split_out,
-                self.sort,
-                shuffle_method,
-                self._slice,
-                *self.by,
+            _resolve_split_out(
+                GroupbyAggregation(
+                    self.obj.expr,
+                    arg,
+                    self.observed,
+                    self.dropna,
+                    split_every,
+                    split_out,
+                    self.sort,
+                    shuffle_method,
+                    self._slice,
+                    _groupby_engine(),
+                    *self.by,
+                )
             )
         )
 
@@ -1973,18 +2665,20 @@ class GroupBy:
         self, expr_cls, func, meta=no_default, shuffle_method=None, *args, **kwargs
     ):
         return new_collection(
-            expr_cls(
-                self.obj.expr,
-                self.observed,
-                self.dropna,
-                self._slice,
-                self.group_keys,
-                func,
-                meta,
-                args,
-                kwargs,
-                get_specified_shuffle(shuffle_method),
-                *self.by,
+            _resolve_split_out(
+                expr_cls(
+                    self.obj.expr,
+                    self.observed,
+                    self.dropna,
+                    self._slice,
+                    self.group_keys,
+                    func,
+                    meta,
+                    args,
+                    kwargs,
+                    get_specified_shuffle(shuffle_method),
+                    *self.by,
+                )
             )
         )
 
@@ -2229,18 +2923,72 @@ class SeriesGroupBy(GroupBy):
         """
         slice = self._slice or self.obj.name
         return new_collection(
-            NUnique(
-                self.obj.expr,
-                self.observed,
-                self.dropna,
-                None,
-                None,
-                slice,
-                split_every,
-                split_out,
-                self.sort,
-                get_specified_shuffle(shuffle_method),
-                *self.by,
+            _resolve_split_out(
+                NUnique(
+                    self.obj.expr,
+                    self.observed,
+                    self.dropna,
+                    None,
+                    None,
+                    slice,
+                    split_every,
+                    split_out,
+                    self.sort,
+                    get_specified_shuffle(shuffle_method),
+                    None,
+                    *self.by,
+                )
+            )
+        )
+
+    def nunique_approx(
+        self, split_every=None, split_out=None, shuffle_method=None, b=16
+    ):
+        """Approximate number of unique values per group
+
+        This method uses the HyperLogLog algorithm for cardinality
+        estimation. Every group keeps a sketch of at most ``2**b`` small
+        registers instead of all of its unique values, the approximate error
+        is 0.406% for ``b=16``.
+
+        Parameters
+        ----------
+        split_every : int, optional
+            Group partitions into groups of this size while performing a
+            tree-reduction. If set to False, no tree-reduction will be used.
+            Default is 8.
+        split_out : int, optional
+            Number of output partitions. Default is 1.
+        shuffle_method : str, optional
+            Shuffle method to use if ``split_out`` is larger than 1.
+        b : int, optional
+            Number of hash bits that select a register, between 4 and 16.
+            Smaller sketches use less memory but are less accurate, the
+            error is about ``1.04 / sqrt(2**b)``. Default is 16.
+
+        Returns
+        -------
+        A Series of floats with the approximate number of unique values of
+        every group
+        """
+        _check_hll_precision(b)
+        slice = self._slice or self.obj.name
+        return new_collection(
+            _resolve_split_out(
+                ApproxNUnique(
+                    self.obj.expr,
+                    self.observed,
+                    self.dropna,
+                    {"b": b},
+                    None,
+                    slice,
+                    split_every,
+                    split_out,
+                    self.sort,
+                    get_specified_shuffle(shuffle_method),
+                    None,
+                    *self.by,
+                )
             )
         )
 
@@ -1,14 +1,11 @@
+import bisect
 import functools
 import math
 import operator
 
+from dask.dataframe.core import _concat
 from dask.dataframe.dispatch import make_meta, meta_nonempty
-from dask.dataframe.multi import (
-    _concat_wrapper,
-    _merge_chunk_wrapper,
-    _split_partition,
-    merge_chunk,
-)
+from dask.dataframe.multi import _concat_wrapper, _merge_chunk_wrapper, _split_partition
 from dask.dataframe.shuffle import partitioning_index
 from dask.utils import apply, get_default_shuffle_method
 from toolz import merge_sorted, unique
@@ -34,6 +31,7 @@ from dask_expr._expr import (  # noqa: F401
 from dask_expr._repartition import Repartition
 from dask_expr._shuffle import (
     RearrangeByColumn,
+    _bucketed_by,
     _contains_index_name,
     _select_columns_or_index,
 )
@@ -100,7 +98,7 @@ class Merge(Expr):
             if predicate_columns is None:
                 return False
             if predicate_columns.issubset(self.left.columns):
-                return self.how in ("left", "inner", "leftsemi")
+                return self.how in ("left", "inner", "leftsemi", "leftanti")
             elif predicate_columns.issubset(self.right.columns):
                 return self.how in ("right", "inner")
             elif len(predicate_columns) > 0:
@@ -177,7 +175,7 @@ class Merge(Expr):
         left = meta_nonempty(self.left._meta)
         right = meta_nonempty(self.right._meta)
         kwargs = self.kwargs.copy()
-        if kwargs["how"] == "leftsemi":
+        if kwargs["how"] in ("leftsemi", "leftanti"):
             kwargs["how"] = "left"
         return make_meta(left.merge(right, **kwargs))
 
@@ -202,6 +200,11 @@ class Merge(Expr):
         return self.right
 
     def _divisions(self):
+        if self._range_join_side == "left":
+            return self.left._divisions()
+        elif self._range_join_side == "right":
+            return self.right._divisions()
+
         if self.merge_indexed_left and self.merge_indexed_right:
             divisions = list(
                 unique(merge_sorted(self.left.divisions, self.right.divisions))
@@ -228,7 +231,7 @@ class Merge(Expr):
             elif (
                 use_left
                 and self.right.npartitions == 1
-                and self.how in ("inner", "left", "leftsemi")
+                and self.how in ("inner", "left", "leftsemi", "leftanti")
             ):
                 return self.left.divisions
             else:
@@ -269,8 +272,10 @@ class Merge(Expr):
         s_method = self.shuffle_method or get_default_shuffle_method()
         if (
             s_method in ("tasks", "p2p")
-            and self.how in ("inner", "left", "right", "leftsemi")
+            and self.how in ("inner", "left", "right", "leftsemi", "leftanti")
             and self.how != broadcast_side
+            # Every left row has to see all of right to be excluded
+            and (self.how != "leftanti" or broadcast_side == "right")
             and broadcast is not False
         ):
             n_low = min(self.left.npartitions, self.right.npartitions)
@@ -287,7 +292,7 @@ class Merge(Expr):
             or self.left.npartitions == 1
             and self.how in ("right", "inner")
             or self.right.npartitions == 1
-            and self.how in ("left", "inner", "leftsemi")
+            and self.how in ("left", "inner", "leftsemi", "leftanti")
         )
 
     @functools.cached_property
@@ -314,6 +319,42 @@ class Merge(Expr):
             self.right_index or _contains_index_name(self.right, self.right_on)
         ) and self.right.known_divisions
 
+    @functools.cached_property
+    def _range_join_side(self):
+        """The side that drives a range join, None if not applicable
+
+        Merging on the index of two frames with known but different divisions
+        pairs every partition of one side with the partitions of the other side
+        that overlap its range. The result has the divisions of that side.
+        """
+        if not (self.merge_indexed_left and self.merge_indexed_right):
+            return None
+        if self._is_single_partition_broadcast or tuple(self.left.divisions) == tuple(
+            self.right.divisions
+        ):
+            return None
+        if self.how in ("left", "leftsemi", "leftanti"):
+            side = "left"
+        elif self.how == "right":
+            side = "right"
+        elif self.how == "inner":
+            side = "right" if self.right.npartitions > self.left.npartitions else "left"
+        else:
+            # Outer joins need every row of both sides exactly once
+            return None
+        # Don't reduce parallelism compared to repartitioning both sides
+        drive, other = (
+            (self.left, self.right) if side == "left" else (self.right, self.left)
+        )
+        if drive.npartitions < other.npartitions:
+            return None
+        return side
+
+    def _tune_down(self):
+        if type(self) is not Merge:
+            return
+        return _reorder_inner_joins(self)
+
     def _lower(self):
         # Lower from an abstract expression
         left = self.left
@@ -337,6 +378,18 @@ class Merge(Expr):
         # partition statistics are available, it may make sense
         # to drop support for left_index and right_index.
 
+        if self._range_join_side is not None:
+            return RangeJoin(left, right, **self.kwargs)
+
+        # Deduplicating right doesn't change its partitioning
+        left_bucketing, right_bucketing = _bucketed_by(left), _bucketed_by(right)
+
+        if self.how == "leftanti" and set(right.columns) == set(
+            _convert_to_list(right_on) or []
+        ):
+            # Only the distinct keys of right matter
+            right = DropDuplicatesBlockwise(right)
+
         shuffle_left_on = left_on
         shuffle_right_on = right_on
         if self.merge_indexed_left and self.merge_indexed_right:
@@ -391,10 +444,22 @@ class Merge(Expr):
                     self.indicator,
                 )
 
-        if (shuffle_left_on or shuffle_right_on) and (
-            shuffle_method == "p2p"
-            or shuffle_method is None
-            and get_default_shuffle_method() == "p2p"
+        if not (left_index or right_index) and (shuffle_left_on or shuffle_right_on):
+            bucketed = self._lower_bucketed(
+                left, right, left_bucketing, right_bucketing
+            )
+            if bucketed is not None:
+                return bucketed
+
+        if (
+            (shuffle_left_on or shuffle_right_on)
+            # The p2p merge can't express anti-joins
+            and self.how != "leftanti"
+            and (
+                shuffle_method == "p2p"
+                or shuffle_method is None
+                and get_default_shuffle_method() == "p2p"
+            )
         ):
             return HashJoinP2P(
                 left,
@@ -434,6 +499,41 @@ class Merge(Expr):
         # Blockwise merge
         return BlockwiseMerge(left, right, **self.kwargs)
 
+    def _lower_bucketed(self, left, right, left_bucketing, right_bucketing):
+        """Merge sides that are already hash-partitioned by the merge keys
+
+        Datasets that were written bucketed by the keys don't have to be
+        shuffled again. If only one side is bucketed, the other side is
+        shuffled into the same buckets, as long as that doesn't reduce its
+        number of partitions.
+        """
+        left_on = _convert_to_list(self.left_on)
+        right_on = _convert_to_list(self.right_on)
+        left_n = right_n = None
+        if left_bucketing is not None and left_bucketing[0] == left_on:
+            left_n = left_bucketing[1]
+        if right_bucketing is not None and right_bucketing[0] == right_on:
+            right_n = right_bucketing[1]
+        npartitions = self.operand("_npartitions")
+        if left_n is not None and left_n == right_n:
+            if npartitions is not None and npartitions != left_n:
+                return None
+        elif left_n is not None and right_n is None:
+            if left_n < (npartitions or right.npartitions):
+                return None
+            right = RearrangeByColumn(
+                right, right_on, npartitions_out=left_n, method=self.shuffle_method
+            )
+        elif right_n is not None and left_n is None:
+            if right_n < (npartitions or left.npartitions):
+                return None
+            left = RearrangeByColumn(
+                left, left_on, npartitions_out=right_n, method=self.shuffle_method
+            )
+        else:
+            return None
+        return BlockwiseMerge(left, right, **self.kwargs)
+
     def _simplify_up(self, parent, dependents):
         if isinstance(parent, Filter):
             if not self._filter_passthrough_available(parent, dependents):
@@ -465,6 +565,11 @@ class Merge(Expr):
                 ):
                     # column was renamed so the predicate must go into the other side
                     pass
+                elif self.how == "leftanti" and not predicate_cols.issubset(
+                    _convert_to_list(self.right_on) or []
+                ):
+                    # Filtering non-key columns of right would keep more rows
+                    pass
                 else:
                     right_filter = predicate.substitute(self, self.right)
                     new_right = self.right[right_filter]
@@ -745,7 +850,7 @@ class BroadcastJoin(Merge, PartitionsFiltered):
                 inter_key = (inter_name, part_out, j)
                 dsk[(inter_name, part_out, j)] = (
                     apply,
-                    _merge_chunk_wrapper,
+                    _merge_chunk,
                     _merge_args,
                     kwargs,
                 )
@@ -754,6 +859,124 @@ class BroadcastJoin(Merge, PartitionsFiltered):
         return dsk
 
 
+class RangeJoin(Merge, PartitionsFiltered):
+    """Merge two frames on their index with known but different divisions
+
+    Every partition of the driving side (see ``Merge._range_join_side``) is
+    merged with the concatenation of all partitions of the other side whose
+    division ranges overlap. Neither side is repartitioned.
+
+    See Also
+    --------
+    Merge
+    """
+
+    _parameters = [
+        "left",
+        "right",
+        "how",
+        "left_on",
+        "right_on",
+        "left_index",
+        "right_index",
+        "suffixes",
+        "indicator",
+        "_partitions",
+    ]
+    _defaults = {
+        "how": "inner",
+        "left_on": None,
+        "right_on": None,
+        "left_index": None,
+        "right_index": None,
+        "suffixes": ("_x", "_y"),
+        "indicator": False,
+        "_partitions": None,
+    }
+    is_broadcast_join = False
+
+    @functools.cached_property
+    def _range_join_side(self):
+        if self.how in ("left", "leftsemi", "leftanti"):
+            return "left"
+        elif self.how == "right":
+            return "right"
+        return "right" if self.right.npartitions > self.left.npartitions else "left"
+
+    def _simplify_up(self, parent, dependents):
+        return
+
+    def _lower(self):
+        return None
+
+    def _overlapping_partitions(self, index):
+        if self._range_join_side == "left":
+            divisions, other_divisions = self.left.divisions, self.right.divisions
+        else:
+            divisions, other_divisions = self.right.divisions, self.left.divisions
+        lower, upper = divisions[index], divisions[index + 1]
+        # Partitions ``j`` with other_divisions[j] <= upper and
+        # other_divisions[j + 1] >= lower, both sides are sorted
+        start = max(bisect.bisect_left(other_divisions, lower) - 1, 0)
+        stop = min(
+            bisect.bisect_right(other_divisions, upper), len(other_divisions) - 1
+        )
+        return list(range(start, stop))
+
+    def _layer(self) -> dict:
+        kwargs = {**self.kwargs, "result_meta": self._meta}
+        if self._range_join_side == "left":
+            drive, other = self.left, self.right
+        else:
+            drive, other = self.right, self.left
+        dsk = {}
+        for part_out in self._partitions:
+            dsk[(self._name, part_out)] = (
+                apply,
+                _range_merge_chunk,
+                [
+                    (drive._name, part_out),
+                    [(other._name, j) for j in self._overlapping_partitions(part_out)],
+                    other._meta,
+                    drive.divisions[part_out],
+                    drive.divisions[part_out + 1],
+                    self._range_join_side == "left",
+                ],
+                kwargs,
+            )
+        return dsk
+
+
+def _range_merge_chunk(drive, others, other_meta, lower, upper, drive_left, **kwargs):
+    if others:
+        other = _concat(others)
+        # Drop rows that can't match anything in ``drive``
+        other = other[(other.index >= lower) & (other.index <= upper)]
+    else:
+        other = other_meta
+    if drive_left:
+        return _merge_chunk(drive, other, **kwargs)
+    return _merge_chunk(other, drive, **kwargs)
+
+
+_ANTI_INDICATOR = "__anti_merge"
+
+
+def _merge_chunk(lhs, rhs, **kwargs):
+    """``merge_chunk`` that also understands ``how="leftanti"``"""
+    if kwargs.get("how") != "leftanti":
+        return _merge_chunk_wrapper(lhs, rhs, **kwargs)
+    result_meta = kwargs.pop("result_meta")
+    kwargs.update(how="left", indicator=_ANTI_INDICATOR)
+    out = lhs.merge(rhs.drop_duplicates(), **kwargs)
+    out = out[out[_ANTI_INDICATOR] == "left_only"].drop(columns=_ANTI_INDICATOR)
+    if len(lhs) == 0:
+        out = out[result_meta.columns]
+    if len(out) == 0:
+        out.index = out.index.astype(result_meta.index.dtype)
+    return out
+
+
 def create_assign_index_merge_transfer():
     import pandas as pd
     from distributed.shuffle._core import ShuffleId
@@ -835,7 +1058,7 @@ class BlockwiseMerge(Merge, Blockwise):
         kwargs["result_meta"] = self._meta
         return (
             apply,
-            merge_chunk,
+            _merge_chunk,
             [
                 self._blockwise_arg(self.left, index),
                 self._blockwise_arg(self.right, index),
@@ -894,3 +1117,175 @@ class JoinRecursive(Expr):
                 self._recursive_join(frames[midx:]),
             ],
         )
+
+
+###
+### Cost-based ordering of inner joins
+###
+
+# Fraction of rows that we assume to survive a single filter
+_FILTER_SELECTIVITY = 0.5
+
+
+def _estimate_selectivity(expr):
+    """Guess the fraction of rows that survive the filters below ``expr``
+
+    We walk down the chain of ``Blockwise`` operations that produce ``expr``
+    and apply ``_FILTER_SELECTIVITY`` for every ``Filter`` and for every
+    expression that absorbed predicates (e.g. ``ReadParquet(filters=...)``).
+    """
+    selectivity = 1.0
+    while True:
+        if isinstance(expr, Filter) or (
+            "filters" in expr._parameters and expr.operand("filters")
+        ):
+            selectivity *= _FILTER_SELECTIVITY
+        if not isinstance(expr, Blockwise) or not expr.dependencies():
+            return selectivity
+        expr = expr.dependencies()[0]
+
+
+def _estimate_join_size(sizes, selectivities):
+    """Estimated size of an inner join between several relations
+
+    We assume foreign-key joins, i.e. the result is as large as the
+    largest input, reduced by the filters applied to every input.
+    """
+    return max(sizes) * math.prod(selectivities)
+
+
+def _is_reorderable_join(expr):
+    if type(expr) is not Merge or expr.how != "inner":
+        return False
+    if expr.left_index or expr.right_index or expr.indicator:
+        return False
+    if expr.broadcast is not None or expr.operand("_npartitions") is not None:
+        return False
+    left_on = _convert_to_list(expr.left_on)
+    right_on = _convert_to_list(expr.right_on)
+    if not left_on or not right_on or len(left_on) != len(right_on):
+        return False
+    # Overlapping columns would be suffixed depending on the join order
+    shared_keys = {lo for lo, ro in zip(left_on, right_on) if lo == ro}
+    return set(expr.left.columns) & set(expr.right.columns) <= shared_keys
+
+
+def _collect_join_graph(expr, leaves, edges, shuffle_methods):
+    """Flatten a tree of inner merges into relations and join conditions
+
+    Returns the positions of the relations below ``expr`` in ``leaves`` or
+    None if the join tree can't be reordered.
+    """
+    if not _is_reorderable_join(expr):
+        leaves.append(expr)
+        return [len(leaves) - 1]
+
+    shuffle_methods.add(expr.shuffle_method)
+    left = _collect_join_graph(expr.left, leaves, edges, shuffle_methods)
+    right = _collect_join_graph(expr.right, leaves, edges, shuffle_methods)
+    if left is None or right is None:
+        return None
+
+    for lo, ro in zip(_convert_to_list(expr.left_on), _convert_to_list(expr.right_on)):
+        # Columns that were used as join keys with identical names show up in
+        # several relations; they are equivalent for an inner join
+        left_owners = [i for i in left if lo in leaves[i].columns]
+        right_owners = [i for i in right if ro in leaves[i].columns]
+        if not left_owners or not right_owners:
+            return None
+        for li in left_owners:
+            for ri in right_owners:
+                edges.append((li, lo, ri, ro))
+    return left + right
+
+
+def _join_keys(edges, members, other):
+    left_on, right_on = [], []
+    for li, lo, ri, ro in edges:
+        if li in members and ri == other:
+            pair = lo, ro
+        elif ri in members and li == other:
+            pair = ro, lo
+        else:
+            continue
+        if pair[0] not in left_on or pair[1] not in right_on:
+            left_on.append(pair[0])
+            right_on.append(pair[1])
+    return left_on, right_on
+
+
+def _reorder_inner_joins(expr):
+    """Reorder a tree of inner merges by estimated intermediate size
+
+    Relations are joined greedily: we start with the pair of relations
+    that produces the smallest estimated result and keep adding the
+    connected relation that keeps the intermediate result smallest.
+    Smaller relations are always added on the right side, which allows
+    ``Merge`` to broadcast them into the larger intermediate result.
+    Star-schema queries will join the most selective dimension tables
+    first and avoid large intermediate results.
+    """
+    leaves, edges, shuffle_methods = [], [], set()
+    if _collect_join_graph(expr, leaves, edges, shuffle_methods) is None:
+        return
+    if len(leaves) < 3 or len(shuffle_methods) > 1:
+        return
+
+    sizes = [leaf.npartitions for leaf in leaves]
+    selectivities = [_estimate_selectivity(leaf) for leaf in leaves]
+    estimates = [size * sel for size, sel in zip(sizes, selectivities)]
+
+    def cost(members):
+        return _estimate_join_size(
+            [sizes[i] for i in members], [selectivities[i] for i in members]
+        )
+
+    connected = {(li, ri) for li, _, ri, _ in edges}
+    connected |= {(ri, li) for li, ri in connected}
+    first, second = min(
+        (
+            (i, j)
+            for i in range(len(leaves))
+            for j in range(i + 1, len(leaves))
+            if (i, j) in connected
+        ),
+        key=lambda pair: (cost(pair), min(estimates[i] for i in pair), pair),
+    )
+    if estimates[second] > estimates[first]:
+        first, second = second, first
+
+    order = [first, second]
+    while len(order) < len(leaves):
+        candidates = [
+            i
+            for i in range(len(leaves))
+            if i not in order and any((i, j) in connected for j in order)
+        ]
+        if not candidates:
+            # Would require a cross join
+            return
+        order.append(
+            min(candidates, key=lambda i: (cost(order + [i]), estimates[i], i))
+        )
+
+    (shuffle_method,) = shuffle_methods
+    result = leaves[order[0]]
+    for i, other in enumerate(order[1:], start=1):
+        left_on, right_on = _join_keys(edges, order[:i], other)
+        shared_keys = {lo for lo, ro in zip(left_on, right_on) if lo == ro}
+        if set(result.columns) & set(leaves[other].columns) - shared_keys:
+            return
+        result = Merge(
+            result,
+            leaves[other],
+            how="inner",
+            left_on=left_on,
+            right_on=right_on,
+            shuffle_method=shuffle_method,
+        )
+
+    if result._name == expr._name or set(result.columns) != set(expr.columns):
+        return
+    if result.columns != expr.columns:
+        result = Projection(result, expr.columns)
+    return result
@@ -8,9 +8,10 @@ from dask.dataframe.utils import pyarrow_strings_enabled
 from dask.utils import apply
 
 from dask_expr import SetIndexBlockwise, new_collection
-from dask_expr._expr import MapPartitions, RenameAxis, ResetIndex
+from dask_expr._expr import Blockwise, MapPartitions, RenameAxis, ResetIndex
 from dask_expr._merge import Merge
-from dask_expr._util import _BackendData
+from dask_expr._shuffle import RearrangeByColumn
+from dask_expr._util import _BackendData, _convert_to_list
 from dask_expr.io import FromPandas
 
 
@@ -28,6 +29,7 @@ class MergeAsof(Merge):
         "tolerance",
         "allow_exact_matches",
         "direction",
+        "shuffle_by_key",
     ]
     _defaults = {
         "left_on": None,
@@ -40,6 +42,7 @@ class MergeAsof(Merge):
         "tolerance": None,
         "allow_exact_matches": True,
         "direction": "backward",
+        "shuffle_by_key": False,
     }
 
     @functools.cached_property
@@ -66,7 +69,30 @@ class MergeAsof(Merge):
             return new_collection(left).set_index(self.left_on, sorted=True)
         return left
 
+    @functools.cached_property
+    def _shuffle_by_key(self):
+        """Whether to hash-partition both sides by the ``by`` keys
+
+        Every group then lives in a single partition on both sides and
+        ``merge_asof`` can run independently per partition, without
+        requiring a global order of the inputs. The output is not ordered by
+        the merge key and has unknown divisions, so this is opt-in through
+        ``shuffle_by_key``. Merges on the index with known divisions on both
+        sides keep the ordered merge.
+        """
+        if (
+            not self.operand("shuffle_by_key")
+            or self.left_by is None
+            or self.right_by is None
+        ):
+            return False
+        if self.left_index and self.right_index:
+            return not (self.left.known_divisions and self.right.known_divisions)
+        return self.left_on is not None and self.right_on is not None
+
     def _divisions(self):
+        if self._shuffle_by_key:
+            return (None,) * (self.left.npartitions + 1)
         if (self.left_on or self.right_on) and (
             not self.right_index or not self.left.known_divisions
         ):
@@ -86,6 +112,16 @@ class MergeAsof(Merge):
         )
 
     def _lower(self):
+        if self._shuffle_by_key:
+            npartitions = self.left.npartitions
+            left = RearrangeByColumn(
+                self.left, _convert_to_list(self.left_by), npartitions
+            )
+            right = RearrangeByColumn(
+                self.right, _convert_to_list(self.right_by), npartitions
+            )
+            return MergeAsofByKey(left, right, self._kwargs)
+
         left = self._left
         right = self.right
         left_on = self.left_on
@@ -241,6 +277,47 @@ class MergeAsofIndexed(MergeAsof):
         return dsk
 
 
+def _merge_asof_sorted(left, right, **kwargs):
+    if kwargs["left_index"]:
+        left = left.sort_index(kind="stable")
+    else:
+        left = left.sort_values(kwargs["left_on"], kind="stable")
+    if kwargs["right_index"]:
+        right = right.sort_index(kind="stable")
+    else:
+        right = right.sort_values(kwargs["right_on"], kind="stable")
+    return pd.merge_asof(left, right, **kwargs)
+
+
+class MergeAsofByKey(Blockwise):
+    """Merge partitions that were hash-partitioned by the ``by`` keys
+
+    Both sides are sorted by the merge key within every partition before
+    calling ``merge_asof``.
+    """
+
+    _parameters = ["left", "right", "kwargs"]
+    operation = staticmethod(_merge_asof_sorted)
+
+    @functools.cached_property
+    def _meta(self):
+        return make_meta(
+            pd.merge_asof(
+                meta_nonempty(self.left._meta),
+                meta_nonempty(self.right._meta),
+                **self.operand("kwargs"),
+            )
+        )
+
+    @functools.cached_property
+    def _args(self) -> list:
+        return [self.left, self.right]
+
+    @functools.cached_property
+    def _kwargs(self) -> dict:
+        return self.operand("kwargs")
+
+
 def most_recent_tail(left, right):
     if len(right.index) == 0:
         return left
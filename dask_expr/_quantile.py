@@ -1,10 +1,18 @@
 import functools
 
 import numpy as np
+from dask import config
 from dask.dataframe.dispatch import make_meta, meta_nonempty
 from dask.utils import import_required, is_series_like
 
 from dask_expr._expr import DropnaSeries, Expr
+from dask_expr._reductions import Reduction
+from dask_expr._sketch import (
+    DEFAULT_SKETCH_SIZE,
+    create_sketch,
+    merge_sketches,
+    sketch_quantiles,
+)
 
 
 def _finalize_scalar_result(cons, *args, **kwargs):
@@ -64,6 +72,12 @@ class SeriesQuantile(Expr):
             return lambda tsk: (_finalize_scalar_result, self._constructor, tsk, [0])
 
     def _lower(self):
+        if self.method == "sketch" and _sketch_supported(self.frame._meta.dtype):
+            return SeriesQuantileSketch(
+                self.frame,
+                self.operand("q"),
+                config.get("dataframe.quantile.sketch-size", DEFAULT_SKETCH_SIZE),
+            )
         frame = DropnaSeries(self.frame)
         if self.method == "tdigest":
             return SeriesQuantileTdigest(
@@ -131,3 +145,64 @@ class SeriesQuantileDask(SeriesQuantile):
 
     def _lower(self):
         return None
+
+
+def _sketch_supported(dtype):
+    return isinstance(dtype, np.dtype) and dtype.kind in "iuf"
+
+
+class SeriesQuantileSketch(Reduction):
+    """Approximate quantiles from a tree reduction of quantile sketches
+
+    See ``dask_expr._sketch`` for the sketch and its error bounds.
+    """
+
+    _parameters = ["frame", "q", "sketch_size", "split_every"]
+    _defaults = {"sketch_size": DEFAULT_SKETCH_SIZE, "split_every": None}
+
+    @functools.cached_property
+    def _quantile(self):
+        return SeriesQuantile(self.frame, self.operand("q"))
+
+    @functools.cached_property
+    def _meta(self):
+        return self._quantile._meta
+
+    def _divisions(self):
+        return self._quantile._divisions()
+
+    @classmethod
+    def chunk(cls, df, k):
+        return create_sketch(df, k)
+
+    @classmethod
+    def combine(cls, inputs, k):
+        return merge_sketches(inputs, k)
+
+    @classmethod
+    def aggregate(cls, inputs, k, q, constructor, name):
+        quantiles = sketch_quantiles(merge_sketches(inputs, k), q)
+        if constructor is None:
+            return quantiles[0]
+        return constructor(quantiles, q, None, name)
+
+    @property
+    def chunk_kwargs(self):
+        return {"k": self.sketch_size}
+
+    @property
+    def combine_kwargs(self):
+        return self.chunk_kwargs
+
+    @property
+    def aggregate_kwargs(self):
+        is_series = is_series_like(self._meta)
+        return {
+            "k": self.sketch_size,
+            "q": self._quantile.q,
+            "constructor": self._quantile._constructor if is_series else None,
+            "name": self.frame._meta.name,
+        }
+
+    def _simplify_up(self, parent, dependents):
+        return
@@ -2,6 +2,7 @@ import functools
 
 import numpy as np
 import toolz
+from dask import config
 from dask.base import tokenize
 from dask.dataframe.partitionquantiles import (
     create_merge_tree,
@@ -13,11 +14,46 @@ from dask.dataframe.partitionquantiles import (
 from dask.utils import random_state_data
 
 from dask_expr._expr import Expr
+from dask_expr._sketch import (
+    DEFAULT_SKETCH_SIZE,
+    create_sketch,
+    merge_sketches,
+    sketch_quantiles,
+)
+
+
+def configured_sketch_size() -> int:
+    """The sketch size set by the ``dataframe.quantile.sketch-size`` config"""
+    return config.get("dataframe.quantile.sketch-size", None) or DEFAULT_SKETCH_SIZE
+
+
+def _sketch_divisions(sketch, qs, dtype):
+    divisions = sketch_quantiles(sketch, qs)
+    if dtype.kind in "iumM":
+        if np.isnan(divisions).any():
+            # No data
+            return divisions
+        divisions = np.round(divisions).astype("i8")
+        if dtype.kind in "mM":
+            return divisions.view(dtype)
+    return divisions.astype(dtype)
 
 
 class RepartitionQuantiles(Expr):
-    _parameters = ["frame", "input_npartitions", "upsample", "random_state"]
-    _defaults = {"upsample": 1.0, "random_state": None}
+    _parameters = [
+        "frame",
+        "input_npartitions",
+        "upsample",
+        "random_state",
+        "method",
+        "sketch_size",
+    ]
+    _defaults = {
+        "upsample": 1.0,
+        "random_state": None,
+        "method": "default",
+        "sketch_size": DEFAULT_SKETCH_SIZE,
+    }
 
     @functools.cached_property
     def _meta(self):
@@ -37,6 +73,10 @@ class RepartitionQuantiles(Expr):
         import pandas as pd
 
         qs = np.linspace(0, 1, self.input_npartitions + 1)
+        dtype = self.frame._meta.dtype
+        if self.method == "sketch" and isinstance(dtype, np.dtype):
+            if dtype.kind in "iufmM":
+                return self._sketch_layer(qs, dtype)
         if self.random_state is None:
             random_state = int(tokenize(self.operands), 16) % np.iinfo(np.int32).max
         else:
@@ -86,3 +126,26 @@ class RepartitionQuantiles(Expr):
             )
         }
         return {**dtype_dsk, **percentiles_dsk, **merge_dsk, **last_dsk}
+
+    def _sketch_layer(self, qs, dtype):
+        import pandas as pd
+
+        k = self.sketch_size
+        keys = self.frame.__dask_keys__()
+        sketch_dsk = {
+            (self._name, 1, i): (create_sketch, key, k) for i, key in enumerate(keys)
+        }
+        merge_dsk = create_merge_tree(
+            functools.partial(merge_sketches, k=k), sorted(sketch_dsk), self._name, 2
+        )
+        merged_key = max(merge_dsk) if merge_dsk else (self._name, 1, 0)
+        last_dsk = {
+            (self._name, 0): (
+                pd.Series,
+                (_sketch_divisions, merged_key, qs, dtype),
+                qs,
+                None,
+                self.frame._meta.name,
+            )
+        }
+        return {**sketch_dsk, **merge_dsk, **last_dsk}
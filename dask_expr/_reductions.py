@@ -1,4 +1,5 @@
 import functools
+import operator
 from typing import Callable
 
 import numpy as np
@@ -24,6 +25,7 @@ from dask.dataframe.core import (
     meta_nonempty,
     total_mem_usage,
 )
+from dask.dataframe.utils import has_known_categories
 from dask.typing import no_default
 from dask.utils import M, apply, funcname
 
@@ -32,6 +34,7 @@ from dask_expr._expr import (
     Blockwise,
     Expr,
     Index,
+    Literal,
     Projection,
     RenameFrame,
     RenameSeries,
@@ -375,6 +378,128 @@ class TreeReduce(Expr):
         return lines
 
 
+class FusedReduction:
+    """Chunk, combine and aggregate functions of several tree reductions
+
+    Each reduction is described by a spec tuple. The chunk specs also hold
+    the columns that the reduction selects from the shared frame (or None).
+    Intermediate results are tuples with one element per reduction. Specs
+    are passed as tuples (not lists), so they are not traversed as tasks.
+
+    See Also
+    --------
+    fuse_reductions
+    """
+
+    @classmethod
+    def chunk(cls, df, specs):
+        return tuple(
+            func(df if columns is None else df[columns], **kwargs)
+            for columns, func, kwargs in specs
+        )
+
+    @classmethod
+    def combine(cls, inputs, specs):
+        return tuple(
+            func([x[i] for x in inputs], **kwargs)
+            for i, (func, kwargs) in enumerate(specs)
+        )
+
+    aggregate = combine
+
+
+class FusedChunk(Chunk):
+    """Partition-wise component of `FusedReduction`"""
+
+    def _tree_repr_lines(self, indent=0, recursive=True):
+        kinds = [
+            funcname(getattr(func, "__self__", func))
+            for _, func, _ in self.chunk_kwargs["specs"]
+        ]
+        header = f"{funcname(self.kind)}({funcname(type(self))}): {', '.join(kinds)}"
+        lines = []
+        if recursive:
+            for dep in self.dependencies():
+                lines.extend(dep._tree_repr_lines(2))
+        lines = [header] + lines
+        return [" " * indent + line for line in lines]
+
+
+class FusedReductionOutput(Expr):
+    """Select the result of a single reduction from a fused tree reduction"""
+
+    _parameters = ["frame", "position", "_meta"]
+
+    @property
+    def _meta(self):
+        return self.operand("_meta")
+
+    def _divisions(self):
+        return (None, None)
+
+    def __dask_postcompute__(self):
+        return toolz.first, ()
+
+    def _layer(self):
+        return {
+            (self._name, 0): (operator.getitem, (self.frame._name, 0), self.position)
+        }
+
+
+def _shared_frame(frame):
+    if isinstance(frame, Projection):
+        return frame.frame, frame.operand("columns")
+    return frame, None
+
+
+def fuse_reductions(expr):
+    """Fuse tree reductions that scan the same frame
+
+    Independent ``TreeReduce`` nodes over ``Chunk`` nodes of the same frame
+    (or column projections of it) each read all partitions of that frame.
+    They are replaced with a single tree that applies all chunk, combine and
+    aggregate functions at once, so every partition is read a single time.
+    """
+    while True:
+        groups = {}
+        for e in expr.walk():
+            if type(e) is TreeReduce and type(e.frame) is Chunk:
+                frame, _ = _shared_frame(e.frame.frame)
+                key = frame._name, e.split_every
+                groups.setdefault(key, {})[e._name] = e
+        trees = next((list(g.values()) for g in groups.values() if len(g) > 1), None)
+        if trees is None:
+            return expr
+
+        # Substituting the fused tree renames all dependents, so fuse one
+        # group at a time
+        frame, _ = _shared_frame(trees[0].frame.frame)
+        chunk_specs, combine_specs, aggregate_specs = [], [], []
+        for tree in trees:
+            _, columns = _shared_frame(tree.frame.frame)
+            chunked = tree.frame
+            chunk_specs.append((columns, chunked.chunk, chunked._kwargs))
+            combine_specs.append((tree.combine, tree.combine_kwargs or {}))
+            aggregate_specs.append((tree.aggregate, tree.aggregate_kwargs or {}))
+        fused = TreeReduce(
+            FusedChunk(
+                frame,
+                FusedReduction,
+                FusedReduction.chunk,
+                {"specs": tuple(chunk_specs)},
+            ),
+            FusedReduction,
+            tuple(tree._meta for tree in trees),
+            FusedReduction.combine,
+            FusedReduction.aggregate,
+            {"specs": tuple(combine_specs)},
+            {"specs": tuple(aggregate_specs)},
+            split_every=trees[0].operand("split_every"),
+        )
+        for i, tree in enumerate(trees):
+            expr = expr.substitute(tree, FusedReductionOutput(fused, i, tree._meta))
+
+
 class ApplyConcatApply(Expr):
     """Perform reduction-like operation on dataframes
 
@@ -479,6 +604,11 @@ class ApplyConcatApply(Expr):
         chunked = self._chunk_cls(
             self.frame, type(self), chunk, chunk_kwargs, *self._chunk_cls_args
         )
+        if getattr(self, "_groups_are_partition_local", False):
+            # Lower into Aggregate(Chunk)
+            return Aggregate(
+                chunked, type(self), aggregate, aggregate_kwargs, *self.aggregate_args
+            )
         if not self.should_shuffle:
             # Lower into TreeReduce(Chunk)
             return TreeReduce(
@@ -867,6 +997,23 @@ class Prod(Sum):
     reduction_chunk = M.prod
 
 
+def _reduction_from_metadata(expr):
+    """Let an IO expression answer a reduction of a column from its metadata"""
+    from dask_expr.io.io import IO
+
+    frame = expr.frame
+    if not is_series_like(frame._meta):
+        return
+    if isinstance(frame, Projection) and isinstance(frame.frame, IO):
+        value = frame.frame._reduction_from_metadata(expr, frame.operand("columns"))
+    elif isinstance(frame, IO):
+        value = frame._reduction_from_metadata(expr, frame._meta.name)
+    else:
+        return
+    if value is not None:
+        return Literal(value)
+
+
 class Max(Reduction):
     _parameters = ["frame", "skipna", "numeric_only", "split_every", "axis"]
     _defaults = {
@@ -894,6 +1041,9 @@ class Max(Reduction):
     def aggregate_kwargs(self):
         return dict(skipna=self.skipna, axis=self.axis)
 
+    def _simplify_down(self):
+        return _reduction_from_metadata(self)
+
 
 class Min(Max):
     reduction_chunk = M.min
@@ -1204,6 +1354,9 @@ class Count(Reduction):
         else:
             return dict(numeric_only=self.numeric_only)
 
+    def _simplify_down(self):
+        return _reduction_from_metadata(self)
+
 
 class IndexCount(Reduction):
     _parameters = ["frame", "split_every"]
@@ -1366,8 +1519,40 @@ class ValueCounts(ReductionConstantDim):
     def _meta(self):
         return self.frame._meta.value_counts(normalize=self.normalize)
 
+    @functools.cached_property
+    def _dense(self):
+        # Categoricals with known categories are counted by their codes
+        meta = self.frame._meta
+        return (
+            isinstance(meta.dtype, pd.CategoricalDtype)
+            and has_known_categories(meta)
+            and self.split_out == 1
+            and self.split_out is not True
+        )
+
     @classmethod
-    def aggregate(cls, inputs, **kwargs):
+    def chunk(cls, df, dense=None, **kwargs):
+        if dense is not None:
+            # Missing values are counted first
+            codes = df.cat.codes.to_numpy().astype(np.intp) + 1
+            return np.bincount(codes, minlength=len(dense.cat.categories) + 1)
+        return super().chunk(df, **kwargs)
+
+    @classmethod
+    def combine(cls, inputs, dense=None, **kwargs):
+        if dense is not None:
+            return sum(inputs)
+        return super().combine(inputs, **kwargs)
+
+    @classmethod
+    def aggregate(cls, inputs, dense=None, **kwargs):
+        if dense is not None:
+            counts = sum(inputs)
+            codes = np.arange(-1, len(counts) - 1)
+            keep = slice(0 if counts[0] else 1, None)
+            categories = pd.Categorical.from_codes(codes[keep], dtype=dense.dtype)
+            index = pd.CategoricalIndex(categories, name=dense.name)
+            inputs = [pd.Series(counts[keep], index=index, name="count")]
         func = cls.reduction_aggregate or cls.reduction_chunk
         if is_scalar(inputs[-1]):
             return func(_concat(inputs[:-1]), inputs[-1], **kwargs)
@@ -1380,7 +1565,12 @@ class ValueCounts(ReductionConstantDim):
 
     @property
     def chunk_kwargs(self):
-        return {"sort": self.sort, "ascending": self.ascending, "dropna": self.dropna}
+        return {
+            "sort": self.sort,
+            "ascending": self.ascending,
+            "dropna": self.dropna,
+            **({"dense": self.frame._meta} if self._dense else {}),
+        }
 
     @property
     def aggregate_args(self):
@@ -1,7 +1,10 @@
+import bisect
 import functools
 from collections import namedtuple
 
 import numpy as np
+import pandas as pd
+from dask.dataframe import methods
 from dask.dataframe.dispatch import meta_nonempty
 from dask.dataframe.tseries.resample import _resample_bin_and_out_divs, _resample_series
 from dask.utils import derived_from
@@ -19,6 +22,60 @@ from dask_expr._repartition import Repartition
 
 BlockwiseDep = namedtuple(typename="BlockwiseDep", field_names=["iterable"])
 
+# How the bins that partitions resampled on their own are combined
+_PARTIAL_AGGREGATIONS = {
+    "count": "sum",
+    "size": "sum",
+    "sum": "sum",
+    "min": "min",
+    "max": "max",
+    "first": "first",
+    "last": "last",
+    "mean": "sum",
+}
+
+
+def _resample_chunk(df, rule, kwargs, how):
+    resample = df.resample(rule, **kwargs)
+    if how == "mean":
+        return resample.sum(), resample.count()
+    return getattr(resample, how)()
+
+
+def _combine_bins(chunks, how):
+    if len(chunks) == 1:
+        return chunks[0]
+    # Bins that straddle partitions show up in several chunks
+    return getattr(methods.concat(chunks).groupby(level=0), how)()
+
+
+def _resample_combine(chunks, start, end, reindex_closed, rule, how, fill_value):
+    if how == "mean":
+        out = _combine_bins([chunk[0] for chunk in chunks], "sum") / _combine_bins(
+            [chunk[1] for chunk in chunks], "sum"
+        )
+    else:
+        out = _combine_bins(chunks, _PARTIAL_AGGREGATIONS[how])
+
+    new_index = pd.date_range(
+        start.tz_localize(None),
+        end.tz_localize(None),
+        freq=rule,
+        inclusive="both" if reindex_closed is None else reindex_closed,
+        name=out.index.name,
+    ).tz_localize(start.tz, nonexistent="shift_forward")
+
+    # Chunks may hold bins of neighbouring output partitions as well
+    below_end = out.index <= end if reindex_closed is None else out.index < end
+    within = out.index[(out.index >= start) & below_end]
+    if not within.isin(new_index).all():
+        raise ValueError(
+            "Index is not contained within new index. This can often be "
+            "resolved by using larger partitions, or unambiguous "
+            "frequencies: 'Q', 'A'..."
+        )
+    return out.reindex(new_index, fill_value=fill_value)
+
 
 class ResampleReduction(Expr):
     _parameters = [
@@ -69,7 +126,27 @@ class ResampleReduction(Expr):
         if isinstance(parent, Projection):
             return plain_column_projection(self, parent, dependents)
 
+    @property
+    def _use_partial_aggregates(self):
+        if self.how not in _PARTIAL_AGGREGATIONS or self.how_args or self.how_kwargs:
+            return False
+        if self.how in ("sum", "mean"):
+            meta = self.frame._meta
+            dtypes = [meta.dtype] if meta.ndim == 1 else meta.dtypes
+            return all(dtype.kind in "iufb" for dtype in dtypes)
+        return True
+
     def _lower(self):
+        if self._use_partial_aggregates:
+            return ResamplePartialAggregation(
+                self.frame,
+                self.rule,
+                self.kwargs,
+                self.how,
+                self.fill_value,
+                self._resample_divisions,
+            )
+
         partitioned = Repartition(
             self.frame, new_divisions=self._resample_divisions[0], force=True
         )
@@ -113,6 +190,66 @@ class ResampleAggregation(Blockwise):
         return super()._blockwise_arg(arg, i)
 
 
+class ResamplePartialAggregation(Expr):
+    """Resample every partition on its own and combine the bins
+
+    Partitions are resampled into partial aggregates locally, so that only
+    the bins move between workers instead of the raw rows. Bins that
+    straddle partition boundaries are combined when assembling the output
+    partitions.
+    """
+
+    _parameters = ["frame", "rule", "kwargs", "how", "fill_value", "resample_divisions"]
+
+    @functools.cached_property
+    def _meta(self):
+        resample = meta_nonempty(self.frame._meta).resample(self.rule, **self.kwargs)
+        return make_meta(getattr(resample, self.how)())
+
+    def _divisions(self):
+        return self.resample_divisions[1]
+
+    @functools.cached_property
+    def _chunk_kwargs(self):
+        # Bins start at midnight of the first day of the whole frame, not at
+        # the first day of every partition
+        return {"origin": self.frame.divisions[0].normalize(), **self.kwargs}
+
+    def _layer(self) -> dict:
+        dsk = {}
+        name_chunk = "resample-chunk-" + self._name
+        for k in range(self.frame.npartitions):
+            dsk[(name_chunk, k)] = (
+                _resample_chunk,
+                (self.frame._name, k),
+                self.rule,
+                self._chunk_kwargs,
+                self.how,
+            )
+
+        divisions = self.frame.divisions
+        bin_divisions, output_divisions = self.resample_divisions
+        last = len(output_divisions) - 2
+        for i in range(last + 1):
+            # Partitions that hold rows of this output partition
+            first = bisect.bisect_right(divisions, bin_divisions[i]) - 1
+            first = min(max(first, 0), self.frame.npartitions - 1)
+            stop = bisect.bisect_left(
+                divisions, bin_divisions[i + 1], 0, self.frame.npartitions
+            )
+            dsk[(self._name, i)] = (
+                _resample_combine,
+                [(name_chunk, k) for k in range(first, max(stop, first + 1))],
+                output_divisions[i],
+                output_divisions[i + 1],
+                "left" if i < last else None,
+                self.rule,
+                self.how,
+                self.fill_value,
+            )
+        return dsk
+
+
 class ResampleCount(ResampleReduction):
     how = "count"
     fill_value = 0
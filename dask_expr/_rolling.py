@@ -1,7 +1,9 @@
+import bisect
 import functools
 from collections import namedtuple
 from numbers import Integral
 
+import numpy as np
 import pandas as pd
 from dask.utils import derived_from
 from pandas.core.window import Rolling as pd_Rolling
@@ -40,6 +42,139 @@ def _rolling_agg(
     return result
 
 
+# Rolling aggregations whose windows decompose into partial aggregates of
+# their pieces, see ``RollingBoundaryAggregation``
+_BOUNDARY_AGGREGATIONS = ("count", "sum", "mean", "var", "std", "min", "max")
+
+
+def _as_2d_float(frame):
+    values = frame.to_numpy(dtype="f8", na_value=np.nan)
+    return values[:, None] if values.ndim == 1 else values
+
+
+def _center(values):
+    # Centering the values keeps sums of squares accurate
+    counts = (~np.isnan(values)).sum(axis=0)
+    return np.where(counts, np.nansum(values, axis=0) / np.maximum(counts, 1), 0)
+
+
+def _cumulative_partials(values, how, shift):
+    valid = ~np.isnan(values)
+    partials = {"count": valid.cumsum(axis=0)}
+    if how == "count":
+        # ``count`` checks ``min_periods`` against the number of rows
+        partials["size"] = np.arange(1, len(values) + 1)[:, None]
+    elif how in ("min", "max"):
+        partials[how] = getattr(np, "f" + how).accumulate(values, axis=0)
+    else:
+        centered = np.where(valid, values - shift, 0)
+        partials["sum"] = centered.cumsum(axis=0)
+        if how in ("var", "std"):
+            partials["sumsq"] = (centered**2).cumsum(axis=0)
+    return partials
+
+
+def _rolling_boundary_state(frame, how, bound):
+    """Partial aggregates of every suffix of the rows after ``bound``"""
+    start = frame.index.searchsorted(bound, side="right")
+    tail = _as_2d_float(frame.iloc[start:])
+    shift = _center(tail) if how in ("var", "std") else 0
+    partials = {
+        key: value[::-1]
+        for key, value in _cumulative_partials(tail[::-1], how, shift).items()
+    }
+    # Windows start between distinct timestamps, so one row per timestamp
+    # is enough
+    index = frame.index[start:]
+    first = np.ones(len(index), dtype=bool)
+    first[1:] = index[1:] != index[:-1]
+    partials = {key: value[first] for key, value in partials.items()}
+    return index[first], partials, shift
+
+
+def _rolling_boundary_total(state):
+    """Partial aggregates of all rows of a state"""
+    index, partials, shift = state
+    if not len(index):
+        return None
+    return None, {key: value[:1] for key, value in partials.items()}, shift
+
+
+def _rolling_boundary_aggregate(frame, states, window, how, kwargs, division):
+    result = _rolling_agg(frame, window, kwargs, how, (), None)
+    states = [state for state in states if state is not None]
+    min_periods = kwargs.get("min_periods")
+    min_periods = 1 if min_periods is None else min_periods
+    # Starts of the windows that reach into earlier partitions
+    starts = frame.index[: frame.index.searchsorted(division + window)] - window
+    positions = []
+    for index, _, _ in states:
+        if index is None:
+            # Earlier partitions that lie within all of the windows
+            positions.append((len(starts), slice(None)))
+        else:
+            found = index.searchsorted(starts, side="right")
+            # Windows that start after the last row pick up nothing
+            found = found[: found.searchsorted(len(index))]
+            positions.append((len(found), found))
+    nrows = max((length for length, _ in positions), default=0)
+    if not nrows:
+        return result
+
+    # Partial aggregates of the leading rows within this partition, plus
+    # those that their windows pick up from earlier partitions
+    values = _as_2d_float(frame.iloc[:nrows])
+    shift = 0
+    if how in ("var", "std"):
+        shift = _center(values)
+        missing = np.isnan(values).all(axis=0)
+        for _, state, state_shift in reversed(states):
+            # Columns without values here take the closest earlier center
+            fill = missing & (state["count"][0] > 0)
+            shift = np.where(fill, state_shift, shift)
+            missing &= ~fill
+    partials = _cumulative_partials(values, how, shift)
+    for (_, state, state_shift), (length, found) in zip(states, positions):
+        head = slice(0, length)
+        if how in ("min", "max"):
+            combine = getattr(np, "f" + how)
+            partials[how][head] = combine(partials[how][head], state[how][found])
+        elif how in ("var", "std"):
+            # Move the sums over to this partition's center
+            offset = state_shift - shift
+            count, total = state["count"][found], state["sum"][found]
+            partials["sumsq"][head] += (
+                state["sumsq"][found] + 2 * offset * total + count * offset**2
+            )
+            partials["sum"][head] += total + count * offset
+        elif how != "count":
+            partials["sum"][head] += state["sum"][found]
+        else:
+            partials["size"][head] += state["size"][found]
+        partials["count"][head] += state["count"][found]
+
+    count = partials["count"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if how == "count":
+            out = count.astype("f8")
+            count = partials["size"]
+        elif how == "sum":
+            out = partials["sum"]
+        elif how == "mean":
+            out = partials["sum"] / count
+        elif how in ("var", "std"):
+            total = partials["sum"]
+            out = (partials["sumsq"] - total**2 / count) / (count - 1)
+            out = np.where(count > 1, np.maximum(out, 0), np.nan)
+            if how == "std":
+                out = np.sqrt(out)
+        else:
+            out = partials[how]
+    out = np.where(count >= min_periods, out, np.nan)
+    result.iloc[:nrows] = out if result.ndim == 2 else out[:, 0]
+    return result
+
+
 class RollingReduction(Expr):
     _parameters = [
         "frame",
@@ -109,6 +244,28 @@ class RollingReduction(Expr):
             or self.frame.npartitions == 1
         )
 
+    @property
+    def _use_boundary_aggregates(self):
+        if (
+            self.how not in _BOUNDARY_AGGREGATIONS
+            or self.how_args
+            or self.how_kwargs
+            or self.groupby_kwargs is not None
+            or self.kwargs.get("center")
+            or self.kwargs.get("win_type") is not None
+        ):
+            return False
+        if isinstance(self.window, Integral) or not self.frame.known_divisions:
+            return False
+        # Only worth it if windows reach past the previous partition, plain
+        # overlapping partitions are cheaper otherwise
+        divisions = pd.Series(self.frame.divisions)
+        if not (pd.Timedelta(self.window) > divisions.diff().iloc[1:-1]).any():
+            return False
+        meta = self.frame._meta
+        dtypes = [meta.dtype] if meta.ndim == 1 else meta.dtypes
+        return all(dtype.kind in "iuf" for dtype in dtypes)
+
     def _lower(self):
         if self._is_blockwise_op:
             return RollingAggregation(
@@ -122,6 +279,11 @@ class RollingReduction(Expr):
                 groupby_slice=self.groupby_slice,
             )
 
+        if self._use_boundary_aggregates:
+            return RollingBoundaryAggregation(
+                self.frame, pd.Timedelta(self.window), self.how, self.kwargs
+            )
+
         if self.kwargs.get("center"):
             before = self.window // 2
             after = self.window - before - 1
@@ -170,6 +332,70 @@ class RollingAggregation(Blockwise):
         return self.frame._meta
 
 
+class RollingBoundaryAggregation(Expr):
+    """Time-based rolling aggregation over windows that span partitions
+
+    Instead of copying all rows that a window reaches into from earlier
+    partitions, every partition sends the partial aggregates (count, sum,
+    sum of squares or min/max) of the suffixes of those rows. Partitions
+    that lie within all windows of a later partition only send their totals.
+    The windows at the start of a partition then combine these with their
+    own partial aggregates, everything else is computed locally.
+    """
+
+    _parameters = ["frame", "window", "how", "kwargs"]
+
+    @functools.cached_property
+    def _meta(self):
+        meta = _rolling_agg(
+            self.frame._meta, self.window, self.kwargs, self.how, (), None
+        )
+        return make_meta(meta)
+
+    def _divisions(self):
+        return self.frame.divisions
+
+    def _layer(self) -> dict:
+        dsk = {}
+        window, divisions = self.window, self.frame.divisions
+        name_state = "rolling-state-" + self._name
+        for k in range(self.frame.npartitions - 1):
+            dsk[(name_state, k)] = (
+                _rolling_boundary_state,
+                (self.frame._name, k),
+                self.how,
+                divisions[k + 1] - window,
+            )
+
+        name_total = "rolling-total-" + self._name
+        for i in range(self.frame.npartitions):
+            # All earlier partitions that hold rows within the windows
+            first = bisect.bisect_right(divisions, divisions[i] - window) - 1
+            states = []
+            for k in range(max(first, 0), i):
+                if divisions[k] > divisions[i + 1] - window:
+                    # Lies within the windows of all rows, so its totals are
+                    # all we need
+                    if (name_total, k) not in dsk:
+                        dsk[(name_total, k)] = (
+                            _rolling_boundary_total,
+                            (name_state, k),
+                        )
+                    states.append((name_total, k))
+                else:
+                    states.append((name_state, k))
+            dsk[(self._name, i)] = (
+                _rolling_boundary_aggregate,
+                (self.frame._name, i),
+                states,
+                window,
+                self.how,
+                self.kwargs,
+                divisions[i],
+            )
+        return dsk
+
+
 class RollingCount(RollingReduction):
     how = "count"
 
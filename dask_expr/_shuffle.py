@@ -5,6 +5,7 @@ import uuid
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import tlz as toolz
 from dask import compute
 from dask.dataframe.core import _concat, make_meta
@@ -210,6 +211,18 @@ class Shuffle(ShuffleBase):
             raise ValueError(f"{method} not supported")
 
 
+def _bucketed_by(frame):
+    """``(columns, npartitions)`` if ``frame`` is hash-partitioned by ``columns``
+
+    This is the case for datasets that were written bucketed, partition ``i``
+    then holds the rows that ``RearrangeByColumn`` would move to partition
+    ``i`` when shuffling by ``columns`` into ``npartitions`` partitions.
+    """
+    while isinstance(frame, (Filter, Projection)):
+        frame = frame.frame
+    return getattr(frame, "_bucketing", None)
+
+
 def _is_numeric_cast_type(dtype):
     return (
         pd.api.types.is_numeric_dtype(dtype)
@@ -304,6 +317,141 @@ class RearrangeByColumn(ShuffleBase):
             [c for c in shuffled.columns if c not in ["_partitions"] + drop_columns]
         ]
 
+    @functools.cached_property
+    def _arrow_partitions(self):
+        # The index of the partitions is only a default one if it's ignored
+        partitioning_index = self.partitioning_index
+        if isinstance(partitioning_index, str):
+            partitioning_index = [partitioning_index]
+        return (
+            self.ignore_index
+            and not self.index_shuffle
+            and isinstance(partitioning_index, list)
+            and self.frame.ndim == 2
+            and self.frame._arrow_partitions
+            and all(col in self.frame.columns for col in partitioning_index)
+        )
+
+    @property
+    def _arrow_meta(self):
+        if not self._arrow_partitions:
+            return self._meta
+        return self.frame._arrow_meta
+
+    @property
+    def _arrow_lowered(self):
+        if not self._arrow_partitions:
+            return None
+        columns = _convert_to_list(self.partitioning_index)
+        dtypes = self.frame._meta[columns].dtypes
+        cast_dtype = {
+            col: np.float64
+            for col, dtype in dtypes.items()
+            if _is_numeric_cast_type(dtype)
+        }
+        return ArrowShuffle(
+            self.frame,
+            columns,
+            self.npartitions_out,
+            cast_dtype or None,
+            dict(dtypes),
+        )
+
+
+class ArrowShuffle(Expr):
+    """Hash-partition Arrow partitions by columns, keeping them in Arrow
+
+    Rows end up in the same output partitions as with ``RearrangeByColumn``,
+    the hashes are computed on the key columns converted to the dtypes of
+    the pandas partitions. The tasks of the input are inlined through
+    ``_arrow_task``, the output partitions are ``pyarrow.Table``.
+
+    Parameters
+    ----------
+    frame: Expr
+        The DataFrame-like expression to shuffle, producing Arrow partitions.
+    partitioning_index: list
+        Columns to hash and partition by.
+    npartitions_out: int
+        Number of output partitions.
+    cast_dtype: dict, optional
+        The dtypes to use for the hashed columns.
+    key_dtypes: dict
+        The pandas dtypes of the hashed columns.
+    """
+
+    _parameters = [
+        "frame",
+        "partitioning_index",
+        "npartitions_out",
+        "cast_dtype",
+        "key_dtypes",
+    ]
+
+    def __str__(self):
+        return f"ArrowShuffle({self._name[-7:]})"
+
+    @functools.cached_property
+    def _meta(self):
+        return self.frame._meta.reset_index(drop=True)
+
+    def _divisions(self):
+        return (None,) * (self.npartitions_out + 1)
+
+    def dependencies(self):
+        return self.frame._arrow_dependencies()
+
+    def _lower(self):
+        return None
+
+    _arrow_partitions = True
+
+    @property
+    def _arrow_meta(self):
+        return self.frame._arrow_meta
+
+    def _arrow_task(self, index: int):
+        return (self._name, index)
+
+    def _arrow_dependencies(self):
+        return [self]
+
+    def _layer(self):
+        split_name = "split-" + self._name
+        npartitions_in = self.frame.npartitions
+        dsk = {}
+        for part_in in range(npartitions_in):
+            dsk[(split_name, part_in)] = (
+                _arrow_shuffle_group,
+                self.frame._arrow_task(part_in),
+                self.partitioning_index,
+                self.npartitions_out,
+                self.cast_dtype,
+                self.key_dtypes,
+            )
+        for part_out in range(self.npartitions_out):
+            dsk[(self._name, part_out)] = (
+                _arrow_concat,
+                [
+                    (operator.getitem, (split_name, part_in), part_out)
+                    for part_in in range(npartitions_in)
+                ],
+            )
+        return dsk
+
+
+def _arrow_shuffle_group(table, columns, npartitions, cast_dtype, key_dtypes):
+    keys = table.select(columns).to_pandas().astype(key_dtypes)
+    parts = np.asarray(partitioning_index(keys, npartitions, cast_dtype))
+    order = np.argsort(parts, kind="stable")
+    bounds = np.searchsorted(parts[order], np.arange(npartitions + 1))
+    table = table.take(order)
+    return [table.slice(start, stop - start) for start, stop in zip(bounds, bounds[1:])]
+
+
+def _arrow_concat(tables):
+    return pa.concat_tables(tables)
+
 
 class SimpleShuffle(PartitionsFiltered, Shuffle):
     _parameters = [
@@ -742,6 +890,7 @@ class BaseSetIndexSortValues(Expr):
             self._npartitions_input,
             self.ascending,
             upsample=self.upsample,
+            sketch_size=self.sketch_size,
         )
         if presorted and len(mins) == self._npartitions_input:
             divisions = mins.copy() + [maxes[-1]]
@@ -776,6 +925,9 @@ class SetIndex(BaseSetIndexSortValues):
         Divisions as passed by the user.
     upsample: float
         Used to increase the number of samples for quantiles.
+    sketch_size: int, optional
+        Compute the divisions from merged quantile sketches of this size
+        instead of percentile summaries.
     """
 
     _parameters = [
@@ -790,6 +942,7 @@ class SetIndex(BaseSetIndexSortValues):
         "shuffle_method",
         "append",
         "options",  # Options for the chosen shuffle method
+        "sketch_size",
     ]
     _defaults = {
         "drop": True,
@@ -801,6 +954,7 @@ class SetIndex(BaseSetIndexSortValues):
         "shuffle_method": None,
         "options": None,
         "append": False,
+        "sketch_size": None,
     }
     _filter_passthrough = True
 
@@ -856,6 +1010,7 @@ class SetIndex(BaseSetIndexSortValues):
                     self._npartitions_input,
                     self.ascending,
                     upsample=self.upsample,
+                    sketch_size=self.sketch_size,
                 )[3]
 
             if presorted and self.npartitions == self.frame.npartitions:
@@ -874,6 +1029,7 @@ class SetIndex(BaseSetIndexSortValues):
             self.user_divisions,
             self.shuffle_method,
             self.options,
+            self.sketch_size,
         )
 
     def _simplify_up(self, parent, dependents):
@@ -938,6 +1094,7 @@ class SortValues(BaseSetIndexSortValues):
         "ignore_index",
         "shuffle_method",
         "options",  # Options for the chosen shuffle method
+        "sketch_size",
     ]
     _defaults = {
         "partition_size": 128e6,
@@ -949,6 +1106,8 @@ class SortValues(BaseSetIndexSortValues):
         "upsample": 1.0,
         "ignore_index": False,
         "shuffle_method": None,
+        "options": None,
+        "sketch_size": None,
     }
     _filter_passthrough = True
 
@@ -963,6 +1122,7 @@ class SortValues(BaseSetIndexSortValues):
             self._npartitions_input,
             self._divisions_ascending,
             upsample=self.upsample,
+            sketch_size=self.sketch_size,
         )
         if presorted:
             return self.frame.divisions
@@ -1018,6 +1178,7 @@ class SortValues(BaseSetIndexSortValues):
             self._npartitions_input,
             self._divisions_ascending,
             upsample=self.upsample,
+            sketch_size=self.sketch_size,
         )
         if presorted and self.npartitions == self.frame.npartitions:
             return SortValuesBlockwise(
@@ -1109,6 +1270,7 @@ class SetPartition(SetIndex):
         "user_divisions",
         "shuffle_method",
         "options",  # Shuffle method options
+        "sketch_size",
     ]
 
     def _lower(self):
@@ -1138,6 +1300,7 @@ class SetPartition(SetIndex):
             "partitions": self._npartitions_input,
             "ascending": self.ascending,
             "upsample": self.upsample,
+            "sketch_size": self.sketch_size,
         }
         index_set = _SetIndexPost(
             shuffled,
@@ -1206,12 +1369,13 @@ class _SetIndexPost(Blockwise):
         if self.operand("user_divisions") is not None:
             return self._get_culled_divisions(self.operand("user_divisions"))
         kwargs = self.key_kwargs
-        key = (
+        key = _divisions_key(
             kwargs["other"],
             kwargs["partitions"],
             kwargs["ascending"],
             128e6,
             kwargs["upsample"],
+            kwargs.get("sketch_size"),
         )
         assert key in divisions_lru
         return self._get_culled_divisions(divisions_lru[key][0])
@@ -1276,6 +1440,16 @@ class SetIndexBlockwise(Blockwise):
 divisions_lru = LRU(10)
 
 
+def _divisions_key(
+    other, npartitions, ascending, partition_size, upsample, sketch_size=None
+):
+    key = (other, npartitions, ascending, partition_size, upsample)
+    if sketch_size is not None:
+        # Sketches give other divisions than percentile summaries
+        key += (sketch_size,)
+    return key
+
+
 def _get_divisions(
     frame,
     other,
@@ -1283,12 +1457,15 @@ def _get_divisions(
     ascending: bool = True,
     partition_size: float = 128e6,
     upsample: float = 1.0,
+    sketch_size: int | None = None,
 ):
-    key = (other._name, npartitions, ascending, partition_size, upsample)
+    key = _divisions_key(
+        other._name, npartitions, ascending, partition_size, upsample, sketch_size
+    )
     if key in divisions_lru:
         return divisions_lru[key]
     result = _calculate_divisions(
-        frame, other, npartitions, ascending, partition_size, upsample
+        frame, other, npartitions, ascending, partition_size, upsample, sketch_size
     )
     divisions_lru[key] = result
     return result
@@ -1301,15 +1478,26 @@ def _calculate_divisions(
     ascending: bool = True,
     partition_size: float = 128e6,
     upsample: float = 1.0,
+    sketch_size: int | None = None,
 ):
     from dask_expr import RepartitionQuantiles, new_collection
 
     if is_index_like(other._meta):
         other = ToSeriesIndex(other)
 
+    if sketch_size is None:
+        quantiles = RepartitionQuantiles(other, npartitions, upsample=upsample)
+    else:
+        quantiles = RepartitionQuantiles(
+            other,
+            npartitions,
+            upsample=upsample,
+            method="sketch",
+            sketch_size=sketch_size,
+        )
     try:
         divisions, mins, maxes = compute(
-            new_collection(RepartitionQuantiles(other, npartitions, upsample=upsample)),
+            new_collection(quantiles),
             new_collection(other).map_partitions(M.min),
             new_collection(other).map_partitions(M.max),
         )
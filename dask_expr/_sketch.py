@@ -0,0 +1,121 @@
+"""A mergeable quantile sketch written in numpy
+
+This is a KLL sketch (Karnin, Lang & Liberty, "Optimal Quantile Approximation
+in Streams", 2016). Values are kept in a stack of compactors: items on level
+``h`` stand for ``2 ** h`` input values. When a level grows beyond its
+capacity it is sorted and every other item is promoted to the next level,
+which halves its size while keeping the total weight intact. Capacities shrink
+geometrically towards the lower levels, so a sketch never holds more than
+about ``3 * k`` values no matter how much data it has seen.
+
+Sketches of different partitions merge by concatenating their levels and
+compacting again, which makes them a natural fit for tree reductions. The
+rank error of a quantile is on the order of ``1 / k`` of the number of values
+and doesn't depend on how the data was split up. For the default ``k=200``
+it is about 0.3% when merging the sketches of 4M values in a tree. Sketches
+that never had to compact are exact.
+
+A sketch is a plain ``(levels, count, min, max)`` tuple so that it serializes
+cheaply between workers.
+"""
+
+import numpy as np
+
+# Default size ``k`` of the largest compactor
+DEFAULT_SKETCH_SIZE = 200
+
+# Capacity ratio between consecutive levels
+_CAPACITY_DECAY = 2 / 3
+_MIN_CAPACITY = 8
+
+
+def _capacity(k, height, level):
+    depth = height - level - 1
+    return max(int(np.ceil(k * _CAPACITY_DECAY**depth)), _MIN_CAPACITY)
+
+
+def _compress(levels, k):
+    levels = list(levels)
+    level = 0
+    while level < len(levels):
+        items = levels[level]
+        if len(items) > _capacity(k, len(levels), level):
+            items = np.sort(items)
+            # An odd item out stays on this level
+            keep, items = items[: len(items) % 2], items[len(items) % 2 :]
+            # Deterministic coin flip, so that results are reproducible
+            offset = np.random.default_rng((len(items), level)).integers(2)
+            promoted = items[offset::2]
+            if level + 1 == len(levels):
+                levels.append(promoted)
+            else:
+                levels[level + 1] = np.concatenate([levels[level + 1], promoted])
+            levels[level] = keep
+        level += 1
+    return levels
+
+
+def _as_float(values):
+    values = np.asarray(values)
+    if values.dtype.kind in "mM":
+        values = values.view("i8")
+        values = values[values != np.iinfo("i8").min].astype("f8")
+    else:
+        values = values.astype("f8")
+    return values[~np.isnan(values)]
+
+
+def create_sketch(values, k=DEFAULT_SKETCH_SIZE):
+    """Sketch the non-null values of an array, Series or Index"""
+    values = _as_float(values)
+    if not len(values):
+        return [], 0, np.nan, np.nan
+    return (
+        _compress([np.sort(values)], k),
+        len(values),
+        values.min(),
+        values.max(),
+    )
+
+
+def merge_sketches(sketches, k=DEFAULT_SKETCH_SIZE):
+    """Merge a list of sketches into one"""
+    sketches = [sketch for sketch in sketches if sketch[1]]
+    if not sketches:
+        return [], 0, np.nan, np.nan
+    height = max(len(sketch[0]) for sketch in sketches)
+    levels = [
+        np.concatenate([sketch[0][h] for sketch in sketches if h < len(sketch[0])])
+        for h in range(height)
+    ]
+    return (
+        _compress(levels, k),
+        sum(sketch[1] for sketch in sketches),
+        min(sketch[2] for sketch in sketches),
+        max(sketch[3] for sketch in sketches),
+    )
+
+
+def sketch_quantiles(sketch, q):
+    """Approximate quantiles ``q`` of the sketched values
+
+    Quantiles are linearly interpolated between the retained items like
+    pandas' default interpolation, the minimum and maximum are exact.
+    """
+    levels, count, minimum, maximum = sketch
+    q = np.asarray(q, dtype="f8")
+    if not count:
+        return np.full(q.shape, np.nan)
+    values = np.concatenate(levels)
+    weights = np.concatenate(
+        [np.full(len(items), 2.0**level) for level, items in enumerate(levels)]
+    )
+    order = np.argsort(values, kind="stable")
+    values, weights = values[order], weights[order]
+    # The (0-based) rank in the middle of the block of values an item stands for
+    ranks = np.cumsum(weights) - (weights + 1) / 2
+    return np.interp(
+        q * (count - 1),
+        np.concatenate([[0], ranks, [count - 1]]),
+        np.concatenate([[minimum], values, [maximum]]),
+    )
@@ -0,0 +1,344 @@
+"""An on-disk cache of parquet file listings and statistics
+
+Listing a dataset and reading the footers of all its files is the dominant
+cost of ``read_parquet`` on large remote datasets, and every new process pays
+it again. When the ``dataframe.parquet.metadata-cache.directory`` config
+option points to a directory, this information is stored in a SQLite database
+in that directory so that it can be shared between processes:
+
+- Statistics are keyed by the path, size and modification time of a file, so
+  a rewritten file is never served stale statistics. Files without a
+  modification time are not cached.
+- Directory listings can't be validated without listing the directory again,
+  they are only reused for ``dataframe.parquet.metadata-cache.listing-ttl``
+  seconds, which defaults to 0 (never).
+- At most ``dataframe.parquet.metadata-cache.max-entries`` files and
+  listings are kept, the least recently used ones are evicted first.
+
+SQLite takes care of locking, so several processes can use the same cache
+directory concurrently. The cache is best effort, any error while accessing
+it falls back to reading the metadata from the files.
+
+Values are stored as JSON, never pickled, since anyone who can write to a
+shared cache directory could otherwise run code in every process reading
+from it. Scalars that JSON can't represent, like the timestamps, dates and
+decimals of column statistics, are tagged with their type, see
+``_encode``. Statistics with values of any other type are not cached.
+"""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import datetime
+import decimal
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import dask
+import pandas as pd
+import pyarrow as pa
+import tlz as toolz
+
+_CACHE_FILENAME = "parquet-metadata.sqlite"
+_DEFAULT_MAX_ENTRIES = 1_000_000
+# SQLite limits the number of variables in a statement
+_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS statistics (
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (path, size, mtime_ns)
+);
+CREATE INDEX IF NOT EXISTS statistics_last_used ON statistics (last_used);
+CREATE TABLE IF NOT EXISTS listings (
+    filesystem TEXT NOT NULL,
+    path TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (filesystem, path)
+);
+"""
+_TYPE_KEY = "__dask_type__"
+
+# Connections of this process by database path. They are opened on first use
+# and shared between threads, the lock serializes their use.
+_connections: dict[str, tuple[int, sqlite3.Connection]] = {}
+_connections_lock = threading.Lock()
+
+
+def get_metadata_cache() -> MetadataCache | None:
+    """The metadata cache configured for this process, if any"""
+    directory = dask.config.get("dataframe.parquet.metadata-cache.directory", None)
+    if not directory:
+        return None
+    return MetadataCache(
+        directory,
+        max_entries=dask.config.get(
+            "dataframe.parquet.metadata-cache.max-entries", _DEFAULT_MAX_ENTRIES
+        ),
+        listing_ttl=dask.config.get("dataframe.parquet.metadata-cache.listing-ttl", 0),
+    )
+
+
+def _file_key(finfo):
+    return finfo.path, finfo.size, finfo.mtime_ns
+
+
+def _encode_scalar(obj):
+    # Check subclasses before their base classes
+    if isinstance(obj, pd.Timestamp):
+        tz = None if obj.tz is None else str(obj.tz)
+        return {_TYPE_KEY: "timestamp", "value": obj.value, "tz": tz}
+    if isinstance(obj, datetime.datetime):
+        return {_TYPE_KEY: "datetime", "value": obj.isoformat()}
+    if isinstance(obj, datetime.date):
+        return {_TYPE_KEY: "date", "value": obj.isoformat()}
+    if isinstance(obj, datetime.time):
+        return {_TYPE_KEY: "time", "value": obj.isoformat()}
+    if isinstance(obj, bytes):
+        return {_TYPE_KEY: "bytes", "value": base64.b64encode(obj).decode()}
+    if isinstance(obj, decimal.Decimal):
+        return {_TYPE_KEY: "decimal", "value": str(obj)}
+    raise TypeError(f"Can't cache values of type {type(obj).__name__}")
+
+
+def _decode_scalar(obj):
+    kind = obj.get(_TYPE_KEY)
+    if kind is None:
+        return obj
+    value = obj["value"]
+    if kind == "timestamp":
+        if obj["tz"] is None:
+            return pd.Timestamp(value)
+        return pd.Timestamp(value, tz="UTC").tz_convert(obj["tz"])
+    if kind == "datetime":
+        return datetime.datetime.fromisoformat(value)
+    if kind == "date":
+        return datetime.date.fromisoformat(value)
+    if kind == "time":
+        return datetime.time.fromisoformat(value)
+    if kind == "bytes":
+        return base64.b64decode(value)
+    if kind == "decimal":
+        return decimal.Decimal(value)
+    raise ValueError(f"Unknown cached type {kind!r}")
+
+
+def _encode(value) -> str:
+    """Serialize statistics or a listing to JSON
+
+    Raises ``TypeError`` for values that can't be represented.
+    """
+    return json.dumps(value, default=_encode_scalar)
+
+
+def _decode(value: str):
+    return json.loads(value, object_hook=_decode_scalar)
+
+
+class MetadataCache:
+    """Parquet file listings and statistics stored in a SQLite database
+
+    Parameters
+    ----------
+    directory: str
+        Directory to keep the database in, created if it doesn't exist.
+    max_entries: int
+        Number of files and listings to keep before evicting the least
+        recently used ones.
+    listing_ttl: float
+        Number of seconds for which a directory listing is reused.
+    """
+
+    def __init__(self, directory, max_entries=_DEFAULT_MAX_ENTRIES, listing_ttl=0):
+        self.directory = str(directory)
+        self.path = os.path.join(self.directory, _CACHE_FILENAME)
+        self.max_entries = max_entries
+        self.listing_ttl = listing_ttl
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # Every process opens the database once. A connection inherited from
+        # the parent of a forked process must not be used.
+        with _connections_lock:
+            pid, connection = _connections.get(self.path, (None, None))
+            if pid != os.getpid():
+                os.makedirs(self.directory, exist_ok=True)
+                connection = sqlite3.connect(
+                    self.path, timeout=60, check_same_thread=False
+                )
+                try:
+                    connection.execute("PRAGMA journal_mode=WAL")
+                    connection.executescript(_SCHEMA)
+                except sqlite3.Error:
+                    connection.close()
+                    raise
+                _connections[self.path] = os.getpid(), connection
+            try:
+                with connection:
+                    yield connection
+            except sqlite3.Error:
+                # Start over with a new connection next time
+                del _connections[self.path]
+                connection.close()
+                raise
+
+    def get_statistics(self, file_infos) -> dict:
+        """Cached statistics of the given files, keyed by their ``FileInfo``
+
+        Files that aren't in the cache are missing from the result.
+        """
+        file_infos = {
+            _file_key(finfo): finfo
+            for finfo in file_infos
+            if finfo.mtime_ns is not None
+        }
+        if not file_infos:
+            return {}
+        rows = []
+        try:
+            with self._connect() as connection:
+                paths = {path for path, _, _ in file_infos}
+                for batch in toolz.partition_all(_BATCH_SIZE, paths):
+                    rows.extend(
+                        connection.execute(
+                            "SELECT path, size, mtime_ns, value FROM statistics "
+                            f"WHERE path IN ({', '.join('?' * len(batch))})",
+                            batch,
+                        )
+                    )
+        except sqlite3.Error:
+            return {}
+        result = {}
+        for path, size, mtime_ns, value in rows:
+            if (path, size, mtime_ns) not in file_infos:
+                continue
+            try:
+                result[file_infos[path, size, mtime_ns]] = _decode(value)
+            except (TypeError, ValueError, KeyError):
+                # Written by an incompatible version
+                continue
+        self._touch(
+            "UPDATE statistics SET last_used=? "
+            "WHERE path=? AND size=? AND mtime_ns=?",
+            [_file_key(finfo) for finfo in result],
+        )
+        return result
+
+    def set_statistics(self, statistics) -> None:
+        """Store a mapping of ``FileInfo`` to statistics"""
+        now = time.time()
+        rows = []
+        for finfo, stats in statistics.items():
+            if finfo.mtime_ns is None:
+                continue
+            try:
+                rows.append((*_file_key(finfo), _encode(stats), now))
+            except (TypeError, ValueError):
+                continue
+        if not rows:
+            return
+        try:
+            with self._connect() as connection:
+                # A rewritten file replaces the statistics of its old version
+                connection.executemany(
+                    "DELETE FROM statistics WHERE path=?", [row[:1] for row in rows]
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO statistics VALUES (?, ?, ?, ?, ?)", rows
+                )
+                self._evict(connection)
+        except sqlite3.Error:
+            pass
+
+    def get_listing(self, filesystem, path) -> list | None:
+        """The files of a recently cached directory listing, if any"""
+        if not self.listing_ttl:
+            return None
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT value FROM listings "
+                    "WHERE filesystem=? AND path=? AND created>=?",
+                    (filesystem, path, time.time() - self.listing_ttl),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        self._touch(
+            "UPDATE listings SET last_used=? WHERE filesystem=? AND path=?",
+            [(filesystem, path)],
+        )
+        try:
+            files = _decode(row[0])
+            return [
+                pa.fs.FileInfo(
+                    file_path, type=pa.fs.FileType.File, size=size, mtime_ns=mtime_ns
+                )
+                for file_path, size, mtime_ns in files
+            ]
+        except (TypeError, ValueError):
+            # Written by an incompatible version
+            return None
+
+    def set_listing(self, filesystem, path, file_infos) -> None:
+        """Store the files of a directory listing"""
+        if not self.listing_ttl:
+            return
+        now = time.time()
+        value = _encode([_file_key(finfo) for finfo in file_infos])
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?, ?)",
+                    (filesystem, path, value, now, now),
+                )
+                self._evict(connection)
+        except sqlite3.Error:
+            pass
+
+    def invalidate_listing(self, path) -> None:
+        """Drop cached listings that may contain files below ``path``"""
+        path = path.rstrip("/")
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "DELETE FROM listings WHERE path=? OR substr(path, 1, ?)=? "
+                    "OR substr(?, 1, length(path) + 1)=path || '/'",
+                    (path, len(path) + 1, path + "/", path),
+                )
+        except sqlite3.Error:
+            pass
+
+    def _touch(self, statement, keys):
+        # Recency is only a hint for eviction. It is written in a transaction
+        # of its own, since SQLite can't upgrade a read transaction to a write
+        # while other processes are writing.
+        if not keys:
+            return
+        now = time.time()
+        try:
+            with self._connect() as connection:
+                connection.executemany(statement, [(now, *key) for key in keys])
+        except sqlite3.Error:
+            pass
+
+    def _evict(self, connection):
+        for table in ("statistics", "listings"):
+            (count,) = connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+            if count > self.max_entries:
+                connection.execute(
+                    f"DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM {table} "
+                    "ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
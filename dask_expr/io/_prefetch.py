@@ -0,0 +1,328 @@
+"""Background read-ahead of parquet column chunks
+
+Reading a parquet fragment blocks the task until all of its bytes arrived,
+so IO and the CPU-bound work of the surrounding tasks don't overlap within a
+worker thread. With the ``dataframe.parquet.prefetch`` config option set to
+``N``, every task of ``read_parquet(..., filesystem="arrow")`` asks the
+process-local ``Prefetcher`` to fetch the data of ``N`` neighbouring
+partitions in background threads. Neighbouring partitions are usually
+scheduled on the same worker, so by the time their tasks run the bytes are
+already in memory. Partitions are not necessarily computed in increasing
+order, e.g. the scheduler walks reductions from the end, so the partitions in
+the direction in which this process last moved through the partitions are
+read.
+
+Like pyarrow's ``pre_buffer``, only the byte ranges of the column chunks that
+a partition reads are fetched, together with the footer of its file. Ranges
+that are close to each other are coalesced the same way pyarrow coalesces
+them, so the reads of the parquet reader fall within the fetched ranges. Any
+read that doesn't is served from the file.
+
+Prefetched data is held in memory until it is read or evicted. Its total size
+is bounded by ``dataframe.parquet.prefetch-bytes``. Data of partitions that
+didn't run in this process within twice the read-ahead distance is considered
+stale and evicted when the budget is exceeded, data that still doesn't fit is
+not prefetched. A partition whose data wasn't prefetched, or was evicted, is
+read from the filesystem as usual.
+"""
+
+from __future__ import annotations
+
+import bisect
+import io
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import dask
+import pyarrow as pa
+import pyarrow.parquet as pq
+from dask.utils import parse_bytes
+
+from dask_expr._util import LRU
+
+_DEFAULT_PREFETCH_BYTES = "256 MiB"
+_PREFETCH_THREADS = 4
+# Number of expressions for which the last read partition is remembered
+_HISTORY_SIZE = 64
+# Number of bytes at the end of a file that the parquet reader reads to find
+# the footer
+_FOOTER_READ_SIZE = 64 * 1024
+# Gap up to which neighbouring column chunks are read at once, the same
+# hole_size_limit as the one the parquet reader is configured with
+HOLE_SIZE_LIMIT = parse_bytes("4 MiB")
+
+_prefetcher = None
+_prefetcher_lock = threading.Lock()
+
+
+def prefetch_config() -> tuple[int, int]:
+    """Number of partitions to read ahead and the byte budget for them"""
+    n = dask.config.get("dataframe.parquet.prefetch", 0) or 0
+    nbytes = dask.config.get("dataframe.parquet.prefetch-bytes", None)
+    return int(n), parse_bytes(nbytes or _DEFAULT_PREFETCH_BYTES)
+
+
+def get_prefetcher() -> Prefetcher:
+    """The ``Prefetcher`` of this process"""
+    global _prefetcher
+    with _prefetcher_lock:
+        if _prefetcher is None:
+            _prefetcher = Prefetcher()
+        return _prefetcher
+
+
+def _key(filesystem, path, row_groups, columns):
+    return (
+        path,
+        pickle.dumps(filesystem),
+        None if row_groups is None else tuple(row_groups),
+        None if columns is None else tuple(sorted(columns)),
+    )
+
+
+def column_chunk_ranges(metadata, row_groups=None, columns=None) -> list:
+    """Coalesced ``(offset, length)`` byte ranges of column chunks
+
+    Parameters
+    ----------
+    metadata: pyarrow.parquet.FileMetaData
+    row_groups: list[int], optional
+        Row groups to read, all by default.
+    columns: Iterable[str], optional
+        Top-level columns to read, all by default.
+    """
+    if row_groups is None:
+        row_groups = range(metadata.num_row_groups)
+    ranges = []
+    for i in row_groups:
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            chunk = row_group.column(j)
+            if (
+                columns is not None
+                and chunk.path_in_schema.split(".")[0] not in columns
+            ):
+                continue
+            # Same range as the one the parquet reader computes
+            start = chunk.data_page_offset
+            if chunk.has_dictionary_page and 0 < chunk.dictionary_page_offset < start:
+                start = chunk.dictionary_page_offset
+            ranges.append((start, chunk.total_compressed_size))
+    coalesced = []
+    for start, length in sorted(ranges):
+        if coalesced:
+            last_start, last_length = coalesced[-1]
+            if start <= last_start + last_length + HOLE_SIZE_LIMIT:
+                end = max(last_start + last_length, start + length)
+                coalesced[-1] = (last_start, end - last_start)
+                continue
+        coalesced.append((start, length))
+    return coalesced
+
+
+class RangeFile(io.RawIOBase):
+    """A read-only file that serves reads from fetched byte ranges
+
+    Reads that aren't contained in a single range are served from the file,
+    which is only opened if that happens.
+
+    Parameters
+    ----------
+    filesystem: pyarrow.fs.FileSystem
+    path: str
+    size: int
+        Size of the file.
+    ranges: list[tuple[int, bytes]]
+        Sorted, non-overlapping ranges as offset and contents.
+    """
+
+    def __init__(self, filesystem, path, size, ranges):
+        super().__init__()
+        self.filesystem = filesystem
+        self.path = path
+        self.size = size
+        self.ranges = ranges
+        self._offsets = [offset for offset, _ in ranges]
+        self._position = 0
+        self._file = None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self._position = offset
+        return offset
+
+    def read(self, size=-1):
+        start = self._position
+        if size is None or size < 0:
+            size = self.size - start
+        size = max(min(size, self.size - start), 0)
+        self._position += size
+        i = bisect.bisect_right(self._offsets, start) - 1
+        if i >= 0:
+            offset, buffer = self.ranges[i]
+            if start + size <= offset + len(buffer):
+                return buffer[start - offset : start - offset + size]
+        if self._file is None:
+            self._file = self.filesystem.open_input_file(self.path)
+        return self._file.read_at(size, start)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        super().close()
+
+
+class Prefetcher:
+    """Fetch parquet column chunks into memory in background threads
+
+    Parameters
+    ----------
+    max_threads: int
+        Number of partitions that are fetched concurrently
+    """
+
+    def __init__(self, max_threads=_PREFETCH_THREADS):
+        self._executor = ThreadPoolExecutor(
+            max_threads, thread_name_prefix="dask-expr-prefetch"
+        )
+        self._lock = threading.Lock()
+        # key -> [future, number of bytes reserved, number of takes at creation]
+        self._entries = OrderedDict()
+        self._takes = 0
+        self.nbytes = 0
+        self.hits = 0
+        # name -> index of the partition that was read last
+        self._last_index = LRU(_HISTORY_SIZE)
+
+    def prefetch(
+        self, name, index, preceding, following, filesystem, columns, max_bytes
+    ) -> None:
+        """Start fetching the data of the partitions around ``index`` of ``name``
+
+        ``preceding`` and ``following`` hold the ``(path, row_groups)`` of the
+        neighbouring partitions, ordered by their distance to ``index``. Those
+        in the direction of the previously read partition are fetched if they
+        aren't in flight already. Only the chunks of ``columns`` are fetched.
+        """
+        with self._lock:
+            last = self._last_index.get(name)
+            self._last_index[name] = index
+        parts = preceding if last is not None and last > index else following
+        stale_after = 2 * max(len(preceding), len(following))
+        for path, row_groups in parts:
+            key = _key(filesystem, path, row_groups, columns)
+            with self._lock:
+                if key in self._entries:
+                    continue
+                entry = self._entries[key] = [None, 0, self._takes]
+            entry[0] = self._executor.submit(
+                self._fetch,
+                key,
+                entry,
+                filesystem,
+                path,
+                row_groups,
+                columns,
+                max_bytes,
+                stale_after,
+            )
+
+    def _fetch(
+        self, key, entry, filesystem, path, row_groups, columns, max_bytes, stale_after
+    ):
+        with filesystem.open_input_file(path) as f:
+            size = f.size()
+            tail_size = min(size, _FOOTER_READ_SIZE)
+            tail = f.read_at(tail_size, size - tail_size)
+            footer = RangeFile(filesystem, path, size, [(size - tail_size, tail)])
+            metadata = pq.read_metadata(pa.PythonFile(footer, mode="r"))
+            footer.close()
+            ranges = column_chunk_ranges(metadata, row_groups, columns)
+            nbytes = tail_size + sum(length for _, length in ranges)
+            if not self._reserve(key, entry, nbytes, max_bytes, stale_after):
+                return None
+            buffers = [(offset, f.read_at(length, offset)) for offset, length in ranges]
+        buffers.append((size - tail_size, tail))
+        return size, _disjoint(sorted(buffers, key=lambda b: b[0]))
+
+    def _reserve(self, key, entry, size, max_bytes, stale_after):
+        with self._lock:
+            if self._entries.get(key) is not entry:
+                # Taken by a task in the meantime
+                return False
+            for other_key, (future, nbytes, created) in list(self._entries.items()):
+                if self.nbytes + size <= max_bytes:
+                    break
+                if (
+                    nbytes
+                    and future is not None
+                    and future.done()
+                    and self._takes - created > stale_after
+                ):
+                    del self._entries[other_key]
+                    self.nbytes -= nbytes
+            if self.nbytes + size > max_bytes:
+                del self._entries[key]
+                return False
+            entry[1] = size
+            self.nbytes += size
+            return True
+
+    def take(self, filesystem, path, row_groups, columns):
+        """A ``RangeFile`` with the prefetched data of a partition, or ``None``
+
+        Waits for the data if it is still being fetched.
+        """
+        with self._lock:
+            self._takes += 1
+            entry = self._entries.pop(_key(filesystem, path, row_groups, columns), None)
+        if entry is None:
+            return None
+        future = entry[0]
+        try:
+            result = future.result() if future is not None else None
+        except Exception:
+            # Read the file as usual, which raises any persistent error
+            result = None
+        with self._lock:
+            self.nbytes -= entry[1]
+            if result is not None:
+                self.hits += 1
+        if result is None:
+            return None
+        return RangeFile(filesystem, path, *result)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+def _disjoint(buffers):
+    # The tail and the last coalesced range can overlap, merge them
+    merged = []
+    for offset, buffer in buffers:
+        if merged:
+            last_offset, last = merged[-1]
+            end = last_offset + len(last)
+            if offset < end:
+                if offset + len(buffer) > end:
+                    merged[-1] = (last_offset, last + buffer[end - offset :])
+                continue
+        merged.append((offset, buffer))
+    return merged
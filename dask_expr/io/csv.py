@@ -1,9 +1,38 @@
 import functools
 import operator
+from io import BytesIO
 
-from dask_expr._util import _convert_to_list
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from dask.base import tokenize
+from dask.utils import funcname, parse_bytes
+from fsspec.core import get_fs_token_paths
+from fsspec.utils import infer_compression, read_block
+from pandas._libs.parsers import STR_NA_VALUES
+
+from dask_expr._util import LRU, _convert_to_list, _tokenize_deterministic
 from dask_expr.io.io import BlockwiseIO, PartitionsFiltered
 
+# Number of bytes of the first file used to infer the schema
+_SAMPLE_SIZE = 256_000
+_SCHEMA_CACHE = LRU(64)
+# Like pandas, empty fields and the default NA markers are missing values,
+# strings included
+_CONVERT_OPTIONS = {"null_values": sorted(STR_NA_VALUES), "strings_can_be_null": True}
+# Keywords of ``read_csv(..., engine="pyarrow")`` handled by ``ReadCSVPyarrow``
+_PYARROW_KWARGS = {
+    "engine",
+    "sep",
+    "delimiter",
+    "names",
+    "dtype",
+    "quotechar",
+    "blocksize",
+    "compression",
+}
+
 
 class ReadCSV(PartitionsFiltered, BlockwiseIO):
     _parameters = [
@@ -120,6 +149,407 @@ class ReadFwf(ReadCSV):
         return read_fwf
 
 
+def _use_pyarrow_reader(header, usecols, kwargs):
+    """Whether ``read_csv`` can be planned by ``ReadCSVPyarrow``"""
+    if kwargs.get("engine") != "pyarrow" or not set(kwargs) <= _PYARROW_KWARGS:
+        return False
+    if header not in ("infer", 0, None):
+        return False
+    sep = kwargs.get("sep", kwargs.get("delimiter", ","))
+    if not isinstance(sep, str) or len(sep) != 1:
+        return False
+    if usecols is not None and (
+        callable(usecols) or not all(isinstance(c, str) for c in usecols)
+    ):
+        return False
+    names = kwargs.get("names")
+    return names is None or len(set(names)) == len(names)
+
+
+def _parse_type(dtype):
+    """The arrow type to parse a column as that is cast to ``dtype`` afterwards"""
+    dtype = pd.api.types.pandas_dtype(dtype)
+    numpy_dtype = getattr(dtype, "numpy_dtype", dtype)
+    if isinstance(numpy_dtype, np.dtype) and numpy_dtype.kind in "biuf":
+        return pa.from_numpy_dtype(numpy_dtype)
+    return pa.string()
+
+
+class ReadCSVPyarrow(PartitionsFiltered, BlockwiseIO):
+    """Read CSV files by parsing byte ranges with ``pyarrow.csv``
+
+    Unlike ``ReadCSV`` the blocks of the files are planned here instead of in a
+    legacy collection. The schema is inferred from the beginning of the first
+    file and every block is parsed with it, columns that aren't selected are
+    skipped by the parser. Blocks that pyarrow can't parse with the inferred
+    schema are parsed by pandas and cast to it.
+    """
+
+    _parameters = [
+        "filename",
+        "columns",
+        "header",
+        "dtype_backend",
+        "sep",
+        "names",
+        "dtype",
+        "quotechar",
+        "blocksize",
+        "compression",
+        "_partitions",
+        "storage_options",
+        "_series",
+        "pyarrow_strings_enabled",
+        "_dataset_info_cache",
+    ]
+    _defaults = {
+        "columns": None,
+        "header": "infer",
+        "dtype_backend": None,
+        "sep": ",",
+        "names": None,
+        "dtype": None,
+        "quotechar": '"',
+        "blocksize": "default",
+        "compression": "infer",
+        "_partitions": None,
+        "storage_options": None,
+        "_series": False,
+        "pyarrow_strings_enabled": True,
+        "_dataset_info_cache": None,
+    }
+    _absorb_projections = True
+
+    @functools.cached_property
+    def _name(self):
+        return (
+            funcname(type(self)).lower()
+            + "-"
+            + _tokenize_deterministic(self.checksum, *self.operands[:-1])
+        )
+
+    @property
+    def checksum(self):
+        return self._dataset_info["checksum"]
+
+    def _tree_repr_argument_construction(self, i, op, header):
+        if self._parameters[i] == "_dataset_info_cache":
+            return header
+        return super()._tree_repr_argument_construction(i, op, header)
+
+    @property
+    def _has_header(self):
+        return self.header == 0 or (self.header == "infer" and self.names is None)
+
+    @property
+    def _blocksize(self):
+        from dask.dataframe.io.csv import AUTO_BLOCKSIZE
+
+        if self.blocksize == "default":
+            return AUTO_BLOCKSIZE
+        if isinstance(self.blocksize, str):
+            return parse_bytes(self.blocksize)
+        return self.blocksize
+
+    @functools.cached_property
+    def _dataset_info(self):
+        if rv := self.operand("_dataset_info_cache"):
+            return rv
+        fs, _, paths = get_fs_token_paths(
+            self.filename, mode="rb", storage_options=self.storage_options or {}
+        )
+        file_infos = []
+        for path in paths:
+            info = fs.info(path)
+            if info["type"] == "directory":
+                file_infos.extend(
+                    v for _, v in sorted(fs.find(path, detail=True).items())
+                )
+            else:
+                file_infos.append(info)
+        if not file_infos:
+            raise OSError(f"{self.filename} resolved to no files")
+
+        blocksize = self._blocksize
+        blocks = []
+        for info in file_infos:
+            path, size = info["name"], info["size"]
+            compression = self.compression
+            if compression == "infer":
+                compression = infer_compression(path)
+            if compression is not None or not blocksize or not size:
+                # Compressed files can't be split
+                blocks.append((path, 0, None, compression))
+            else:
+                blocks.extend(
+                    (path, offset, blocksize, None)
+                    for offset in range(0, size, blocksize)
+                )
+
+        key = tokenize(
+            file_infos[0],
+            blocks[0][3],
+            self.header,
+            self.dtype_backend,
+            self.sep,
+            self.names,
+            self.dtype,
+            self.quotechar,
+        )
+        if key not in _SCHEMA_CACHE:
+            _SCHEMA_CACHE[key] = self._infer_schema(fs, blocks[0])
+        names, schema = _SCHEMA_CACHE[key]
+
+        dataset_info = {
+            "fs": fs,
+            "blocks": blocks,
+            "checksum": tokenize(file_infos),
+            "names": names,
+            "schema": schema,
+        }
+        dataset_info["base_meta"] = self._table_to_pandas(
+            schema.empty_table(),
+            names,
+            self._dtypes(names),
+            self.dtype_backend,
+            self.pyarrow_strings_enabled,
+        )
+        self.operands[
+            type(self)._parameters.index("_dataset_info_cache")
+        ] = dataset_info
+        return dataset_info
+
+    def _infer_schema(self, fs, block):
+        path, _, _, compression = block
+        with fs.open(path, "rb", compression=compression) as f:
+            sample = f.read(_SAMPLE_SIZE)
+        if len(sample) == _SAMPLE_SIZE and b"\n" in sample:
+            # Don't parse the partial last line
+            sample = sample[: sample.rindex(b"\n") + 1]
+        table = pa_csv.read_csv(
+            BytesIO(sample),
+            read_options=pa_csv.ReadOptions(
+                autogenerate_column_names=not self._has_header
+            ),
+            parse_options=pa_csv.ParseOptions(
+                delimiter=self.sep, quote_char=self.quotechar
+            ),
+            convert_options=pa_csv.ConvertOptions(**_CONVERT_OPTIONS),
+        )
+        if self.names is not None:
+            names = list(self.names)
+            if len(names) != table.num_columns:
+                raise ValueError(
+                    f"Got {len(names)} names for {table.num_columns} columns "
+                    f"in {path}"
+                )
+        elif self._has_header:
+            names = table.column_names
+        else:
+            names = list(range(table.num_columns))
+        dtypes = self._dtypes(names)
+        fields = []
+        for i, (name, field) in enumerate(zip(names, table.schema)):
+            if name in dtypes:
+                type_ = _parse_type(dtypes[name])
+            elif pa.types.is_null(field.type) or (
+                pa.types.is_integer(field.type)
+                and table.column(i).null_count
+                and self.dtype_backend is None
+            ):
+                # Like pandas, integers with missing values are floats
+                type_ = pa.float64()
+            else:
+                type_ = field.type
+            fields.append(pa.field(f"f{i}", type_))
+        return names, pa.schema(fields)
+
+    def _dtypes(self, names):
+        """The user-defined dtypes of the columns ``names``"""
+        if self.dtype is None:
+            return {}
+        if isinstance(self.dtype, dict):
+            return {name: self.dtype[name] for name in names if name in self.dtype}
+        return {name: self.dtype for name in names}
+
+    @property
+    def columns(self):
+        names = self._dataset_info["names"]
+        columns_operand = self.operand("columns")
+        if columns_operand is None:
+            return list(names)
+        columns = _convert_to_list(columns_operand)
+        # Like pandas, selected columns are returned in the order of the file
+        return [name for name in names if name in columns]
+
+    @functools.cached_property
+    def _meta(self):
+        meta = self._dataset_info["base_meta"]
+        columns = _convert_to_list(self.operand("columns"))
+        if columns is not None:
+            missing = set(columns) - set(meta.columns)
+            if missing:
+                raise ValueError(f"Columns {sorted(missing, key=str)} not found")
+        if self._series:
+            return meta[self.columns[0]]
+        return meta[self.columns]
+
+    def _divisions(self):
+        return (None,) * (len(self._dataset_info["blocks"]) + 1)
+
+    @functools.cached_property
+    def _fusion_compression_factor(self):
+        if self.operand("columns") is None:
+            return 1
+        return max(len(self.columns) / len(self._dataset_info["names"]), 0.001)
+
+    @functools.cached_property
+    def _parse_options(self):
+        names = self._dataset_info["names"]
+        schema = self._dataset_info["schema"]
+        selected = set(self.columns)
+        return {
+            "column_names": schema.names,
+            "column_types": schema,
+            "include_columns": [
+                field for field, name in zip(schema.names, names) if name in selected
+            ],
+            "delimiter": self.sep,
+            "quote_char": self.quotechar,
+        }
+
+    def _filtered_task(self, index: int):
+        path, offset, length, compression = self._dataset_info["blocks"][index]
+        task = (
+            ReadCSVPyarrow._table_to_pandas,
+            (
+                ReadCSVPyarrow._read_block,
+                self._dataset_info["fs"],
+                path,
+                offset,
+                length,
+                compression,
+                offset == 0 and self._has_header,
+                self._parse_options,
+            ),
+            self.columns,
+            self._dtypes(self.columns),
+            self.dtype_backend,
+            self.pyarrow_strings_enabled,
+        )
+        if self._series:
+            return (operator.getitem, task, self.columns[0])
+        return task
+
+    @staticmethod
+    def _read_block(fs, path, offset, length, compression, skip_header, options):
+        with fs.open(path, "rb", compression=compression) as f:
+            if length is None:
+                data = f.read()
+            else:
+                data = read_block(f, offset, length, delimiter=b"\n")
+        schema = options["column_types"]
+        include_columns = options["include_columns"]
+        schema = pa.schema([schema.field(name) for name in include_columns])
+        if not data.strip():
+            return schema.empty_table()
+        try:
+            return pa_csv.read_csv(
+                BytesIO(data),
+                read_options=pa_csv.ReadOptions(
+                    column_names=options["column_names"],
+                    skip_rows=int(skip_header),
+                ),
+                parse_options=pa_csv.ParseOptions(
+                    delimiter=options["delimiter"], quote_char=options["quote_char"]
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types=options["column_types"],
+                    include_columns=include_columns,
+                    **_CONVERT_OPTIONS,
+                ),
+            )
+        except pa.ArrowInvalid:
+            # Typically values that don't match the types inferred from the
+            # sample, pandas is more lenient, e.g. it reads "1.0" as an integer.
+            # Strings and dates are read as text and parsed by pyarrow
+            text_schema = pa.schema(
+                [
+                    field.with_type(pa.string())
+                    if pa.types.is_string(field.type)
+                    or pa.types.is_temporal(field.type)
+                    else field
+                    for field in schema
+                ]
+            )
+            df = pd.read_csv(
+                BytesIO(data),
+                sep=options["delimiter"],
+                quotechar=options["quote_char"],
+                header=None,
+                names=options["column_names"],
+                skiprows=int(skip_header),
+                usecols=include_columns,
+                dtype={
+                    field.name: str
+                    for field in text_schema
+                    if pa.types.is_string(field.type)
+                },
+            )
+        try:
+            table = pa.Table.from_pandas(df, schema=text_schema, preserve_index=False)
+            return table.cast(schema)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as err:
+            raise ValueError(
+                f"Failed to parse {path} with the dtypes that were inferred from "
+                "the beginning of the first file. Specify the dtypes of the "
+                "affected columns with the ``dtype`` keyword."
+            ) from err
+
+    @staticmethod
+    def _table_to_pandas(
+        table, columns, dtypes, dtype_backend, pyarrow_strings_enabled
+    ):
+        from dask_expr.io.parquet import _determine_type_mapper
+
+        if dtype_backend is None:
+            for name, column in zip(columns, table.columns):
+                if (
+                    name not in dtypes
+                    and column.null_count
+                    and (
+                        pa.types.is_integer(column.type)
+                        or pa.types.is_boolean(column.type)
+                    )
+                ):
+                    # pandas would change the dtype of the partition
+                    raise ValueError(
+                        f"Column {name!r} has missing values, but was inferred as "
+                        f"{column.type} from the beginning of the first file. "
+                        "Specify its dtype with the ``dtype`` keyword."
+                    )
+        if dtype_backend == "pyarrow":
+            # Like pandas, strings are read as ``ArrowDtype`` as well
+            types_mapper = pd.ArrowDtype
+        else:
+            # Like pandas, only strings are converted to pyarrow, dates are
+            # read as objects
+            types_mapper = _determine_type_mapper(
+                user_types_mapper=(
+                    {pa.string(): pd.StringDtype("pyarrow")}.get
+                    if pyarrow_strings_enabled
+                    else None
+                ),
+                dtype_backend=dtype_backend,
+                pyarrow_strings_enabled=False,
+            )
+        df = table.to_pandas(types_mapper=types_mapper, ignore_metadata=True)
+        df.columns = columns
+        if dtypes:
+            df = df.astype(dtypes)
+        return df
+
+
 def to_csv(
     df,
     filename,
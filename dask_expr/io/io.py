@@ -4,13 +4,14 @@ import functools
 import math
 import operator
 
+import dask
 import numpy as np
 import pyarrow as pa
 from dask.dataframe import methods
 from dask.dataframe._pyarrow import to_pyarrow_string
 from dask.dataframe.core import apply_and_enforce, is_dataframe_like, make_meta
 from dask.dataframe.io.io import _meta_from_array, sorted_division_locations
-from dask.utils import apply, funcname, is_series_like
+from dask.utils import apply, funcname, is_series_like, parse_bytes
 
 from dask_expr._expr import (
     Blockwise,
@@ -27,9 +28,18 @@ from dask_expr._util import _BackendData, _convert_to_list, _tokenize_determinis
 
 
 class IO(Expr):
+    # ``(columns, npartitions)`` if partition ``i`` holds exactly the rows
+    # that ``AssignPartitioningIndex`` maps to ``i`` when hashing ``columns``
+    _bucketing = None
+
     def __str__(self):
         return f"{type(self).__name__}({self._name[-7:]})"
 
+    def _reduction_from_metadata(self, reduction, column):
+        """The result of ``reduction`` over ``column`` if known without
+        reading any data, otherwise ``None``"""
+        return None
+
 
 class FromGraph(IO):
     """A DataFrame created from an opaque Dask task graph
@@ -62,6 +72,12 @@ class FromGraph(IO):
         return dsk
 
 
+# Size of the partitions that FusedIO combines small partitions into
+_DEFAULT_FUSED_PARTITION_SIZE = "128 MiB"
+# Maximum number of partitions that FusedIO reads in one task
+_MAX_FUSED_PARTITIONS = 100
+
+
 class BlockwiseIO(Blockwise, IO):
     _absorb_projections = False
 
@@ -69,6 +85,11 @@ class BlockwiseIO(Blockwise, IO):
     def _fusion_compression_factor(self):
         return 1
 
+    def _partition_sizes(self):
+        """Estimated in-memory size in bytes of every partition in
+        ``_partitions``, or None if unknown"""
+        return None
+
     def _simplify_up(self, parent, dependents):
         if (
             self._absorb_projections
@@ -125,7 +146,7 @@ class FusedIO(BlockwiseIO):
         if new_divisions[0] is None:
             new_divisions.append(None)
         else:
-            new_divisions.append(self._fusion_buckets[-1][-1])
+            new_divisions.append(divisions[self._fusion_buckets[-1][-1] + 1])
         return tuple(new_divisions)
 
     def _task(self, index: int):
@@ -135,11 +156,22 @@ class FusedIO(BlockwiseIO):
 
     @functools.cached_property
     def _fusion_buckets(self):
-        partitions = self.operand("_expr")._partitions
+        expr = self.operand("_expr")
+        partitions = expr._partitions
         npartitions = len(partitions)
+        # Keep enough partitions for parallelism, even if they are small
+        max_partitions = min(math.ceil(math.sqrt(npartitions)), _MAX_FUSED_PARTITIONS)
+
+        sizes = expr._partition_sizes()
+        if sizes is not None:
+            target = parse_bytes(
+                dask.config.get("dataframe.io.fused-partition-size", None)
+                or _DEFAULT_FUSED_PARTITION_SIZE
+            )
+            return _greedy_buckets(partitions, sizes, target, max_partitions)
 
-        step = math.ceil(1 / self.operand("_expr")._fusion_compression_factor)
-        step = min(step, math.ceil(math.sqrt(npartitions)), 100)
+        step = math.ceil(1 / expr._fusion_compression_factor)
+        step = min(step, max_partitions)
 
         buckets = [partitions[i : i + step] for i in range(0, npartitions, step)]
         return buckets
@@ -148,6 +180,23 @@ class FusedIO(BlockwiseIO):
         return
 
 
+def _greedy_buckets(partitions, sizes, target, max_partitions):
+    """Group consecutive partitions into buckets of up to ``target`` bytes
+
+    A partition that is larger than ``target`` on its own gets its own bucket.
+    """
+    buckets, bucket, nbytes = [], [], 0
+    for partition, size in zip(partitions, sizes):
+        if bucket and (nbytes + size > target or len(bucket) == max_partitions):
+            buckets.append(bucket)
+            bucket, nbytes = [], 0
+        bucket.append(partition)
+        nbytes += size
+    if bucket:
+        buckets.append(bucket)
+    return buckets
+
+
 class FusedParquetIO(FusedIO):
     _parameters = ["_expr"]
 
@@ -160,12 +209,7 @@ class FusedParquetIO(FusedIO):
         )
 
     @staticmethod
-    def _load_multiple_files(
-        frag_filters,
-        columns,
-        schema,
-        *to_pandas_args,
-    ):
+    def _load_table(frag_filters, columns, schema):
         from dask_expr.io.parquet import ReadParquetPyarrowFS
 
         tables = (
@@ -174,23 +218,38 @@ class FusedParquetIO(FusedIO):
                 filter,
                 columns,
                 schema,
+                prefetch,
             )
-            for frag, filter in frag_filters
+            for frag, filter, prefetch in frag_filters
         )
-        table = pa.concat_tables(tables, promote_options="permissive")
+        return pa.concat_tables(tables, promote_options="permissive")
+
+    @staticmethod
+    def _load_multiple_files(
+        frag_filters,
+        columns,
+        schema,
+        *to_pandas_args,
+    ):
+        from dask_expr.io.parquet import ReadParquetPyarrowFS
+
+        table = FusedParquetIO._load_table(frag_filters, columns, schema)
         return ReadParquetPyarrowFS._table_to_pandas(table, *to_pandas_args)
 
-    def _task(self, index: int):
+    def _bucket_args(self, index: int):
         expr = self.operand("_expr")
         bucket = self._fusion_buckets[index]
         fragments_filters = []
         assert bucket
-        to_pandas_args = ()
         for i in bucket:
-            _, frag_to_table, *to_pandas_args = expr._filtered_task(i)
-            fragments_filters.append((frag_to_table[1], frag_to_table[2]))
-            columns = frag_to_table[3]
-            schema = frag_to_table[4]
+            args = expr._fragment_read_args(i)
+            fragments_filters.append((args.fragment, args.filters, args.prefetch))
+            columns = args.columns
+            schema = args.schema
+        return fragments_filters, columns, schema, expr._to_pandas_args
+
+    def _task(self, index: int):
+        fragments_filters, columns, schema, to_pandas_args = self._bucket_args(index)
         return (
             self._load_multiple_files,
             fragments_filters,
@@ -199,6 +258,18 @@ class FusedParquetIO(FusedIO):
             *to_pandas_args,
         )
 
+    @property
+    def _arrow_partitions(self):
+        return self.operand("_expr")._arrow_partitions
+
+    @property
+    def _arrow_meta(self):
+        return self.operand("_expr")._arrow_meta
+
+    def _arrow_task(self, index: int):
+        fragments_filters, columns, schema, _ = self._bucket_args(index)
+        return (self._load_table, fragments_filters, columns, schema)
+
 
 class FromMap(PartitionsFiltered, BlockwiseIO):
     _parameters = [
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 import itertools
+import json
 import operator
 import os
 import pickle
@@ -9,7 +10,7 @@ import statistics
 import warnings
 import weakref
 from abc import abstractmethod
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 from functools import cached_property, partial
 
 import dask
@@ -22,6 +23,13 @@ import pyarrow.parquet as pq
 import tlz as toolz
 from dask.base import normalize_token, tokenize
 from dask.core import flatten
+from dask.dataframe import methods
+from dask.dataframe.core import safe_head
+from dask.dataframe.io.parquet.arrow import (
+    ArrowDatasetEngine,
+    _append_row_groups,
+    _index_in_schema,
+)
 from dask.dataframe.io.parquet.core import (
     ParquetFunctionWrapper,
     ToParquetFunctionWrapper,
@@ -47,18 +55,24 @@ from dask_expr._expr import (
     NE,
     And,
     Blockwise,
+    BlockwiseHead,
     Expr,
     Filter,
+    Head,
     Index,
     Lengths,
     Literal,
     Or,
     Projection,
     determine_column_projection,
+    lower_arrow_partitions,
 )
-from dask_expr._reductions import Len
-from dask_expr._util import _convert_to_list, _tokenize_deterministic
+from dask_expr._reductions import Count, Len, Max, Min
+from dask_expr._shuffle import _is_numeric_cast_type
+from dask_expr._util import LRU, _convert_to_list, _tokenize_deterministic
 from dask_expr.io import BlockwiseIO, PartitionsFiltered
+from dask_expr.io._metadata_cache import get_metadata_cache
+from dask_expr.io._prefetch import get_prefetcher, prefetch_config
 from dask_expr.io.io import FusedParquetIO
 
 
@@ -85,7 +99,12 @@ def _maybe_adjust_cpu_count():
         _CPU_COUNT_SET = True
 
 
-_STATS_CACHE = {}
+_STATS_CACHE_SIZE = 100_000
+# Schema metadata key of the spec of bucketed datasets
+_BUCKETING_KEY = b"dask_bucketing"
+# Row group size of streaming writes, measured in memory
+_DEFAULT_ROW_GROUP_BYTES = parse_bytes("128 MiB")
+_STATS_CACHE = LRU(_STATS_CACHE_SIZE)
 
 
 PYARROW_NULLABLE_DTYPE_MAPPING = {
@@ -112,12 +131,20 @@ _cached_plan = {}
 class FragmentWrapper:
     _filesystems = weakref.WeakValueDictionary()
 
-    def __init__(self, fragment=None, file_size=None, fragment_packed=None) -> None:
-        """Wrap a pyarrow Fragment to only deserialize when needed."""
+    def __init__(
+        self, fragment=None, file_size=None, fragment_packed=None, row_groups=None
+    ) -> None:
+        """Wrap a pyarrow Fragment to only deserialize when needed.
+
+        ``row_groups`` are the ids of the row groups a fragment is restricted
+        to, which can't be read back from the fragment without reading its
+        footer.
+        """
         # https://github.com/apache/arrow/issues/40279
         self._fragment = fragment
         self._fragment_packed = fragment_packed
         self._file_size = file_size
+        self._row_groups = row_groups
         self._fs = None
 
     def pack(self):
@@ -132,6 +159,7 @@ class FragmentWrapper:
                 pickle.dumps(self._fragment.filesystem),
                 self._fragment.partition_expression,
                 self._file_size,
+                self._row_groups,
             )
         self._fs = self._fragment = None
 
@@ -143,6 +171,7 @@ class FragmentWrapper:
                 fs_raw,
                 partition_expression,
                 file_size,
+                row_groups,
             ) = self._fragment_packed
             fs = FragmentWrapper._filesystems.get(fs_raw)
             if fs is None:
@@ -156,6 +185,7 @@ class FragmentWrapper:
                 filesystem=fs,
                 partition_expression=partition_expression,
                 file_size=file_size,
+                row_groups=row_groups,
             )
         self._fragment_packed = None
 
@@ -170,6 +200,7 @@ class FragmentWrapper:
                 self.fragment,
                 self._fragment_packed,
                 self._file_size,
+                self._row_groups,
             )
         )
 
@@ -238,7 +269,15 @@ class ToParquet(Expr):
         "write_metadata_file",
         "name_function",
         "write_kwargs",
+        "target_file_size",
+        "target_row_group_size",
+        "partitions_per_writer",
     ]
+    _defaults = {
+        "target_file_size": None,
+        "target_row_group_size": None,
+        "partitions_per_writer": 1,
+    }
 
     @property
     def _meta(self):
@@ -248,16 +287,37 @@ class ToParquet(Expr):
         return (None, None)
 
     def _lower(self):
+        frame = self.frame
+        if self._write_arrow:
+            frame = lower_arrow_partitions(frame)
+        if self.target_file_size is not None:
+            data = ToParquetStreamData
+        elif self._write_arrow:
+            data = ToParquetArrowData
+        else:
+            data = ToParquetData
         return ToParquetBarrier(
-            ToParquetData(
-                *self.operands,
+            data(
+                frame,
+                *self.operands[1:],
             ),
             *self.operands[1:],
         )
 
+    @property
+    def _write_arrow(self):
+        """Whether partitions can be written without converting to pandas"""
+        return (
+            self.frame._arrow_partitions
+            and self.engine is ArrowDatasetEngine
+            and not self.partition_on
+            and isinstance(self.write_kwargs.get("schema"), pa.Schema)
+        )
+
 
 class ToParquetData(Blockwise):
     _parameters = ToParquet._parameters
+    _defaults = ToParquet._defaults
 
     @property
     def io_func(self):
@@ -279,8 +339,313 @@ class ToParquetData(Blockwise):
         return (self.io_func, (self.frame._name, index), (index,))
 
 
+class ToParquetArrowData(ToParquetData):
+    """Write partitions that stay ``pyarrow.Table`` from the input on
+
+    The tasks of the input expressions are inlined through
+    ``Expr._arrow_task``, so only the expressions they refer to, like
+    shuffles, are dependencies.
+    """
+
+    @cached_property
+    def io_func(self):
+        return _ToParquetArrowFunctionWrapper(
+            self.engine,
+            self.path,
+            self.fs,
+            self.partition_on,
+            self.write_metadata_file,
+            self.offset,
+            self.name_function,
+            _arrow_write_kwargs(self.frame, self.write_kwargs),
+        )
+
+    def dependencies(self):
+        return self.frame._arrow_dependencies()
+
+    def _task(self, index: int):
+        return (self.io_func, self.frame._arrow_task(index), (index,))
+
+
+def _arrow_write_kwargs(frame, write_kwargs):
+    # The pandas metadata is what converting the partitions would produce
+    write_kwargs = write_kwargs.copy()
+    meta = frame._arrow_meta
+    index_cols = write_kwargs.get("index_cols")
+    preserve_index = _index_in_schema(index_cols, write_kwargs["schema"])
+    if preserve_index:
+        meta = meta.set_index(index_cols)
+    write_kwargs["schema"] = pa.Table.from_pandas(
+        meta, preserve_index=preserve_index, schema=write_kwargs["schema"]
+    ).schema
+    return write_kwargs
+
+
+class ToParquetStreamData(ToParquetData):
+    """Stream consecutive partitions into files of a target size
+
+    Every task writes ``partitions_per_writer`` consecutive partitions
+    through a ``pyarrow.parquet.ParquetWriter``. Rows are buffered into row
+    groups of ``target_row_group_size`` bytes in memory, and a new file is
+    started once the current one reached ``target_file_size`` bytes, so the
+    size of the output files doesn't follow the size of the partitions.
+    """
+
+    _write_arrow = ToParquet._write_arrow
+
+    @cached_property
+    def _buckets(self):
+        step = self.partitions_per_writer
+        n = self.frame.npartitions
+        return [range(i, min(i + step, n)) for i in range(0, n, step)]
+
+    @cached_property
+    def io_func(self):
+        write_kwargs = self.write_kwargs
+        if self._write_arrow:
+            write_kwargs = _arrow_write_kwargs(self.frame, write_kwargs)
+        return _ToParquetStreamFunctionWrapper(
+            self.engine,
+            self.path,
+            self.fs,
+            self.partition_on,
+            self.write_metadata_file,
+            self.offset,
+            self.name_function,
+            write_kwargs,
+            target_file_size=self.target_file_size,
+            target_row_group_size=self.target_row_group_size,
+            arrow=self._write_arrow,
+        )
+
+    def dependencies(self):
+        # Arrow partitions are produced by inlined tasks
+        if self._write_arrow:
+            return self.frame._arrow_dependencies()
+        return [self.frame]
+
+    def _divisions(self):
+        return (None,) * (len(self._buckets) + 1)
+
+    def _task(self, index: int):
+        if self._write_arrow:
+            parts = [self.frame._arrow_task(i) for i in self._buckets[index]]
+        else:
+            parts = [(self.frame._name, i) for i in self._buckets[index]]
+        return (self.io_func, parts, (index,))
+
+
+class _ToParquetArrowFunctionWrapper(ToParquetFunctionWrapper):
+    def __call__(self, table, block_index: tuple[int]):
+        part_i = block_index[0]
+        filename = (
+            f"part.{part_i + self.i_offset}.parquet"
+            if self.name_function is None
+            else self.name_function(part_i + self.i_offset)
+        )
+        return _write_arrow_partition(
+            table,
+            self.path,
+            self.fs,
+            filename,
+            self.write_metadata_file,
+            **(dict(self.kwargs_pass, head=True) if part_i == 0 else self.kwargs_pass),
+        )
+
+
+def _write_arrow_partition(
+    table,
+    path,
+    fs,
+    filename,
+    return_metadata,
+    schema,
+    fmd=None,
+    compression=None,
+    index_cols=None,
+    head=False,
+    custom_metadata=None,
+    **kwargs,
+):
+    # Mirrors ArrowDatasetEngine.write_partition for a pyarrow Table
+    table = table.select(schema.names).cast(schema)
+    metadata = schema.metadata
+    if custom_metadata:
+        metadata = {**metadata, **custom_metadata}
+    table = table.replace_schema_metadata(metadata)
+    md_list = []
+    with fs.open(fs.sep.join([path, filename]), "wb") as fil:
+        pq.write_table(
+            table,
+            fil,
+            compression=compression,
+            metadata_collector=md_list if return_metadata else None,
+            **kwargs,
+        )
+    if not return_metadata:
+        return []
+    md_list[0].set_file_path(filename)
+    d = {"meta": md_list[0]}
+    if head:
+        d["schema"] = table.schema
+    return [d]
+
+
+class _ToParquetStreamFunctionWrapper(ToParquetFunctionWrapper):
+    def __init__(self, *args, target_file_size, target_row_group_size, arrow, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.target_file_size = target_file_size
+        self.target_row_group_size = target_row_group_size
+        self.arrow = arrow
+
+    def __dask_tokenize__(self):
+        return (
+            super().__dask_tokenize__(),
+            self.target_file_size,
+            self.target_row_group_size,
+            self.arrow,
+        )
+
+    def _to_table(self, part, schema, index_cols):
+        if self.arrow:
+            return part.select(schema.names).cast(schema)
+        preserve_index = _index_in_schema(index_cols, schema)
+        if preserve_index:
+            part = part.set_index(index_cols)
+        return self.engine._pandas_to_arrow_table(
+            part, preserve_index=preserve_index, schema=schema
+        )
+
+    def __call__(self, parts, block_index: tuple[int]):
+        task_i = block_index[0]
+        kwargs = self.kwargs_pass.copy()
+        schema = kwargs.pop("schema", None)
+        index_cols = kwargs.pop("index_cols", None)
+        custom_metadata = kwargs.pop("custom_metadata", None)
+        kwargs.pop("fmd", None)
+        row_group_bytes = self.target_row_group_size or min(
+            self.target_file_size, _DEFAULT_ROW_GROUP_BYTES
+        )
+        writer = _RollingParquetWriter(
+            self.path,
+            self.fs,
+            f"part.{task_i + self.i_offset}.{{}}.parquet",
+            self.target_file_size,
+            row_group_bytes,
+            **kwargs,
+        )
+        for part in parts:
+            table = self._to_table(part, schema, index_cols)
+            if custom_metadata:
+                table = table.replace_schema_metadata(
+                    {**(table.schema.metadata or {}), **custom_metadata}
+                )
+            writer.write(table)
+        # The first task always writes a file, the schema is taken from it
+        file_metadata = writer.close(force=task_i == 0)
+        if not self.write_metadata_file:
+            return []
+        d = {"meta": None}
+        for md in file_metadata:
+            if d["meta"] is None:
+                d["meta"] = md
+            else:
+                _append_row_groups(d["meta"], md)
+        if task_i == 0:
+            d["schema"] = writer.schema
+        return [d]
+
+
+class _RollingParquetWriter:
+    """Write a stream of tables into files of about ``target_file_size`` bytes
+
+    Rows are buffered until a row group of ``row_group_bytes`` (measured in
+    memory) is complete, unless ``row_group_size`` fixes the number of rows.
+    Files are named by formatting ``basename`` with their number.
+    """
+
+    def __init__(
+        self,
+        path,
+        fs,
+        basename,
+        target_file_size,
+        row_group_bytes,
+        row_group_size=None,
+        **kwargs,
+    ):
+        self.path = path
+        self.fs = fs
+        self.basename = basename
+        self.target_file_size = target_file_size
+        self.row_group_bytes = row_group_bytes
+        self.row_group_size = row_group_size
+        self.kwargs = kwargs
+        self.schema = None
+        self.metadata = []
+        self._pending = []
+        self._npending = 0
+        self._file = None
+        self._writer = None
+
+    def write(self, table):
+        if self.schema is None:
+            self.schema = table.schema
+        else:
+            table = table.cast(self.schema)
+        if self.row_group_size is None and table.num_rows:
+            row_nbytes = max(table.nbytes, 1) / table.num_rows
+            self.row_group_size = max(int(self.row_group_bytes / row_nbytes), 1)
+        self._pending.append(table)
+        self._npending += table.num_rows
+        while self.row_group_size and self._npending >= self.row_group_size:
+            self._write_row_group(self.row_group_size)
+
+    def _write_row_group(self, nrows):
+        table = pa.concat_tables(self._pending)
+        self._pending = [table.slice(nrows)]
+        self._npending = table.num_rows - nrows
+        if self._writer is None:
+            self._open()
+        self._writer.write_table(table.slice(0, nrows), row_group_size=nrows)
+        if self._file.tell() >= self.target_file_size:
+            self._close_file()
+
+    def _open(self):
+        filename = self.basename.format(len(self.metadata))
+        self._file = self.fs.open(self.fs.sep.join([self.path, filename]), "wb")
+        self._writer = pq.ParquetWriter(
+            self._file,
+            self.schema,
+            metadata_collector=self.metadata,
+            **self.kwargs,
+        )
+        self._filename = filename
+
+    def _close_file(self):
+        self._writer.close()
+        self._file.close()
+        self.metadata[-1].set_file_path(self._filename)
+        self._writer = self._file = None
+
+    def close(self, force=False) -> list:
+        """Flush the buffered rows and return the metadata of all files
+
+        With ``force``, an empty file is written if there were no rows.
+        """
+        if self._npending:
+            self._write_row_group(self._npending)
+        elif force and not self.metadata and self._writer is None:
+            self._open()
+            self._writer.write_table(self.schema.empty_table())
+        if self._writer is not None:
+            self._close_file()
+        return self.metadata
+
+
 class ToParquetBarrier(Expr):
     _parameters = ToParquet._parameters
+    _defaults = ToParquet._defaults
 
     @property
     def _meta(self):
@@ -328,6 +693,11 @@ def to_parquet(
     name_function=None,
     filesystem=None,
     engine=None,
+    target_file_size=None,
+    target_row_group_size=None,
+    partitions_per_writer=1,
+    bucket_by=None,
+    num_buckets=None,
     **kwargs,
 ):
     from dask_expr._collection import new_collection
@@ -352,6 +722,53 @@ def to_parquet(
     if isinstance(engine, str):
         engine = get_engine(engine)
 
+    # With a target file size, consecutive partitions are streamed into
+    # files of that size instead of writing one file per partition
+    if target_file_size is not None:
+        if not (isinstance(engine, type) and issubclass(engine, ArrowDatasetEngine)):
+            raise ValueError("target_file_size requires the pyarrow engine")
+        if partition_on:
+            raise ValueError("target_file_size can't be combined with partition_on")
+        if name_function is not None:
+            raise ValueError("target_file_size can't be combined with name_function")
+        if partitions_per_writer < 1:
+            raise ValueError("partitions_per_writer must be at least 1")
+        target_file_size = parse_bytes(target_file_size)
+        if target_row_group_size is not None:
+            target_row_group_size = parse_bytes(target_row_group_size)
+    elif target_row_group_size is not None or partitions_per_writer != 1:
+        raise ValueError(
+            "target_row_group_size and partitions_per_writer require target_file_size"
+        )
+
+    # Bucketing hash-partitions the rows like the shuffle of a merge or
+    # groupby by the same columns, so that reading the dataset back with
+    # that partitioning can skip the shuffle
+    bucketing = None
+    if bucket_by is not None:
+        bucket_by = _convert_to_list(bucket_by)
+        if set(bucket_by) - set(df.columns):
+            raise ValueError(
+                f"Bucketing by non-existent columns {bucket_by}. "
+                f"columns={list(df.columns)}"
+            )
+        if not isinstance(num_buckets, int) or num_buckets < 1:
+            raise ValueError("bucket_by requires a positive number of num_buckets")
+        if partition_on or append or name_function or target_file_size:
+            raise ValueError(
+                "bucket_by can't be combined with partition_on, append, "
+                "name_function or target_file_size"
+            )
+        bucketing = {
+            "columns": bucket_by,
+            "num_buckets": num_buckets,
+            "dtypes": [str(df._meta[col].dtype) for col in bucket_by],
+        }
+        df = df.shuffle(bucket_by, npartitions=num_buckets)
+        name_function = _bucket_filename
+    elif num_buckets is not None:
+        raise ValueError("num_buckets requires bucket_by")
+
     if hasattr(path, "name"):
         path = stringify_path(path)
 
@@ -396,6 +813,8 @@ def to_parquet(
         # Clear read_parquet caches in case we are
         # also reading from the overwritten path
         _cached_plan.clear()
+        if (cache := get_metadata_cache()) is not None:
+            cache.invalidate_listing(path)
 
     # Always skip divisions checks if divisions are unknown
     if not df.known_divisions:
@@ -456,6 +875,11 @@ def to_parquet(
             "and overwriting the corresponding value can render the "
             "entire dataset unreadable."
         )
+    if bucketing is not None:
+        custom_metadata = {
+            **(custom_metadata or {}),
+            _BUCKETING_KEY: json.dumps(bucketing).encode(),
+        }
 
     # Engine-specific initialization steps to write the dataset.
     # Possibly create parquet metadata, and load existing stuff if appending
@@ -473,10 +897,17 @@ def to_parquet(
         **kwargs,
     )
 
+    if bucketing is not None:
+        for i in range(num_buckets):
+            fs.mkdirs(fs.sep.join([path, _bucket_dirname(i)]), exist_ok=True)
+
     # By default we only write a metadata file when appending if one already
     # exists
     if append and write_metadata_file is None:
         write_metadata_file = metadata_file_exists
+    # The statistics of the streamed files make reading divisions back cheap
+    if target_file_size is not None and write_metadata_file is None:
+        write_metadata_file = True
 
     # Check that custom name_function is valid,
     # and that it will produce unique names
@@ -514,6 +945,9 @@ def to_parquet(
                     {"compression": compression, "custom_metadata": custom_metadata},
                     extra_write_kwargs,
                 ),
+                target_file_size,
+                target_row_group_size,
+                partitions_per_writer,
             )
         )
 
@@ -524,10 +958,50 @@ def to_parquet(
     # We do this before returning, even if `compute=False`. This helps ensure
     # that reading files that were just written succeeds.
     fs.invalidate_cache(path)
+    if (cache := get_metadata_cache()) is not None:
+        cache.invalidate_listing(path)
 
     return out
 
 
+def _bucket_dirname(i):
+    return f"bucket-{i:05d}"
+
+
+def _bucket_filename(i):
+    return f"{_bucket_dirname(i)}/part.0.parquet"
+
+
+def _bucket_of_path(path):
+    # The bucket of a file written by ``_bucket_filename``, or None
+    dirname = path.replace("\\", "/").split("/")[-2:-1]
+    if not dirname or not dirname[0].startswith("bucket-"):
+        return None
+    try:
+        return int(dirname[0][len("bucket-") :])
+    except ValueError:
+        return None
+
+
+def _bucket_spec(schema, meta):
+    """``(columns, num_buckets)`` recorded in the metadata of a bucketed dataset
+
+    Numeric columns are hashed as floats, so the spec is only valid if the
+    columns are still numeric, or still not numeric, when read back.
+    """
+    raw = (schema.metadata or {}).get(_BUCKETING_KEY)
+    if raw is None:
+        return None
+    spec = json.loads(raw)
+    columns = spec["columns"]
+    for col, dtype in zip(columns, spec["dtypes"]):
+        if col not in meta.columns or _is_numeric_cast_type(
+            meta[col].dtype
+        ) != _is_numeric_cast_type(pd.api.types.pandas_dtype(dtype)):
+            return None
+    return columns, spec["num_buckets"]
+
+
 def _determine_type_mapper(
     *, user_types_mapper, dtype_backend, pyarrow_strings_enabled
 ):
@@ -664,9 +1138,28 @@ class ReadParquet(PartitionsFiltered, BlockwiseIO):
     def _divisions(self):
         raise NotImplementedError
 
+    @cached_property
+    def _bucketing(self):
+        spec = _bucket_spec(
+            self._dataset_info["schema"], self._dataset_info["base_meta"]
+        )
+        if spec is None or self._filtered:
+            return None
+        paths = self._partition_paths()
+        if paths is None or len(paths) != spec[1]:
+            # Some buckets were filtered out or split up
+            return None
+        if any(_bucket_of_path(path) != i for i, path in enumerate(paths)):
+            return None
+        return spec
+
+    def _partition_paths(self):
+        """The file that every partition reads, or None"""
+        return None
+
     @property
     def _fusion_compression_factor(self):
-        if self.operand("columns") is None:
+        if self.operand("columns") is None or self._bucketing is not None:
             return 1
         nr_original_columns = len(self._dataset_info["schema"].names) - 1
         return max(
@@ -674,6 +1167,22 @@ class ReadParquet(PartitionsFiltered, BlockwiseIO):
         )
 
 
+# Arguments of ``ReadParquetPyarrowFS._fragment_to_table``
+_FragmentReadArgs = namedtuple(
+    "_FragmentReadArgs", ["fragment", "filters", "columns", "schema", "prefetch"]
+)
+
+
+def _columns_to_read(columns, filters):
+    """The columns that a read with ``filters`` needs, or None for all"""
+    if columns is None or (filters is not None and not isinstance(filters, list)):
+        return None
+    columns = set(columns)
+    for predicate in flatten(filters or [], container=list):
+        columns.add(predicate[0])
+    return columns
+
+
 class ReadParquetPyarrowFS(ReadParquet):
     _parameters = [
         "path",
@@ -688,6 +1197,8 @@ class ReadParquetPyarrowFS(ReadParquet):
         "arrow_to_pandas",
         "pyarrow_strings_enabled",
         "kwargs",
+        "split_row_groups",
+        "blocksize",
         "_partitions",
         "_series",
         "_dataset_info_cache",
@@ -704,6 +1215,8 @@ class ReadParquetPyarrowFS(ReadParquet):
         "arrow_to_pandas": None,
         "pyarrow_strings_enabled": True,
         "kwargs": None,
+        "split_row_groups": "infer",
+        "blocksize": "default",
         "_partitions": None,
         "_series": False,
         "_dataset_info_cache": None,
@@ -770,22 +1283,46 @@ class ReadParquetPyarrowFS(ReadParquet):
         """
         idxs = self.sample_statistics()
         files_to_consider = np.array(self._dataset_info["all_files"])[idxs]
-        stats = [_STATS_CACHE[tokenize(finfo)] for finfo in files_to_consider]
-        return _combine_stats(stats)
+        fragments = [self._dataset_info["fragments"][i] for i in idxs]
+        return _combine_stats(self.load_statistics(files_to_consider, fragments))
 
     def load_statistics(self, files=None, fragments=None):
+        """Statistics of the given files, reading the ones that aren't cached
+
+        Statistics are looked up in the in-memory cache first, then in the
+        on-disk metadata cache if one is configured, see
+        ``dask_expr.io._metadata_cache``.
+        """
         if files is None:
             files = self._dataset_info["all_files"]
         if fragments is None:
             fragments = self.fragments_unsorted
+        tokens = [tokenize(finfo) for finfo in files]
+        found = {token: _STATS_CACHE.get(token) for token in tokens}
+        found = {token: stats for token, stats in found.items() if stats is not None}
+        cache = get_metadata_cache()
+        if cache is not None and len(found) < len(tokens):
+            missing = [f for f, t in zip(files, tokens) if t not in found]
+            for finfo, stats in cache.get_statistics(missing).items():
+                found[tokenize(finfo)] = _STATS_CACHE[tokenize(finfo)] = stats
+
+        to_collect = [
+            (token, frag)
+            for token, frag in zip(tokens, fragments)
+            if token not in found
+        ]
         # Collecting code samples is actually a little expensive (~100ms) and
         # we'd like this thing to be as low overhead as possible
         with dask.config.set({"distributed.diagnostics.computations.nframes": 0}):
-            token_stats = flatten(
-                dask.compute(_collect_statistics_plan(files, fragments))
-            )
+            token_stats = flatten(dask.compute(_collect_statistics_plan(to_collect)))
+        collected = {}
         for token, stats in token_stats:
-            _STATS_CACHE[token] = stats
+            found[token] = _STATS_CACHE[token] = collected[token] = stats
+        if cache is not None and collected:
+            cache.set_statistics(
+                {f: collected[t] for f, t in zip(files, tokens) if t in collected}
+            )
+        return [found[token] for token in tokens]
 
     def sample_statistics(self, n=3):
         """Sample statistics from the dataset.
@@ -801,7 +1338,9 @@ class ReadParquetPyarrowFS(ReadParquet):
         ixs: list[int]
             The indices of files that were sampled
         """
-        frags = self.fragments_unsorted
+        # Filters may have removed fragments, only all of them line up with
+        # the files
+        frags = self._dataset_info["fragments"]
         finfos = np.array(self._dataset_info["all_files"])
         getsize = np.frompyfunc(lambda x: x.size, nin=1, nout=1)
         finfo_size_arr = getsize(finfos)
@@ -825,10 +1364,7 @@ class ReadParquetPyarrowFS(ReadParquet):
         The statistics do not include all the metadata that is stored in the
         file but only a subset. See also `_extract_stats`.
         """
-        self.load_statistics()
-        return [
-            _STATS_CACHE[tokenize(finfo)] for finfo in self._dataset_info["all_files"]
-        ]
+        return self.load_statistics()
 
     @cached_property
     def aggregated_statistics(self):
@@ -843,8 +1379,87 @@ class ReadParquetPyarrowFS(ReadParquet):
     def _get_lengths(self):
         # TODO: Filters that only filter partition_expr can be used as well
         if not self.filters:
+            if self._row_group_partitions is not None:
+                return tuple(
+                    stats["num_rows"] for stats in self._row_group_partitions[2]
+                )
             return tuple(stats["num_rows"] for stats in self.aggregated_statistics)
 
+    @cached_property
+    def _blocksize(self):
+        blocksize = self.blocksize
+        if blocksize == "default":
+            blocksize = "256 MiB"
+        return parse_bytes(blocksize) if isinstance(blocksize, str) else blocksize
+
+    @cached_property
+    def _split_row_groups(self):
+        """Whether partitions are made of row groups rather than whole files
+
+        By default, files are only split if one of them is larger than
+        ``blocksize`` on disk. This is decided from the file listing, so that
+        small files don't require reading the statistics of every file.
+        """
+        if self._dataset_info["using_metadata_file"]:
+            return False
+        split_row_groups = self.split_row_groups
+        if split_row_groups == "infer":
+            return bool(self._blocksize) and any(
+                finfo.size > self._blocksize
+                for finfo in self._dataset_info["all_files"]
+            )
+        return bool(split_row_groups)
+
+    @cached_property
+    def _row_group_partitions(self):
+        """Fragments, row group ids and statistics of every partition
+
+        Row groups whose statistics rule out the filters are dropped and the
+        remaining row groups of a file are merged up to
+        ``blocksize`` bytes of uncompressed data, or to ``split_row_groups``
+        row groups if that is an integer. Row groups of different files are
+        never merged. ``None`` if files aren't split.
+        """
+        if not self._split_row_groups:
+            return None
+        stats_by_path = {
+            finfo.path: stats
+            for finfo, stats in zip(
+                self._dataset_info["all_files"], self.raw_statistics
+            )
+        }
+        fragments, row_groups, statistics = [], [], []
+        for fragment in self.fragments_unsorted:
+            file_stats = stats_by_path[fragment.path]
+            rg_stats = file_stats["row_groups"]
+            rg_ids = _filter_row_groups(rg_stats, self.filters)
+            for ids in _merge_row_groups(
+                rg_ids, rg_stats, self.split_row_groups, self._blocksize
+            ):
+                fragments.append(fragment)
+                row_groups.append(ids)
+                statistics.append(
+                    {**file_stats, "row_groups": [rg_stats[i] for i in ids]}
+                )
+        if not fragments:
+            # Every row group was pruned, read nothing from the first file
+            fragments, row_groups = self.fragments_unsorted[:1], [[]]
+            statistics = [{**stats_by_path[fragments[0].path], "row_groups": []}]
+        fragments = [
+            fragment.format.make_fragment(
+                fragment.path,
+                filesystem=fragment.filesystem,
+                partition_expression=fragment.partition_expression,
+                row_groups=ids,
+            )
+            for fragment, ids in zip(fragments, row_groups)
+        ]
+        return (
+            _array_of(fragments),
+            _array_of(row_groups),
+            _aggregate_statistics_to_file(statistics),
+        )
+
     @cached_property
     def _dataset_info(self):
         if rv := self.operand("_dataset_info_cache"):
@@ -856,18 +1471,25 @@ class ReadParquetPyarrowFS(ReadParquet):
         # most common case. Only if this fails, we'll treat it as a file. This
         # way, the happy path performs one remote request instead of two if we
         # were to check the type of the path first.
+        cache = get_metadata_cache()
+        all_files = None
+        if cache is not None:
+            all_files = cache.get_listing(self.fs.type_name, path_normalized)
         try:
             # At this point we will post a listbucket request which includes the
             # same data as a HEAD request. The information included here (see
             # pyarrow FileInfo) are size, type, path and modified since
             # timestamps This isn't free but realtively cheap (200-300ms or less
             # for ~1k files)
-            dataset_selector = pa_fs.FileSelector(path_normalized, recursive=True)
-            all_files = [
-                finfo
-                for finfo in self.fs.get_file_info(dataset_selector)
-                if finfo.type == pa.fs.FileType.File
-            ]
+            if all_files is None:
+                dataset_selector = pa_fs.FileSelector(path_normalized, recursive=True)
+                all_files = [
+                    finfo
+                    for finfo in self.fs.get_file_info(dataset_selector)
+                    if finfo.type == pa.fs.FileType.File
+                ]
+                if cache is not None:
+                    cache.set_listing(self.fs.type_name, path_normalized, all_files)
         except (NotADirectoryError, FileNotFoundError):
             all_files = [self.fs.get_file_info(path_normalized)]
         # TODO: At this point we could verify if we're dealing with a very
@@ -932,7 +1554,13 @@ class ReadParquetPyarrowFS(ReadParquet):
         """
         if self.calculate_divisions and self.index is not None:
             index_name = self.index.name
-            return _divisions_from_statistics(self.aggregated_statistics, index_name)
+            if self._row_group_partitions is not None:
+                statistics = self._row_group_partitions[2]
+            else:
+                statistics = self.aggregated_statistics
+            return _divisions_from_statistics(statistics, index_name)
+        if self._row_group_partitions is not None:
+            return tuple([None] * (len(self._row_group_partitions[0]) + 1)), None
         return tuple([None] * (len(self.fragments_unsorted) + 1)), None
 
     def all_statistics_known(self) -> bool:
@@ -942,11 +1570,113 @@ class ReadParquetPyarrowFS(ReadParquet):
         )
 
     def _fragment_sort_index(self):
-        return self._division_from_stats[1]
+        sort_index = self._division_from_stats[1]
+        if sort_index is None and self._bucket_sort_index is not None:
+            return self._bucket_sort_index
+        return sort_index
+
+    @cached_property
+    def _bucket_sort_index(self):
+        # Files are listed in no particular order, but partition ``i`` has
+        # to hold bucket ``i``
+        if (
+            _bucket_spec(self._dataset_info["schema"], self._dataset_info["base_meta"])
+            is None
+        ):
+            return None
+        if self._row_group_partitions is not None:
+            fragments = self._row_group_partitions[0]
+        else:
+            fragments = self.fragments_unsorted
+        keys = [natural_sort_key(frag.path) for frag in fragments]
+        return np.array(sorted(range(len(keys)), key=keys.__getitem__), dtype=int)
+
+    def _partition_paths(self):
+        if self._row_group_partitions is not None:
+            return None
+        return [frag.path for frag in self.fragments]
 
     def _divisions(self):
         return self._division_from_stats[0]
 
+    def _simplify_up(self, parent, dependents):
+        if isinstance(parent, Head) and not isinstance(parent, BlockwiseHead):
+            # Limit pushdown
+            npartitions = parent.operand("npartitions")
+            if npartitions > self.npartitions:
+                # Head._lower raises
+                return
+            partitions = list(self._partitions)
+            if npartitions > -1:
+                partitions = partitions[:npartitions]
+            operands = {
+                param: self.operand(param)
+                for param in self._parameters
+                if param != "_partitions"
+            }
+            return ReadParquetPyarrowFSHead(
+                **operands,
+                n=parent.n,
+                head_partitions=partitions,
+                safe=npartitions not in (-1, self.npartitions),
+            )
+        if isinstance(parent, Len) and self.filters:
+            # Partition filters drop whole files, see _exact_statistics
+            stats = self._exact_statistics
+            if stats is not None:
+                return Literal(sum(file_stats["num_rows"] for file_stats in stats))
+        return super()._simplify_up(parent, dependents)
+
+    @cached_property
+    def _exact_statistics(self):
+        """Statistics of the files if all of their rows are read, or ``None``
+
+        Filters that only reference partition columns drop whole files, the
+        statistics of the remaining files are still exact.
+        """
+        dataset_info = self._dataset_info
+        if self._filtered or dataset_info["using_metadata_file"]:
+            return None
+        if self.filters:
+            partitioning = getattr(dataset_info["dataset"], "partitioning", None)
+            if partitioning is None:
+                return None
+            filters = self.filters
+            if isinstance(filters[0], tuple):
+                filters = [filters]
+            filter_columns = {col for conj in filters for col, _, _ in conj}
+            if not filter_columns <= set(partitioning.schema.names):
+                return None
+        fragments = self.fragments_unsorted
+        finfos = {finfo.path: finfo for finfo in dataset_info["all_files"]}
+        return self.load_statistics(
+            [finfos[fragment.path] for fragment in fragments], fragments
+        )
+
+    def _reduction_from_metadata(self, reduction, column):
+        schema = self._dataset_info["schema"]
+        if not isinstance(reduction, (Max, Min, Count)) or column not in schema.names:
+            return None
+        if isinstance(reduction, (Max, Min)) and not reduction.skipna:
+            return None
+        if isinstance(reduction, Count) and pa.types.is_floating(
+            schema.field(column).type
+        ):
+            # NaN is a value in parquet, only nulls are counted
+            return None
+        stats = self._exact_statistics
+        if stats is None:
+            return None
+        column_stats = _aggregate_column_statistics(stats, column)
+        if column_stats is None:
+            return None
+        count, minimum, maximum = column_stats
+        if isinstance(reduction, Count):
+            return np.int64(count)
+        value = minimum if isinstance(reduction, Min) else maximum
+        dtype = self._dataset_info["base_meta"][column].dtype
+        return _statistics_to_scalar(value, dtype)
+
     def _tune_up(self, parent):
         if self._fusion_compression_factor >= 1:
             return
@@ -963,9 +1693,23 @@ class ReadParquetPyarrowFS(ReadParquet):
         --------
         ReadParquetPyarrowFS.fragments_unsorted
         """
+        if self._row_group_partitions is not None:
+            fragments = self._row_group_partitions[0]
+        else:
+            fragments = self.fragments_unsorted
         if self._fragment_sort_index() is not None:
-            return self.fragments_unsorted[self._fragment_sort_index()]
-        return self.fragments_unsorted
+            return fragments[self._fragment_sort_index()]
+        return fragments
+
+    @cached_property
+    def _fragment_row_groups(self):
+        """Row group ids of every partition, in the same order as ``fragments``"""
+        if self._row_group_partitions is None:
+            return [None] * len(self.fragments)
+        row_groups = self._row_group_partitions[1]
+        if self._fragment_sort_index() is not None:
+            return row_groups[self._fragment_sort_index()]
+        return row_groups
 
     @property
     def fragments_unsorted(self):
@@ -989,7 +1733,7 @@ class ReadParquetPyarrowFS(ReadParquet):
 
     @property
     def _fusion_compression_factor(self):
-        if self.operand("columns") is None:
+        if self.operand("columns") is None or self._bucketing is not None:
             return 1
         approx_stats = self.approx_statistics()
         total_uncompressed = 0
@@ -1002,7 +1746,48 @@ class ReadParquetPyarrowFS(ReadParquet):
 
         return max(after_projection / total_uncompressed, 0.001)
 
-    def _filtered_task(self, index: int):
+    def _partition_sizes(self):
+        """Uncompressed size of the projected columns of every partition
+
+        Partitions made of row groups know their sizes from the statistics
+        that split them. The size of a whole file is estimated from its size
+        on disk and the ratio of projected uncompressed to compressed bytes
+        of the sampled files in ``approx_statistics``.
+        """
+        if self._dataset_info["using_metadata_file"]:
+            return None
+        columns = set(self.columns) | {self._meta.index.name}
+
+        def projected(stats, key):
+            return sum(
+                col[key]
+                for col in stats["columns"]
+                if col["path_in_schema"].split(".")[0] in columns
+            )
+
+        if self._row_group_partitions is not None:
+            statistics = self._row_group_partitions[2]
+            if self._fragment_sort_index() is not None:
+                statistics = [statistics[i] for i in self._fragment_sort_index()]
+            sizes = [
+                projected(stats, "total_uncompressed_size") for stats in statistics
+            ]
+        else:
+            approx_stats = self.approx_statistics()
+            compressed = sum(
+                col["total_compressed_size"] for col in approx_stats["columns"]
+            )
+            ratio = projected(approx_stats, "total_uncompressed_size") / max(
+                compressed, 1
+            )
+            file_sizes = {
+                finfo.path: finfo.size for finfo in self._dataset_info["all_files"]
+            }
+            sizes = [file_sizes[frag.path] * ratio for frag in self.fragments]
+        return [sizes[i] for i in self._partitions]
+
+    def _fragment_read_args(self, index: int):
+        """The arguments of ``_fragment_to_table`` for partition ``index``"""
         columns = self.columns.copy()
         index_name = self.index.name
         if self.index is not None:
@@ -1012,28 +1797,106 @@ class ReadParquetPyarrowFS(ReadParquet):
             if columns is None:
                 columns = list(schema.names)
             columns.append(index_name)
-        return (
-            ReadParquetPyarrowFS._table_to_pandas,
-            (
-                ReadParquetPyarrowFS._fragment_to_table,
-                FragmentWrapper(self.fragments[index]),
-                self.filters,
-                columns,
-                schema,
+        prefetch = None
+        n_prefetch, prefetch_bytes = prefetch_config()
+        if n_prefetch:
+            start = max(index - n_prefetch, 0)
+            stop = index + 1 + n_prefetch
+            # Neighbours are passed as paths and row groups, not fragments,
+            # to keep the tasks small
+            neighbours = [
+                (fragment.path, row_groups)
+                for fragment, row_groups in zip(
+                    self.fragments[start:stop], self._fragment_row_groups[start:stop]
+                )
+            ]
+            prefetch = (
+                self._name,
+                index,
+                neighbours[: index - start][::-1],
+                neighbours[index - start + 1 :],
+                prefetch_bytes,
+            )
+        return _FragmentReadArgs(
+            FragmentWrapper(
+                self.fragments[index],
+                row_groups=self._fragment_row_groups[index],
             ),
+            self.filters,
+            columns,
+            schema,
+            prefetch,
+        )
+
+    @property
+    def _to_pandas_args(self):
+        """The arguments of ``_table_to_pandas`` after the table"""
+        index_name = self.index.name if self.index is not None else None
+        return (
             index_name,
             self.arrow_to_pandas,
             self.kwargs.get("dtype_backend"),
             self.pyarrow_strings_enabled,
         )
 
+    def _filtered_task(self, index: int):
+        return (
+            ReadParquetPyarrowFS._table_to_pandas,
+            (ReadParquetPyarrowFS._fragment_to_table, *self._fragment_read_args(index)),
+            *self._to_pandas_args,
+        )
+
+    @property
+    def _arrow_partitions(self):
+        # See _filtered_task, partitions only get an index if it's named
+        return self._meta.ndim == 2 and self._meta.index.name is None
+
+    def _arrow_task(self, index: int):
+        args = self._fragment_read_args(self._partitions[index])
+        return (ReadParquetPyarrowFS._fragment_to_table, *args)
+
+    @cached_property
+    def _arrow_meta(self):
+        schema = self._dataset_info["schema"].remove_metadata()
+        return self._table_to_pandas(
+            schema.empty_table().select(self.columns),
+            None,
+            self.arrow_to_pandas,
+            self.kwargs.get("dtype_backend"),
+            self.pyarrow_strings_enabled,
+        )
+
     @staticmethod
-    def _fragment_to_table(fragment_wrapper, filters, columns, schema):
+    def _fragment_to_table(fragment_wrapper, filters, columns, schema, prefetch=None):
         _maybe_adjust_cpu_count()
         if isinstance(fragment_wrapper, FragmentWrapper):
             fragment = fragment_wrapper.fragment
         else:
             fragment = fragment_wrapper
+        if prefetch is not None:
+            # See dask_expr.io._prefetch
+            name, index, preceding, following, prefetch_bytes = prefetch
+            row_groups = getattr(fragment_wrapper, "_row_groups", None)
+            read_columns = _columns_to_read(columns, filters)
+            prefetcher = get_prefetcher()
+            file = prefetcher.take(
+                fragment.filesystem, fragment.path, row_groups, read_columns
+            )
+            prefetcher.prefetch(
+                name,
+                index,
+                preceding,
+                following,
+                fragment.filesystem,
+                read_columns,
+                prefetch_bytes,
+            )
+            if file is not None:
+                fragment = fragment.format.make_fragment(
+                    pa.PythonFile(file, mode="r"),
+                    partition_expression=fragment.partition_expression,
+                    row_groups=row_groups,
+                )
         if isinstance(filters, list):
             filters = pq.filters_to_expression(filters)
         return fragment.to_table(
@@ -1085,6 +1948,124 @@ class ReadParquetPyarrowFS(ReadParquet):
         return df
 
 
+class ReadParquetPyarrowFSHead(ReadParquetPyarrowFS):
+    """The first ``n`` rows of some partitions of a parquet dataset
+
+    This is what ``Head`` becomes on top of ``ReadParquetPyarrowFS``. Instead
+    of reading the partitions of ``head_partitions`` in full, a single task
+    reads their row groups in order and stops as soon as it found ``n`` rows.
+    Without filters, the row counts in the footers tell up front how many row
+    groups are needed.
+    """
+
+    _parameters = [
+        p
+        for p in ReadParquetPyarrowFS._parameters
+        if p not in ("_partitions", "_series", "_dataset_info_cache")
+    ] + [
+        "n",
+        "head_partitions",
+        "safe",
+        "_partitions",
+        "_series",
+        "_dataset_info_cache",
+    ]
+    _defaults = {**ReadParquetPyarrowFS._defaults, "n": 5, "safe": True}
+    _filter_passthrough = False
+
+    def _simplify_up(self, parent, dependents):
+        if isinstance(parent, Head) and not isinstance(parent, BlockwiseHead):
+            if parent.operand("npartitions") in (1, -1):
+                return self.substitute_parameters({"n": min(self.n, parent.n)})
+            return
+        return ReadParquet._simplify_up(self, parent, dependents)
+
+    def _tune_up(self, parent):
+        return
+
+    def _get_lengths(self):
+        return None
+
+    @property
+    def _arrow_partitions(self):
+        return False
+
+    def _divisions(self):
+        divisions = super()._divisions()
+        first, last = self.head_partitions[0], self.head_partitions[-1]
+        return divisions[first], divisions[last + 1]
+
+    def _filtered_task(self, index: int):
+        fragment_wrappers = [
+            FragmentWrapper(self.fragments[i], row_groups=self._fragment_row_groups[i])
+            for i in self.head_partitions
+        ]
+        args = self._fragment_read_args(self.head_partitions[0])
+        task = (
+            ReadParquetPyarrowFSHead._tables_to_pandas,
+            (
+                ReadParquetPyarrowFSHead._head_to_tables,
+                fragment_wrappers,
+                args.filters,
+                args.columns,
+                args.schema,
+                self.n,
+            ),
+            *self._to_pandas_args,
+        )
+        if self.safe:
+            return (safe_head, task, self.n)
+        return task
+
+    @staticmethod
+    def _head_to_tables(fragment_wrappers, filters, columns, schema, n):
+        """The first ``n`` rows as one table per fragment that was read"""
+        _maybe_adjust_cpu_count()
+        if isinstance(filters, list):
+            filters = pq.filters_to_expression(filters)
+        tables = []
+        nrows = 0
+        for fragment_wrapper in fragment_wrappers:
+            fragment = fragment_wrapper.fragment
+            fragment.ensure_complete_metadata()
+            if filters is None:
+                # Read just enough row groups at once
+                row_groups, needed = [], n - nrows
+                for row_group in fragment.row_groups:
+                    if needed <= 0:
+                        break
+                    row_groups.append(row_group.id)
+                    needed -= row_group.num_rows
+                subsets = [row_groups]
+            else:
+                # The number of matching rows is only known after reading
+                subsets = [[row_group.id] for row_group in fragment.row_groups]
+            fragment_tables = []
+            for row_groups in subsets:
+                table = fragment.subset(row_group_ids=row_groups).to_table(
+                    schema=schema, columns=columns, filter=filters
+                )
+                fragment_tables.append(table.slice(0, n - nrows))
+                nrows += fragment_tables[-1].num_rows
+                if nrows >= n:
+                    break
+            if fragment_tables:
+                tables.append(pa.concat_tables(fragment_tables))
+            if nrows >= n:
+                break
+        return tables or [schema.empty_table().select(columns)]
+
+    @staticmethod
+    def _tables_to_pandas(tables, *to_pandas_args):
+        # Convert file by file, so that the index matches that of a full read
+        return methods.concat(
+            [
+                ReadParquetPyarrowFS._table_to_pandas(table, *to_pandas_args)
+                for table in tables
+            ]
+        )
+
+
 class ReadParquetFSSpec(ReadParquet):
     """Read a parquet dataset"""
 
@@ -1244,6 +2225,18 @@ class ReadParquetFSSpec(ReadParquet):
         ] = dataset_info
         return dataset_info
 
+    def _partition_paths(self):
+        if self._plan["empty"]:
+            return None
+        paths = []
+        for part in self._plan["parts"]:
+            piece = part["piece"]
+            if not isinstance(piece, tuple) or piece[1] is not None:
+                # Aggregated files or row groups of a file
+                return None
+            paths.append(piece[0])
+        return paths
+
     def _filtered_task(self, index: int):
         tsk = (self._io_func, self._plan["parts"][index])
         if self._series:
@@ -1695,6 +2688,54 @@ def _divisions_from_statistics(aggregated_stats, index_name):
     return tuple(divisions), argsort
 
 
+def _array_of(objects):
+    # np.array would turn lists into a 2D array
+    result = np.empty(len(objects), dtype=object)
+    result[:] = objects
+    return result
+
+
+def _filter_row_groups(rg_stats, filters):
+    """Ids of the row groups whose statistics don't rule out ``filters``"""
+    ids = list(range(len(rg_stats)))
+    if not filters:
+        return ids
+    statistics = [
+        {
+            "columns": [
+                {"name": col["path_in_schema"], **col["statistics"]}
+                for col in rg["columns"]
+                if col["statistics"].get("min") is not None
+                or col["statistics"].get("null_count")
+            ]
+        }
+        for rg in rg_stats
+    ]
+    try:
+        ids, _ = apply_filters(ids, statistics, filters)
+    except TypeError:
+        # Statistics that can't be compared with the filter values
+        pass
+    return sorted(ids)
+
+
+def _merge_row_groups(ids, rg_stats, split_row_groups, blocksize):
+    """Merge neighbouring row groups of a file into partitions"""
+    if split_row_groups is not True and isinstance(split_row_groups, int):
+        return [list(chunk) for chunk in toolz.partition_all(split_row_groups, ids)]
+    partitions = []
+    size = 0
+    for i in ids:
+        rg_size = rg_stats[i]["total_byte_size"]
+        if partitions and blocksize and size + rg_size <= blocksize:
+            partitions[-1].append(i)
+            size += rg_size
+        else:
+            partitions.append([i])
+            size = rg_size
+    return partitions
+
+
 def _extract_stats(original):
     """Take the raw file statistics as returned by pyarrow (as a dict) and
     filter it to what we care about. The full stats are a bit too verbose and we
@@ -1736,12 +2777,72 @@ def _extract_stats(original):
             for name in col_meta:
                 col_out[name] = col[name]
             col_out["statistics"] = {}
+            # Columns may be written without statistics
+            col_stats_in = col["statistics"] or {}
             for name in col_stats:
-                col_out["statistics"][name] = col["statistics"][name]
+                col_out["statistics"][name] = col_stats_in.get(name)
 
     return out
 
 
+def _aggregate_column_statistics(stats, column):
+    """Number of non-null values, minimum and maximum of a column
+
+    Returns ``None`` if a row group lacks statistics for the column. The
+    minimum and maximum are ``None`` if unknown or if there are no values.
+    """
+    count = 0
+    minimum = maximum = None
+    minmax_known = True
+    for file_stats in stats:
+        for rg in file_stats["row_groups"]:
+            for col in rg["columns"]:
+                if col["path_in_schema"] == column:
+                    break
+            else:
+                return None
+            col_stats = col["statistics"]
+            if col_stats["null_count"] is None:
+                return None
+            nvalues = rg["num_rows"] - col_stats["null_count"]
+            count += nvalues
+            if not nvalues:
+                continue
+            if col_stats["min"] is None or col_stats["max"] is None:
+                minmax_known = False
+            elif minmax_known:
+                if minimum is None or col_stats["min"] < minimum:
+                    minimum = col_stats["min"]
+                if maximum is None or col_stats["max"] > maximum:
+                    maximum = col_stats["max"]
+    if not minmax_known:
+        minimum = maximum = None
+    return count, minimum, maximum
+
+
+def _statistics_to_scalar(value, dtype):
+    """Convert a statistics value to what pandas returns, if it's exact
+
+    Minimum and maximum of strings and binary columns may be truncated by
+    the writer, they are only trusted for numbers and timestamps.
+    """
+    if value is None:
+        return None
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        value = pd.Timestamp(value)
+        if value.tz is None:
+            return None
+        return value.tz_convert(dtype.tz)
+    if not isinstance(dtype, np.dtype):
+        return None
+    if dtype.kind == "M":
+        value = pd.Timestamp(value)
+        return value if value.tz is None else None
+    if dtype.kind in "iufb":
+        return dtype.type(value)
+    return None
+
+
 def _agg_dicts(dicts, agg_funcs):
     result = {}
     for d in dicts:
@@ -1812,13 +2913,8 @@ def _gather_statistics(frags):
     )[0]
 
 
-def _collect_statistics_plan(file_infos, fragments):
-    """Collect statistics for a list of files and their corresponding fragments"""
-
-    to_collect = []
-    for finfo, frag in zip(file_infos, fragments):
-        if (token := tokenize(finfo)) not in _STATS_CACHE:
-            to_collect.append((token, frag))
+def _collect_statistics_plan(to_collect):
+    """Collect statistics for a list of file tokens and their fragments"""
     return [
         _gather_statistics(batch)
         for batch in toolz.itertoolz.partition_all(20, to_collect)
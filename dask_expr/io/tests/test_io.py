@@ -22,7 +22,8 @@ from dask_expr import (
     read_parquet,
 )
 from dask_expr._expr import Expr, Replace
-from dask_expr.io import FromArray, FromMap, ReadCSV, ReadParquet, parquet
+from dask_expr.io import FromArray, FromMap, ReadCSV, ReadParquet, csv, parquet
+from dask_expr.io.csv import ReadCSVPyarrow
 from dask_expr.tests._util import _backend_library
 
 # Set DataFrame backend for this module
@@ -121,6 +122,89 @@ def test_read_csv_keywords(tmpdir):
     assert_eq(df, expected)
 
 
+def test_read_csv_pyarrow(tmpdir):
+    pdf = pd.DataFrame(
+        {
+            "a": range(1000),
+            "b": np.arange(1000) / 7,
+            "c": [f"x{i}" for i in range(1000)],
+            "d": [True, False] * 500,
+        }
+    )
+    pdf.iloc[:600].to_csv(tmpdir / "0.csv", index=False)
+    pdf.iloc[600:].to_csv(tmpdir / "1.csv", index=False)
+    path = str(tmpdir / "*.csv")
+
+    df = read_csv(path, engine="pyarrow", blocksize=4000)
+    assert isinstance(df.expr, ReadCSVPyarrow)
+    assert df.npartitions > 2
+    expected = pd.concat(
+        [pd.read_csv(tmpdir / f"{i}.csv", engine="pyarrow") for i in range(2)]
+    )
+    assert_eq(df, expected, check_index=False)
+
+    # Column selection is pushed into the parser
+    result = df[["c", "a"]].simplify()
+    assert isinstance(result.expr.frame, ReadCSVPyarrow)
+    assert result.expr.frame.columns == ["a", "c"]
+    assert_eq(result, expected[["c", "a"]], check_index=False)
+    assert_eq(df.b.sum(), expected.b.sum())
+    usecols = read_csv(path, engine="pyarrow", usecols=["c", "a"], blocksize=4000)
+    assert_eq(usecols, expected[["a", "c"]], check_index=False)
+
+    kwargs = {"engine": "pyarrow", "header": None, "dtype_backend": "pyarrow"}
+    df = read_csv(path, **kwargs)
+    assert_eq(df.partitions[0], pd.read_csv(tmpdir / "0.csv", **kwargs))
+    df = read_csv(path, engine="pyarrow", dtype={"a": "float64"}, blocksize=4000)
+    assert_eq(df, expected.astype({"a": "float64"}), check_index=False)
+
+    # Other keywords are handled by the legacy reader
+    assert isinstance(read_csv(path, engine="pyarrow", skiprows=1).expr, ReadCSV)
+
+
+def test_read_csv_pyarrow_fallback(tmpdir, monkeypatch):
+    # Only the first rows are used to infer the dtypes
+    monkeypatch.setattr(csv, "_SAMPLE_SIZE", 100)
+    fn = str(tmpdir / "data.csv")
+    with open(fn, "w") as f:
+        f.write("a,b\n" + "".join(f"{i},x\n" for i in range(1000)) + "5.0,y\n")
+    # pyarrow can't parse the last block as integers, pandas can
+    df = read_csv(fn, engine="pyarrow", blocksize=1000)
+    assert df.a.dtype == "int64"
+    result = df.compute()
+    assert result.a.dtype == "int64"
+    assert result.a.iloc[-1] == 5
+    assert len(result) == 1001
+
+    with open(fn, "a") as f:
+        f.write("a,z\n")
+    df = read_csv(fn, engine="pyarrow", blocksize=1000)
+    with pytest.raises(ValueError, match="dtype"):
+        df.compute()
+    df = read_csv(fn, engine="pyarrow", blocksize=1000, dtype={"a": "object"})
+    assert df.a.compute().iloc[-1] == "a"
+
+
+def test_read_csv_pyarrow_missing_values(tmpdir, monkeypatch):
+    monkeypatch.setattr(csv, "_SAMPLE_SIZE", 100)
+    fn = str(tmpdir / "data.csv")
+    rows = [
+        f"{i},{['x', '', 'NA', 'n/a'][i % 4]},2020-01-{i % 28 + 1:02d}\n"
+        for i in range(200)
+    ]
+    with open(fn, "w") as f:
+        # The last block is parsed by pandas
+        f.write("a,s,d\n" + "".join(rows) + "5.0,,\n")
+    df = read_csv(fn, engine="pyarrow", blocksize=1000)
+    assert df.npartitions > 2
+    expected = pd.read_csv(fn, engine="pyarrow")
+    result = df.compute()
+    assert result.s.isna().sum() == expected.s.isna().sum() == 151
+    assert result.d.dtype == expected.d.dtype == object
+    # pandas reads the whole file at once and gets floats for "5.0"
+    assert_eq(result, expected.astype({"a": "int64"}), check_index=False)
+
+
 def test_io_fusion_blockwise(tmpdir):
     pdf = pd.DataFrame({c: range(10) for c in "abcdefghijklmn"})
     dd.from_pandas(pdf, 3).to_parquet(tmpdir)
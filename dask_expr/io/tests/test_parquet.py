@@ -1,18 +1,34 @@
+import datetime
+import decimal
 import os
 import pickle
+import sqlite3
+import time
 
+import dask
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from dask.dataframe.utils import assert_eq
 from dask.utils import key_split
 from distributed.utils_test import gen_cluster
 from pyarrow import fs
 
-from dask_expr import from_graph, from_pandas, read_parquet
+from dask_expr import concat, from_graph, from_pandas, read_parquet
 from dask_expr._expr import Filter, Lengths, Literal
 from dask_expr._reductions import Len
+from dask_expr._shuffle import ArrowShuffle, Shuffle
 from dask_expr.io import FusedParquetIO, ReadParquet
+from dask_expr.io._metadata_cache import MetadataCache
+from dask_expr.io._prefetch import column_chunk_ranges, get_prefetcher
+from dask_expr.io.io import _greedy_buckets
 from dask_expr.io.parquet import (
+    _STATS_CACHE,
+    ReadParquetPyarrowFS,
+    ReadParquetPyarrowFSHead,
+    ToParquetArrowData,
     _aggregate_statistics_to_file,
     _combine_stats,
     _extract_stats,
@@ -283,6 +299,488 @@ def test_aggregate_rg_stats_to_file(tmpdir):
     )
 
 
+def test_pyarrow_filesystem_split_row_groups(tmpdir):
+    pdf = pd.DataFrame({"a": range(3000), "b": 1.5})
+    for i in range(3):
+        pdf.iloc[i * 1000 : (i + 1) * 1000].to_parquet(
+            os.path.join(str(tmpdir), f"part.{i}.parquet"),
+            index=False,
+            row_group_size=100,
+        )
+
+    df = read_parquet(tmpdir, filesystem="arrow")
+    assert df.npartitions == 3
+    df = read_parquet(tmpdir, filesystem="arrow", split_row_groups=3)
+    assert df.npartitions == 12
+    assert_eq(df, pdf, check_index=False)
+    assert len(df) == len(pdf)
+    df = read_parquet(tmpdir, filesystem="arrow", blocksize="1 kB")
+    assert df.npartitions == 30
+    assert_eq(df, pdf, check_index=False)
+
+    # Row groups that can't match the filters are pruned
+    filters = [[("a", ">=", 1450), ("a", "<", 1720)], [("a", "==", 2999)]]
+    df = read_parquet(
+        tmpdir, filesystem="arrow", filters=filters, split_row_groups=True
+    )
+    assert df.npartitions == 2
+    assert list(df.expr._fragment_row_groups) == [[4, 5, 6, 7], [9]]
+    expected = pdf[((pdf.a >= 1450) & (pdf.a < 1720)) | (pdf.a == 2999)]
+    assert_eq(df, expected, check_index=False)
+
+    df = read_parquet(tmpdir, filesystem="arrow", split_row_groups=True)
+    df = df[df.a > 5000].optimize()
+    assert df.npartitions == 1
+    assert len(df.compute()) == 0
+
+
+def test_pyarrow_filesystem_prefetch(tmpdir):
+    pdf = pd.DataFrame({"a": range(1000), "b": 1.5})
+    for i in range(5):
+        pdf.iloc[i * 200 : (i + 1) * 200].to_parquet(
+            os.path.join(str(tmpdir), f"part.{i}.parquet"), index=False
+        )
+
+    prefetcher = get_prefetcher()
+    prefetcher.clear()
+    hits = prefetcher.hits
+    with dask.config.set({"dataframe.parquet.prefetch": 2, "scheduler": "sync"}):
+        df = read_parquet(tmpdir, filesystem="arrow")
+        assert_eq(df, pdf, check_index=False)
+        assert prefetcher.hits > hits
+
+        # Files that don't fit into the budget are read as usual
+        prefetcher.clear()
+        hits = prefetcher.hits
+        with dask.config.set({"dataframe.parquet.prefetch-bytes": 1}):
+            assert_eq(df, pdf, check_index=False)
+        assert prefetcher.hits == hits
+        assert prefetcher.nbytes == 0
+
+        # Only the chunks of the projected columns are fetched
+        hits = prefetcher.hits
+        assert_eq(df[["a"]], pdf[["a"]], check_index=False)
+        assert prefetcher.hits > hits
+        assert_eq(df[df.b > 1].a, pdf.a, check_index=False)
+
+        # Row groups of split files are prefetched too
+        hits = prefetcher.hits
+        df = read_parquet(tmpdir, filesystem="arrow", split_row_groups=True)
+        assert_eq(df, pdf, check_index=False)
+        assert prefetcher.hits > hits
+
+    metadata = pq.read_metadata(os.path.join(str(tmpdir), "part.0.parquet"))
+    projected = column_chunk_ranges(metadata, columns=["a"])
+    assert sum(length for _, length in projected) < sum(
+        length for _, length in column_chunk_ranges(metadata)
+    )
+
+
+def test_pyarrow_filesystem_head(tmpdir):
+    pdf = pd.DataFrame({"a": range(3000), "b": 1.5})
+    for i in range(3):
+        pdf.iloc[i * 1000 : (i + 1) * 1000].to_parquet(
+            os.path.join(str(tmpdir), f"part.{i}.parquet"),
+            index=False,
+            row_group_size=100,
+        )
+    df = read_parquet(tmpdir, filesystem="arrow")
+    first = df.partitions[0].compute()
+
+    result = df.head(150, compute=False)
+    expr = result.optimize(fuse=False).expr
+    assert isinstance(expr, ReadParquetPyarrowFSHead)
+    assert expr.npartitions == 1
+    assert_eq(result, first.head(150))
+    assert_eq(df.a.head(3), first.a.head(3))
+    assert_eq(df.head(1500, npartitions=-1), df.compute().iloc[:1500])
+
+    with pytest.warns(UserWarning, match="Insufficient elements"):
+        assert len(df.head(1500)) == 1000
+
+    # Partitions are read until enough rows passed the filters
+    filtered = df[(df.a > 2950) | (df.a < 20)]
+    expected = filtered.compute()
+    assert_eq(filtered.head(60, npartitions=-1), expected.head(60))
+    assert isinstance(
+        filtered.head(60, npartitions=-1, compute=False).optimize().expr,
+        ReadParquetPyarrowFSHead,
+    )
+    assert len(df[df.a < 0].head(5, npartitions=-1)) == 0
+
+
+def test_pyarrow_filesystem_reductions_from_statistics(tmpdir):
+    pdf = pd.DataFrame(
+        {
+            "p": np.repeat([1, 2, 3], 10),
+            "x": np.arange(30),
+            "y": [1.5, np.nan] * 15,
+            "ts": pd.date_range("2020", periods=30),
+            "s": ["a", "b", None] * 10,
+        }
+    )
+    pdf.to_parquet(tmpdir, partition_cols=["p"], row_group_size=4)
+    df = read_parquet(tmpdir, filesystem="arrow")
+    expected = df.compute()
+
+    for col in ["x", "y", "ts"]:
+        for result in [df[col].max(), df[col].min()]:
+            assert isinstance(result.optimize(fuse=False).expr, Literal)
+        assert_eq(df[col].max(), expected[col].max())
+        assert_eq(df[col].min(), expected[col].min())
+    assert isinstance(df.x.count().optimize(fuse=False).expr, Literal)
+    assert_eq(df.s.count(), 20)
+    # Neither exact string statistics nor NaN counts are known
+    assert not isinstance(df.s.max().optimize(fuse=False).expr, Literal)
+    assert not isinstance(df.y.count().optimize(fuse=False).expr, Literal)
+    assert_eq(df.y.count(), 15)
+
+    # Filters on partition columns drop whole files
+    filtered = read_parquet(tmpdir, filesystem="arrow", filters=[("p", ">", 1)])
+    assert isinstance(filtered.x.min().optimize(fuse=False).expr, Literal)
+    assert filtered.x.min().compute() == 10
+    assert isinstance(filtered.x.size.optimize(fuse=False).expr, Literal)
+    assert len(filtered) == 20
+
+    filtered = read_parquet(tmpdir, filesystem="arrow", filters=[("x", ">", 5)])
+    assert not isinstance(filtered.x.min().optimize(fuse=False).expr, Literal)
+    assert filtered.x.min().compute() == 6
+
+
+@pytest.mark.parametrize("write_index", [True, False])
+def test_to_parquet_arrow_partitions(tmpdir, write_index):
+    pdf = pd.DataFrame({"a": range(100), "b": ["x", "y"] * 50, "c": np.arange(100) / 2})
+    pdf.to_parquet(tmpdir / "in", row_group_size=20)
+    df = read_parquet(tmpdir / "in", filesystem="arrow")
+    df = df[df.a > 5][["a", "b"]].rename(columns={"b": "B"}).reset_index()
+
+    out = df.to_parquet(tmpdir / "arrow", compute=False, write_index=write_index)
+    graph_exprs = list(out.optimize(fuse=False).expr.walk())
+    assert any(isinstance(e, ToParquetArrowData) for e in graph_exprs)
+    out.compute()
+    # Through pandas, since the partitions are converted before being written
+    df.map_partitions(lambda x: x).to_parquet(
+        tmpdir / "pandas", write_index=write_index
+    )
+
+    result = pd.read_parquet(tmpdir / "arrow")
+    assert_eq(result, pd.read_parquet(tmpdir / "pandas"))
+    assert_eq(read_parquet(tmpdir / "arrow"), df.compute(), check_index=False)
+    schema = pq.read_schema(tmpdir / "arrow" / "part.0.parquet")
+    expected = pq.read_schema(tmpdir / "pandas" / "part.0.parquet")
+    assert schema.equals(expected, check_metadata=True)
+
+
+def test_to_parquet_arrow_partitions_concat_astype(tmpdir):
+    pdf = pd.DataFrame({"a": range(100), "b": ["x", "y"] * 50, "c": np.arange(100)})
+    pdf.to_parquet(tmpdir / "in1.parquet", row_group_size=20)
+    pdf.astype({"a": "int32"}).to_parquet(tmpdir / "in2.parquet", row_group_size=50)
+    df1 = read_parquet(tmpdir / "in1.parquet", filesystem="arrow")
+    df2 = read_parquet(tmpdir / "in2.parquet", filesystem="arrow")
+    # Concatenating casts the second input to int64
+    df = concat([df1, df2]).astype({"c": "float32", "a": pd.ArrowDtype(pa.int32())})
+
+    out = df.to_parquet(tmpdir / "arrow", compute=False, write_index=False)
+    graph_exprs = list(out.optimize(fuse=False).expr.walk())
+    assert any(isinstance(e, ToParquetArrowData) for e in graph_exprs)
+    out.compute()
+    df.map_partitions(lambda x: x).to_parquet(tmpdir / "pandas", write_index=False)
+
+    result = pd.read_parquet(tmpdir / "arrow")
+    assert_eq(result, pd.read_parquet(tmpdir / "pandas"))
+    schema = pq.read_schema(tmpdir / "arrow" / "part.0.parquet")
+    expected = pq.read_schema(tmpdir / "pandas" / "part.0.parquet")
+    assert schema.equals(expected, check_metadata=True)
+
+    # Casts that behave differently in Arrow go through pandas
+    df = concat([df1, df2]).astype({"c": "str"})
+    out = df.to_parquet(tmpdir / "str", compute=False, write_index=False)
+    graph_exprs = list(out.optimize(fuse=False).expr.walk())
+    assert not any(isinstance(e, ToParquetArrowData) for e in graph_exprs)
+
+
+def test_to_parquet_arrow_partitions_shuffle(tmpdir):
+    pdf = pd.DataFrame({"a": range(100), "b": np.arange(100) % 7})
+    pdf.to_parquet(tmpdir / "in", row_group_size=20)
+    df = read_parquet(tmpdir / "in", filesystem="arrow", split_row_groups=True)
+    df = df.shuffle("b", npartitions=3, ignore_index=True)
+
+    out = df.to_parquet(tmpdir / "arrow", compute=False, write_index=False)
+    graph_exprs = list(out.optimize(fuse=False).expr.walk())
+    assert any(isinstance(e, ArrowShuffle) for e in graph_exprs)
+    out.compute()
+    df.map_partitions(lambda x: x).to_parquet(tmpdir / "pandas", write_index=False)
+
+    # Rows end up in the same files as when shuffling in pandas
+    for i in range(3):
+        result = pd.read_parquet(tmpdir / "arrow" / f"part.{i}.parquet")
+        expected = pd.read_parquet(tmpdir / "pandas" / f"part.{i}.parquet")
+        assert_eq(result.sort_values("a"), expected.sort_values("a"), check_index=False)
+    assert_eq(
+        read_parquet(tmpdir / "arrow"), pdf, check_index=False, check_divisions=False
+    )
+
+
+def test_to_parquet_target_file_size(tmpdir):
+    pdf = pd.DataFrame({"a": range(20_000), "b": np.arange(20_000) / 2})
+    df = from_pandas(pdf, npartitions=8)
+    df.to_parquet(
+        tmpdir,
+        target_file_size="100 kB",
+        target_row_group_size="50 kB",
+        partitions_per_writer=4,
+    )
+    files = sorted(f for f in os.listdir(tmpdir) if f.endswith(".parquet"))
+    assert len(files) > 2
+    assert {f.split(".")[1] for f in files} == {"0", "1"}
+    for f in files[:-1]:
+        md = pq.read_metadata(os.path.join(tmpdir, f))
+        assert md.num_row_groups > 1
+        assert md.num_rows < 10_000
+    assert "_metadata" in os.listdir(tmpdir)
+
+    result = read_parquet(tmpdir, calculate_divisions=True)
+    assert result.known_divisions
+    assert result.npartitions == len(files)
+    assert_eq(result, pdf)
+
+    # Arrow partitions are streamed without converting them to pandas
+    filtered = read_parquet(tmpdir, filesystem="arrow")
+    filtered = filtered[filtered.a >= 100]
+    filtered.to_parquet(tmpdir / "out", target_file_size="1 MiB", write_index=False)
+    assert_eq(read_parquet(tmpdir / "out"), pdf[pdf.a >= 100], check_index=False)
+
+    with pytest.raises(ValueError, match="partition_on"):
+        df.to_parquet(tmpdir / "error", target_file_size=100, partition_on="a")
+    with pytest.raises(ValueError, match="require target_file_size"):
+        df.to_parquet(tmpdir / "error", partitions_per_writer=2)
+
+
+def _count_shuffles(df):
+    return sum(isinstance(e, Shuffle) for e in df.optimize(fuse=False).expr.walk())
+
+
+@pytest.mark.parametrize("filesystem", ["arrow", "fsspec"])
+def test_to_parquet_bucket_by(tmpdir, filesystem):
+    rng = np.random.default_rng(42)
+    left = pd.DataFrame({"k": rng.integers(0, 100, 1000), "x": rng.random(1000)})
+    right = pd.DataFrame({"k": np.arange(100), "y": np.arange(100) * 2})
+    from_pandas(left, npartitions=5).to_parquet(
+        tmpdir / "left", bucket_by="k", num_buckets=4
+    )
+    from_pandas(right, npartitions=3).to_parquet(
+        tmpdir / "right", bucket_by=["k"], num_buckets=4
+    )
+    assert sorted(os.listdir(tmpdir / "left")) == [f"bucket-0000{i}" for i in range(4)]
+
+    lhs = read_parquet(tmpdir / "left", filesystem=filesystem)
+    rhs = read_parquet(tmpdir / "right", filesystem=filesystem)
+    assert lhs.expr._bucketing == (["k"], 4)
+    assert lhs.npartitions == 4
+
+    result = lhs.merge(rhs, on="k")
+    assert _count_shuffles(result) == 0
+    assert result.npartitions == 4
+    assert_eq(result, left.merge(right, on="k"), check_index=False)
+
+    filtered = lhs[lhs.x > 0.5].merge(rhs, on="k", how="left")
+    assert _count_shuffles(filtered) == 0
+    expected = left[left.x > 0.5].merge(right, on="k", how="left")
+    assert_eq(filtered, expected, check_index=False)
+
+    # Only the side that isn't bucketed is shuffled
+    other = from_pandas(right, npartitions=2)
+    result = lhs.merge(other, on="k")
+    assert _count_shuffles(result) == 1
+    assert_eq(result, left.merge(right, on="k"), check_index=False)
+
+    # Groups are contained in a single bucket
+    result = lhs.groupby("k").x.sum(split_out=True)
+    assert _count_shuffles(result) == 0
+    assert_eq(result, left.groupby("k").x.sum())
+
+    # Selecting partitions loses the bucketing
+    assert lhs.partitions[[0, 1]].optimize(fuse=False).expr._bucketing is None
+
+    with pytest.raises(ValueError, match="non-existent"):
+        from_pandas(left, npartitions=2).to_parquet(
+            tmpdir / "error", bucket_by="z", num_buckets=2
+        )
+    with pytest.raises(ValueError, match="num_buckets"):
+        from_pandas(left, npartitions=2).to_parquet(tmpdir / "error", bucket_by="k")
+
+
+def test_fused_io_buckets_by_size(tmpdir):
+    rows = [10] * 4 + [5000] + [10] * 6
+    pdfs = [
+        pd.DataFrame({"a": np.arange(n) + 10_000 * i, "b": 1.5, "c": "x"})
+        for i, n in enumerate(rows)
+    ]
+    for i, pdf in enumerate(pdfs):
+        pdf.to_parquet(tmpdir / f"part.{i:02d}.parquet", index=False)
+    df = read_parquet(tmpdir, filesystem="arrow")[["a", "b"]] + 1
+    with dask.config.set({"dataframe.io.fused-partition-size": "20 kB"}):
+        (fused,) = df.optimize(fuse=False).expr.find_operations(FusedParquetIO)
+        sizes = fused.operand("_expr")._partition_sizes()
+        large = int(np.argmax(sizes))
+        assert sizes[large] > 20_000
+        # The large file is read on its own, the small ones are combined
+        assert [large] in fused._fusion_buckets
+        assert 1 < fused.npartitions < len(rows) - 1
+        assert_eq(df, pd.concat(pdfs)[["a", "b"]] + 1, check_index=False)
+
+    # No more than sqrt(npartitions) partitions are fused, however small
+    df = read_parquet(tmpdir, filesystem="arrow")[["a"]] + 1
+    with dask.config.set({"dataframe.io.fused-partition-size": "1 GiB"}):
+        (fused,) = df.optimize(fuse=False).expr.find_operations(FusedParquetIO)
+        assert fused._fusion_buckets == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10]]
+        assert_eq(df, pd.concat(pdfs)[["a"]] + 1, check_index=False)
+
+    assert _greedy_buckets(range(5), [1, 2, 3, 9, 1], 5, 100) == [
+        [0, 1],
+        [2],
+        [3],
+        [4],
+    ]
+    assert _greedy_buckets(range(5), [1] * 5, 5, 2) == [[0, 1], [2, 3], [4]]
+
+
+def test_to_parquet_arrow_partitions_read_once(tmpdir, monkeypatch):
+    # The reader is inlined into the write tasks, blockwise fusion must not
+    # pull it into a fused task of its own
+    pdf = pd.DataFrame({"a": range(100), "b": ["x", "y"] * 50})
+    os.mkdir(tmpdir / "in")
+    for i in range(4):
+        pdf.iloc[i * 25 : (i + 1) * 25].to_parquet(
+            tmpdir / "in" / f"part.{i}.parquet", index=False
+        )
+    df = read_parquet(tmpdir / "in", filesystem="arrow")
+    df = df[["a", "b"]].rename(columns={"b": "B"})
+
+    calls = []
+    fragment_to_table = ReadParquetPyarrowFS._fragment_to_table
+
+    def counting_fragment_to_table(*args, **kwargs):
+        calls.append(args)
+        return fragment_to_table(*args, **kwargs)
+
+    monkeypatch.setattr(
+        ReadParquetPyarrowFS,
+        "_fragment_to_table",
+        staticmethod(counting_fragment_to_table),
+    )
+    with dask.config.set(scheduler="sync"):
+        df.to_parquet(tmpdir / "out", write_index=False)
+    # Every file is read exactly once
+    assert len(calls) == 4
+    result = pd.read_parquet(tmpdir / "out").sort_values("a")
+    assert_eq(result, pdf.rename(columns={"b": "B"}), check_index=False)
+
+
+def test_metadata_cache(tmpdir, monkeypatch):
+    path = str(tmpdir.mkdir("data"))
+    cache_dir = str(tmpdir.mkdir("cache"))
+    pdf = pd.DataFrame({"a": range(100)})
+    from_pandas(pdf, npartitions=4).to_parquet(path)
+
+    config = {
+        "dataframe.parquet.metadata-cache.directory": cache_dir,
+        "dataframe.parquet.metadata-cache.listing-ttl": 3600,
+    }
+    with dask.config.set(config):
+        df = read_parquet(path, filesystem="arrow")
+        expected = df.expr.raw_statistics
+        assert_eq(df, pdf, check_index=False)
+
+        # A new process starts with an empty in-memory cache. The listing is
+        # reused, so a file added behind its back isn't seen
+        _STATS_CACHE.clear()
+        pdf.to_parquet(os.path.join(path, "extra.parquet"))
+        df = read_parquet(path, filesystem="arrow")
+        assert len(df.expr._dataset_info["all_files"]) == 4
+        monkeypatch.setattr(
+            "dask_expr.io.parquet._collect_statistics_plan",
+            lambda to_collect: pytest.fail("statistics weren't cached"),
+        )
+        assert df.expr.raw_statistics == expected
+        monkeypatch.undo()
+
+        # Writing invalidates the listing
+        from_pandas(pdf, npartitions=2).to_parquet(path, overwrite=True)
+        df = read_parquet(path, filesystem="arrow")
+        assert len(df.expr._dataset_info["all_files"]) == 2
+        assert_eq(df, pdf, check_index=False)
+
+
+def test_metadata_cache_eviction(tmpdir, monkeypatch):
+    connect = sqlite3.connect
+    connections = []
+
+    def counting_connect(*args, **kwargs):
+        connections.append(args)
+        return connect(*args, **kwargs)
+
+    monkeypatch.setattr(sqlite3, "connect", counting_connect)
+    cache = MetadataCache(str(tmpdir), max_entries=2)
+    finfos = [
+        fs.FileInfo(f"f{i}", type=fs.FileType.File, size=i, mtime_ns=i)
+        for i in range(3)
+    ]
+    cache.set_statistics({finfos[0]: 0, finfos[1]: 1})
+    time.sleep(0.01)
+    assert cache.get_statistics(finfos[:1]) == {finfos[0]: 0}
+    cache.set_statistics({finfos[2]: 2})
+    assert cache.get_statistics(finfos) == {finfos[0]: 0, finfos[2]: 2}
+
+    # A modified file doesn't get stale statistics
+    modified = fs.FileInfo("f0", type=fs.FileType.File, size=0, mtime_ns=10)
+    assert cache.get_statistics([modified]) == {}
+    # Files without a modification time aren't cached
+    unknown = fs.FileInfo("f3", type=fs.FileType.File, size=3)
+    cache.set_statistics({unknown: 3})
+    assert cache.get_statistics([unknown]) == {}
+    # The database is opened once per process
+    assert len(connections) == 1
+
+
+def test_metadata_cache_typed_values(tmpdir):
+    cache = MetadataCache(str(tmpdir))
+    finfos = [
+        fs.FileInfo(f"f{i}", type=fs.FileType.File, size=i, mtime_ns=i)
+        for i in range(3)
+    ]
+    stats = {
+        "num_rows": 10,
+        "columns": [
+            {"min": pd.Timestamp("2020-01-01 00:00:00.000000001"), "max": None},
+            {"min": pd.Timestamp("2020-01-01", tz="Europe/Berlin"), "max": 1.5},
+            {"min": datetime.date(2020, 1, 1), "max": datetime.time(1, 2, 3)},
+            {"min": b"\x00a", "max": decimal.Decimal("1.10")},
+            {"min": "x", "max": float("nan")},
+        ],
+    }
+    cache.set_statistics({finfos[0]: stats, finfos[1]: {"min": object()}})
+    result = cache.get_statistics(finfos[:2])
+    # Values that can't be stored as data aren't cached
+    assert list(result) == [finfos[0]]
+    result = result[finfos[0]]
+    assert result["columns"][:4] == stats["columns"][:4]
+    assert result["columns"][1]["min"].tz is not None
+    assert np.isnan(result["columns"][4]["max"])
+
+    # Values are never unpickled
+    class Payload:
+        def __reduce__(self):
+            return pytest.fail, ("unpickled",)
+
+    with sqlite3.connect(cache.path) as connection:
+        connection.execute(
+            "INSERT INTO statistics VALUES (?, ?, ?, ?, ?)",
+            ("f2", 2, 2, pickle.dumps(Payload()), time.time()),
+        )
+    assert cache.get_statistics(finfos[2:]) == {}
+
+
 def test_aggregate_statistics_to_file():
     file_in = {
         "top-level-file-stat": "not-interested",
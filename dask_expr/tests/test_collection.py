@@ -11,6 +11,7 @@ import dask
 import dask.array as da
 import numpy as np
 import pytest
+from dask.core import get_dependencies
 from dask.dataframe._compat import PANDAS_GE_210, PANDAS_GE_220
 from dask.dataframe.utils import UNKNOWN_CATEGORIES
 from dask.utils import M
@@ -28,7 +29,7 @@ from dask_expr import (
     to_timedelta,
 )
 from dask_expr._expr import Filter, OpAlignPartitions, ToFrame, are_co_aligned
-from dask_expr._reductions import Len
+from dask_expr._reductions import Len, TreeReduce
 from dask_expr._shuffle import Shuffle
 from dask_expr.datasets import timeseries
 from dask_expr.io import FromPandas
@@ -224,6 +225,27 @@ def test_cumulative_methods(df, pdf, func):
     assert_eq(df, pdf)
 
 
+@pytest.mark.parametrize("func", ["cumsum", "cumprod", "cummin", "cummax"])
+def test_cumulative_methods_log_depth(func):
+    pdf = pd.DataFrame({"x": np.random.random(200) + 0.5})
+    pdf.loc[pdf.index[::3], "x"] = np.nan
+    df = from_pandas(pdf, npartitions=100)
+    assert_eq(getattr(df, func)(), getattr(pdf, func)())
+    assert_eq(getattr(df.x, func)(), getattr(pdf.x, func)())
+
+    # The carried values are scanned in log depth instead of one after another
+    dsk = dict(getattr(df.x, func)().__dask_graph__())
+    depth = {}
+
+    def _depth(key):
+        if key not in depth:
+            deps = get_dependencies(dsk, key)
+            depth[key] = 1 + max(map(_depth, deps), default=0)
+        return depth[key]
+
+    assert max(map(_depth, dsk)) < 20
+
+
 def test_bool(df):
     conditions = [df, df["x"], df == df, df["x"] == df["x"]]
     for cond in conditions:
@@ -2264,6 +2286,32 @@ def test_quantile(df):
         ser.quantile()
 
 
+def test_quantile_sketch(df, pdf):
+    # Small partitions are sketched exactly
+    assert_eq(df.x.quantile(method="sketch"), pdf.x.quantile())
+    assert_eq(
+        df.x.quantile(q=[0.2, 0.8], method="sketch"), pdf.x.quantile(q=[0.2, 0.8])
+    )
+    assert_eq(df.quantile(method="sketch"), pdf.quantile())
+    assert_eq(df.x.median_approximate(method="sketch"), pdf.x.median())
+
+    q = df.x.quantile(method="sketch").optimize(fuse=False)
+    assert len(list(q.find_operations(TreeReduce))) == 1
+
+    rs = np.random.RandomState(42)
+    s = pd.Series(rs.randn(100_000))
+    ds = from_pandas(s, npartitions=10)
+    qs = np.linspace(0.05, 0.95, 19)
+    result = ds.quantile(q=qs, method="sketch").compute()
+    ranks = np.searchsorted(np.sort(s.values), result.values) / len(s)
+    assert np.abs(ranks - qs).max() < 0.01
+
+    with dask.config.set({"dataframe.quantile.sketch-size": 2_000}):
+        result = ds.quantile(q=qs, method="sketch").compute()
+    ranks = np.searchsorted(np.sort(s.values), result.values) / len(s)
+    assert np.abs(ranks - qs).max() < 0.001
+
+
 @pytest.mark.parametrize("join", ["inner", "outer", "left", "right"])
 def test_align_axis(join):
     df1a = pd.DataFrame(
@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 
 from dask_expr import from_pandas
+from dask_expr._reductions import TreeReduce
 from dask_expr.tests._util import _backend_library, assert_eq
 
 # Set DataFrame backend for this module
@@ -63,3 +64,50 @@ def test_describe_series(df, pdf):
 
 def test_describe_df(df, pdf):
     assert_eq(df.describe(), _drop_mean(pdf.describe(), "ts"))
+
+
+def test_describe_sketch(df, pdf):
+    assert_eq(
+        df.x.describe(percentiles_method="sketch"), pdf.x.describe(), check_exact=False
+    )
+    assert_eq(
+        df.td.describe(percentiles_method="sketch"),
+        pdf.td.describe(),
+        check_exact=False,
+    )
+
+
+@pytest.mark.parametrize("split_every", [False, None, 2])
+def test_describe_df_single_pass(split_every):
+    pdf = pd.DataFrame(
+        {
+            "a": [1.5, None, 3.0, 4.0, -2.0, 0.5] * 4,
+            "b": range(24),
+            "c": list("xyzxyz") * 4,
+            "d": pd.to_timedelta(range(24), unit="h"),
+        }
+    )
+    df = from_pandas(pdf, npartitions=4)
+
+    result = df.describe(split_every=split_every)
+    optimized = result.optimize(fuse=False)
+    assert len(list(optimized.find_operations(TreeReduce))) == 1
+    # Merged percentiles are approximate, the other statistics are exact
+    stats = ["count", "mean", "std", "min", "max"]
+    assert_eq(result.compute().loc[stats], pdf.describe().loc[stats])
+    expected = pd.concat(
+        [df[col].describe(split_every=split_every).compute() for col in "abd"],
+        axis=1,
+    )
+    assert_eq(result, expected)
+
+    result = df.describe(include="all", split_every=split_every)
+    expected = pd.concat(
+        [df[col].describe(split_every=split_every).compute() for col in "abcd"],
+        axis=1,
+    )
+    assert_eq(result, expected)
+
+    # Empty partitions don't contribute
+    result = df[df.b > 15].describe(percentiles_method="sketch")
+    assert_eq(result, pdf[pdf.b > 15].describe())
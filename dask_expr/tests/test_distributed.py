@@ -151,6 +151,31 @@ async def test_merge_broadcast(c, s, a, b, shuffle, broadcast, how):
     )
 
 
+@gen_cluster(client=True)
+@pytest.mark.parametrize("broadcast", [None, True])
+async def test_merge_leftanti(c, s, a, b, broadcast):
+    pdf = pd.DataFrame({"a": [1, 2, 3, 4, 5, 6] * 5, "c": range(30)})
+    pdf2 = pd.DataFrame({"b": [1, 2, 2, 5]})
+    df = from_pandas(pdf, npartitions=15)
+    df2 = from_pandas(pdf2, npartitions=2)
+
+    result = df.merge(
+        df2,
+        left_on="a",
+        right_on="b",
+        shuffle_method="p2p",
+        broadcast=broadcast,
+        how="leftanti",
+    )
+    if broadcast:
+        assert len(list(result.optimize().find_operations(BroadcastJoin))) > 0
+    x = await c.compute(result)
+    pd.testing.assert_frame_equal(
+        x.sort_values(by="c", ignore_index=True),
+        pdf[~pdf.a.isin(pdf2.b)].reset_index(drop=True),
+    )
+
+
 @gen_cluster(client=True)
 async def test_merge_p2p_shuffle_reused_dataframe_with_different_parameters(c, s, a, b):
     pdf1 = pd.DataFrame({"a": range(100), "b": range(0, 200, 2)})
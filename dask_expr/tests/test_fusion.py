@@ -1,6 +1,7 @@
 import pytest
 
-from dask_expr import from_pandas, optimize
+from dask_expr import from_pandas, new_collection, optimize
+from dask_expr._expr import Blockwise
 from dask_expr.tests._util import _backend_library, assert_eq
 
 # Set DataFrame backend for this module
@@ -128,3 +129,30 @@ def test_name(df):
     assert "getitem" in str(fused.expr)
     assert "sub" in str(fused.expr)
     assert str(fused.expr) == str(fused.expr).lower()
+
+
+class InlinedFrame(Blockwise):
+    # Inlines the tasks of its frame instead of depending on it
+    _parameters = ["frame"]
+    operation = staticmethod(lambda df: df)
+
+    def dependencies(self):
+        return self.frame.dependencies()
+
+    def _task(self, index: int):
+        return self.frame._task(index)
+
+
+def test_fusion_follows_dependencies(df, pdf):
+    calls = []
+
+    def inc(part):
+        calls.append(len(part))
+        return part + 1
+
+    out = new_collection(InlinedFrame(df.map_partitions(inc, meta=pdf).expr))
+    # The inlined frame must not be fused into a task of its own, that
+    # would compute it twice
+    result = optimize(out, fuse=True).compute(scheduler="sync")
+    assert len(calls) == df.npartitions
+    assert_eq(result, pdf + 1)
@@ -6,8 +6,8 @@ import numpy as np
 import pytest
 
 from dask_expr import from_pandas
-from dask_expr._groupby import Aggregation, GroupByUDFBlockwise
-from dask_expr._reductions import TreeReduce
+from dask_expr._groupby import Aggregation, GroupByChunk, GroupByUDFBlockwise
+from dask_expr._reductions import Aggregate, ShuffleReduce, TreeReduce
 from dask_expr._shuffle import Shuffle, TaskShuffle, divisions_lru
 from dask_expr.io import FromPandas
 from dask_expr.tests._util import _backend_library, assert_eq, xfail_gpu
@@ -212,6 +212,71 @@ def test_groupby_nunique(df, pdf):
     assert_eq(df.xx.groupby(df.xy).nunique(), pdf.xx.groupby(pdf.xy).nunique())
 
 
+@pytest.mark.parametrize("split_out", [None, 3])
+def test_groupby_nunique_approx(split_out):
+    rs = np.random.RandomState(42)
+    pdf = pd.DataFrame(
+        {
+            "a": rs.randint(0, 10, 50_000),
+            "b": rs.randint(0, 20_000, 50_000).astype(float),
+            "c": rs.randint(0, 3, 50_000),
+        }
+    )
+    pdf.loc[pdf.a == 1, "b"] = np.nan
+    pdf.loc[pdf.a == 2, "b"] = pdf.b % 5
+    df = from_pandas(pdf, npartitions=5)
+
+    result = df.groupby("a").b.nunique_approx(split_out=split_out)
+    expected = pdf.groupby("a").b.nunique().astype(float)
+    assert result.npartitions == (split_out or 1)
+    assert_eq(result, expected, rtol=0.02)
+
+    result = df.b.groupby(df.a).nunique_approx(split_out=split_out)
+    assert_eq(result, expected, rtol=0.02)
+
+    result = df.groupby(["a", "c"]).b.nunique_approx(split_out=split_out)
+    expected = pdf.groupby(["a", "c"]).b.nunique().astype(float)
+    assert_eq(result, expected, rtol=0.02)
+
+    result = df.groupby("a").nunique_approx(split_out=split_out)
+    expected = pdf.groupby("a").nunique().astype(float)
+    assert result.npartitions == (split_out or 1)
+    assert_eq(result, expected, rtol=0.02)
+    result = df.groupby("a")[["b"]].nunique_approx(split_out=split_out)
+    assert_eq(result, expected[["b"]], rtol=0.02)
+
+    # Smaller sketches are less accurate
+    result = df.groupby("a").b.nunique_approx(split_out=split_out, b=10)
+    assert_eq(result, expected.b, rtol=0.1)
+    with pytest.raises(ValueError, match="between 4 and 16"):
+        df.groupby("a").b.nunique_approx(b=20)
+
+
+@pytest.mark.parametrize("observed", [True, False])
+@pytest.mark.parametrize("sort", [True, False])
+def test_groupby_categorical_counts_dense(observed, sort):
+    pdf = pd.DataFrame(
+        {
+            "a": pd.Categorical(list("abcab") * 20, categories=list("dcba")),
+            "b": [1.0, np.nan, 3.0, 4.0] * 25,
+            "c": range(100),
+        }
+    )
+    df = from_pandas(pdf, npartitions=5)
+    kwargs = {"observed": observed, "sort": sort}
+
+    result = df.groupby("a", **kwargs).size()
+    chunks = [
+        expr
+        for expr in result.optimize(fuse=False).walk()
+        if isinstance(expr, GroupByChunk)
+    ]
+    assert chunks and all("dense_columns" in c.chunk_kwargs for c in chunks)
+    assert_eq(result, pdf.groupby("a", **kwargs).size())
+    assert_eq(df.groupby("a", **kwargs).count(), pdf.groupby("a", **kwargs).count())
+    assert_eq(df.groupby("a", **kwargs).b.count(), pdf.groupby("a", **kwargs).b.count())
+
+
 def test_groupby_series(pdf, df):
     pdf_result = pdf.groupby(pdf.x).sum()
     result = df.groupby(df.x).sum()
@@ -366,6 +431,186 @@ def test_split_out_automatically():
     assert_eq(q, expected)
 
 
+def _sum_b(x):
+    return x.b.sum()
+
+
+def _demean(x):
+    return x - x.mean()
+
+
+def test_groupby_partition_local_index():
+    pdf = pd.DataFrame({"a": np.arange(100) % 13, "b": range(100), "c": 1.0})
+    df = from_pandas(pdf.set_index("a"), npartitions=4)
+    assert df.known_divisions
+
+    q = df.groupby("a").agg({"b": ["sum", "mean"], "c": "max"}, split_out=2)
+    assert q.divisions == df.divisions
+    optimized = q.optimize(fuse=False)
+    assert len(list(optimized.find_operations((TreeReduce, ShuffleReduce)))) == 0
+    assert len(list(optimized.find_operations(Aggregate))) == 1
+    assert_eq(q, pdf.groupby("a").agg({"b": ["sum", "mean"], "c": "max"}))
+
+    q = df.groupby("a").b.std()
+    assert q.divisions == df.divisions
+    assert_eq(q, pdf.groupby("a").b.std())
+
+    q = df.groupby(["a", "c"]).b.mean()
+    assert q.npartitions == df.npartitions
+    assert_eq(q, pdf.groupby(["a", "c"]).b.mean())
+
+
+def test_groupby_partition_local_shuffled():
+    pdf = pd.DataFrame({"a": np.arange(100) % 13, "b": range(100), "c": 1.0})
+    df = from_pandas(pdf, npartitions=4).shuffle("a")
+    df = df[df.b > 3]
+    expected = pdf[pdf.b > 3]
+
+    q = df.groupby(["a", "c"]).agg({"b": "sum"})
+    assert q.npartitions == 4
+    optimized = q.optimize(fuse=False)
+    assert len(list(optimized.find_operations((TreeReduce, ShuffleReduce)))) == 0
+    assert len(list(optimized.find_operations(Shuffle))) == 1
+    assert_eq(q, expected.groupby(["a", "c"]).agg({"b": "sum"}))
+
+    q = df.groupby("a").apply(_sum_b, meta=(None, int))
+    assert len(list(q.optimize(fuse=False).find_operations(Shuffle))) == 1
+    assert_eq(q, expected.groupby("a").apply(_sum_b), check_names=False)
+
+    q = df.groupby("a").b.transform(_demean, meta=("b", float))
+    assert len(list(q.optimize(fuse=False).find_operations(Shuffle))) == 1
+    assert_eq(q, expected.groupby("a").b.transform(_demean))
+
+    # Partitioned by a column that isn't a key
+    q = df.groupby("c").b.sum()
+    assert len(list(q.optimize(fuse=False).find_operations(TreeReduce))) == 1
+    assert_eq(q, expected.groupby("c").b.sum())
+
+    # Sorting needs the groups ordered across partitions as well
+    q = df.groupby("a", sort=True).b.sum()
+    assert q.npartitions == 1
+    assert_eq(q, expected.groupby("a").b.sum())
+
+    # Every partition contains every category
+    pdf["a"] = pdf.a.astype("category")
+    df = from_pandas(pdf, npartitions=4).shuffle("a")
+    q = df.groupby("a", observed=False).b.sum()
+    assert len(list(q.optimize(fuse=False).find_operations(TreeReduce))) == 1
+    assert_eq(q, pdf.groupby("a", observed=False).b.sum())
+
+
+def test_split_out_auto(monkeypatch):
+    monkeypatch.setattr(
+        "dask_expr._groupby._AUTO_SPLIT_OUT_GROUPS_PER_PARTITION", 1_000
+    )
+    pdf = pd.DataFrame({"a": range(10_000), "b": [1, 2] * 5_000, "c": 1})
+    df = from_pandas(pdf, npartitions=20)
+
+    # Few groups are reduced with a tree
+    q = df.groupby("b").sum(split_out="auto")
+    assert q.optimize().npartitions == 1
+    assert len(list(q.optimize(fuse=False).find_operations(TreeReduce))) == 1
+    assert_eq(q, pdf.groupby("b").sum())
+
+    # Many groups are shuffled into one partition per 1000 groups
+    q = df.groupby("a").sum(split_out="auto")
+    assert 8 <= q.optimize().npartitions <= 12
+    assert_eq(q, pdf.groupby("a").sum())
+
+    # Like the divisions of set_index, the number of groups is estimated when
+    # the aggregation is created, so the partitions are known up front
+    assert q.npartitions == q.optimize().npartitions
+    assert len(q.divisions) == q.npartitions + 1
+    assert len(q.to_delayed()) == q.npartitions
+    assert_eq(
+        pd.concat([q.partitions[i].compute() for i in range(q.npartitions)]),
+        pdf.groupby("a").sum(),
+        check_index=False,
+    )
+    q = df.groupby("a").c.count(split_out="auto")
+    assert q.npartitions == q.optimize().npartitions
+    assert 8 <= q.npartitions <= 12
+    q = df.groupby("a").nunique_approx(split_out="auto")
+    assert 8 <= q.npartitions <= 12
+
+    q = df.groupby(["a", "b"]).agg({"c": "sum"}, split_out="auto")
+    assert 8 <= q.optimize().npartitions <= 12
+    assert_eq(q, pdf.groupby(["a", "b"]).agg({"c": "sum"}))
+
+    q = df.groupby("a").c.mean(split_out="auto")
+    assert 8 <= q.optimize().npartitions <= 12
+    assert_eq(q, pdf.groupby("a").c.mean())
+
+    # Bounded by the number of input partitions
+    df = from_pandas(pdf, npartitions=4)
+    q = df.groupby("a").sum(split_out="auto")
+    assert q.optimize().npartitions == 4
+    assert_eq(q, pdf.groupby("a").sum())
+
+
+def _uses_arrow_engine(q):
+    return any(
+        "arrow_funcs" in (op.chunk_kwargs or {})
+        for op in q.optimize(fuse=False).find_operations(GroupByChunk)
+    )
+
+
+@xfail_gpu("pyarrow engine is pandas only")
+@pytest.mark.parametrize("by", ["a", "s", ["a", "s"]])
+@pytest.mark.parametrize("split_out", [1, 3])
+def test_groupby_arrow_engine(by, split_out):
+    rs = np.random.RandomState(42)
+    pdf = pd.DataFrame(
+        {
+            "a": rs.randint(0, 10, 100),
+            "s": pd.array(rs.choice(["x", "y", None], 100), dtype="string"),
+            "b": rs.randn(100),
+            "c": rs.randint(0, 5, 100).astype("int32"),
+            "d": pd.array(rs.randint(0, 5, 100), dtype="Int64"),
+        }
+    )
+    pdf.loc[::7, "b"] = np.nan
+    pdf.loc[::5, "d"] = pd.NA
+    df = from_pandas(pdf, npartitions=5)
+
+    with dask.config.set({"dataframe.groupby.engine": "pyarrow"}):
+        g, pg = df.groupby(by), pdf.groupby(by)
+        for api in ["sum", "min", "max"]:
+            q = getattr(g, api)(numeric_only=True, split_out=split_out)
+            assert _uses_arrow_engine(q)
+            assert_eq(q, getattr(pg, api)(numeric_only=True))
+
+            q = getattr(g.b, api)(split_out=split_out)
+            assert _uses_arrow_engine(q)
+            assert_eq(q, getattr(pg.b, api)())
+
+        q = g[["b", "c", "d"]].count(split_out=split_out)
+        assert _uses_arrow_engine(q)
+        assert_eq(q, pg[["b", "c", "d"]].count())
+
+        spec = {"b": ["sum", "mean", "min"], "c": "max", "d": ["count", "mean"]}
+        q = g.agg(spec, split_out=split_out)
+        assert _uses_arrow_engine(q)
+        assert_eq(q, pg.agg(spec))
+
+        # Fall back to pandas when pyarrow can't handle the aggregation
+        q = g.agg({"b": ["sum", "var"]}, split_out=split_out)
+        assert not _uses_arrow_engine(q)
+        assert_eq(q, pg.agg({"b": ["sum", "var"]}))
+
+        q = df.groupby(by, dropna=False).b.sum(split_out=split_out)
+        assert not _uses_arrow_engine(q)
+        assert_eq(q, pdf.groupby(by, dropna=False).b.sum())
+
+        q = g.b.sum(split_out=split_out)
+
+    # The engine is fixed when the aggregation is created
+    assert _uses_arrow_engine(q)
+    assert_eq(q, pdf.groupby(by).b.sum())
+    assert not _uses_arrow_engine(df.groupby(by).b.sum())
+    assert df.groupby(by).b.sum(split_out=split_out)._name != q._name
+
+
 def test_split_out_sort_values_compute(pdf, df):
     divisions_lru.data = OrderedDict()
     result = df.groupby("x").sum(split_out=2).sort_values(by="y").compute()
@@ -876,6 +1121,15 @@ def test_cumulative(func, key, sel):
     assert_eq(getattr(g, func)(), getattr(dg, func)())
 
 
+@pytest.mark.parametrize("func", ["cumsum", "cumprod", "cumcount"])
+def test_cumulative_many_partitions(func):
+    df = pd.DataFrame(
+        {"a": np.random.randint(0, 5, 300), "b": np.random.random(300) + 0.5}
+    )
+    ddf = from_pandas(df, npartitions=75)
+    assert_eq(getattr(df.groupby("a").b, func)(), getattr(ddf.groupby("a").b, func)())
+
+
 @pytest.mark.parametrize("by", ["key1", ["key1", "key2"]])
 @pytest.mark.parametrize(
     "slice_key",
@@ -5,7 +5,8 @@ import pytest
 
 from dask_expr import Merge, from_pandas, merge, repartition
 from dask_expr._expr import Filter, Projection
-from dask_expr._merge import BroadcastJoin
+from dask_expr._merge import BroadcastJoin, RangeJoin
+from dask_expr._repartition import Repartition
 from dask_expr._shuffle import Shuffle
 from dask_expr.io import FromPandas
 from dask_expr.tests._util import _backend_library, assert_eq
@@ -994,3 +995,155 @@ def test_merge_leftsemi():
     df2 = from_pandas(pdf2, npartitions=2)
     with pytest.raises(NotImplementedError, match="on columns from the index"):
         df1.merge(df2, how="leftsemi", on="aa")
+
+
+@pytest.mark.parametrize("npartitions", [(2, 2), (3, 1), (1, 3), (8, 2)])
+@pytest.mark.parametrize("broadcast", [None, True])
+def test_merge_leftanti(npartitions, broadcast):
+    pdf1 = pd.DataFrame({"aa": [1, 2, 3, 4, 5, 6, 1, 2, 3] * 3, "bb": range(27)})
+    pdf2 = pd.DataFrame({"aa": [1, 2, 2, 4, 4, 10], "cc": 1})
+    expected = pdf1[~pdf1.aa.isin(pdf2.aa)]
+
+    df1 = from_pandas(pdf1, npartitions=npartitions[0])
+    df2 = from_pandas(pdf2, npartitions=npartitions[1])
+    result = df1.merge(df2, how="leftanti", shuffle_method="tasks", broadcast=broadcast)
+    if broadcast and npartitions[1] > 1:
+        # Only right may be broadcast
+        bcast = list(result.optimize(fuse=False).find_operations(BroadcastJoin))
+        assert len(bcast) == (npartitions[0] >= npartitions[1])
+    assert_eq(result, expected, check_index=False, check_divisions=False)
+    assert list(result.columns) == list(pdf1.columns)
+
+    df2 = df2.rename(columns={"aa": "dd"})
+    result = df1.merge(
+        df2, how="leftanti", left_on="aa", right_on="dd", broadcast=broadcast
+    )
+    assert_eq(result, expected, check_index=False, check_divisions=False)
+
+    with pytest.raises(NotImplementedError, match="indicator"):
+        df1.merge(df2, how="leftanti", left_on="aa", right_on="dd", indicator=True)
+
+
+def test_merge_leftanti_pushdown():
+    pdf1 = pd.DataFrame({"aa": [1, 2, 3, 4, 5, 6, 1, 2, 3] * 3, "bb": range(27)})
+    pdf2 = pd.DataFrame({"aa": [1, 2, 2, 4, 4, 10], "cc": 1})
+    expected = pdf1[~pdf1.aa.isin(pdf2.aa)]
+    df1 = from_pandas(pdf1, npartitions=4)
+    df2 = from_pandas(pdf2, npartitions=2)
+
+    result = df1.merge(df2, how="leftanti")
+    result = result[result.bb > 5]
+    expected_opt = df1[df1.bb > 5].merge(df2, how="leftanti")
+    assert result.optimize()._name == expected_opt.optimize()._name
+    assert_eq(result, expected[expected.bb > 5], check_index=False)
+
+    # Predicates on the join keys restrict both sides
+    result = df1.merge(df2, how="leftanti")
+    result = result[result.aa > 3]
+    filters = list(result.optimize(fuse=False).find_operations(Filter))
+    assert len(filters) == 2
+    assert_eq(result, expected[expected.aa > 3], check_index=False)
+
+    result = df1.merge(df2, how="leftanti").bb
+    assert_eq(result, expected.bb, check_index=False)
+
+
+def test_merge_reorder_inner_joins():
+    fact = pd.DataFrame(
+        {
+            "k1": range(100),
+            "k2": [i % 10 for i in range(100)],
+            "k3": [i % 5 for i in range(100)],
+            "v": range(100),
+        }
+    )
+    dim1 = pd.DataFrame({"k1": range(100), "a": range(100)})
+    dim2 = pd.DataFrame({"k2": range(10), "b": range(10)})
+    dim3 = pd.DataFrame({"k3": range(5), "c": range(5)})
+    df = from_pandas(fact, npartitions=10)
+    ddim1 = from_pandas(dim1, npartitions=5)
+    ddim2 = from_pandas(dim2, npartitions=2)
+    ddim3 = from_pandas(dim3, npartitions=1)
+
+    result = (
+        df.merge(ddim1, on="k1")
+        .merge(ddim2, on="k2")
+        .merge(ddim3[ddim3.c > 1], on="k3")
+    )
+    expected = (
+        fact.merge(dim1, on="k1").merge(dim2, on="k2").merge(dim3[dim3.c > 1], on="k3")
+    )
+    assert_eq(result, expected, check_index=False)
+
+    # The filtered dimension table is joined first, the largest one last
+    tuned = result.expr.simplify().rewrite(kind="tune")
+    assert isinstance(tuned, Projection)
+    assert tuned.columns == list(result.columns)
+    merges = list(tuned.find_operations(Merge))
+    assert [m.right_on for m in merges] == [["k1"], ["k2"], ["k3"]]
+    assert tuned.rewrite(kind="tune")._name == tuned._name
+
+
+def test_merge_reorder_inner_joins_skipped():
+    pdf1 = pd.DataFrame({"a": range(10), "x": 1})
+    pdf2 = pd.DataFrame({"a": range(10), "b": range(10), "x": 2})
+    pdf3 = pd.DataFrame({"b": range(10), "y": 3})
+    df1 = from_pandas(pdf1, npartitions=4)
+    df2 = from_pandas(pdf2, npartitions=2)
+    df3 = from_pandas(pdf3, npartitions=1)
+
+    # Overlapping columns are suffixed depending on the join order
+    result = df1.merge(df2, on="a").merge(df3[df3.y > 1], on="b")
+    expr = result.expr.simplify()
+    assert expr.rewrite(kind="tune")._name == expr._name
+    assert_eq(
+        result,
+        pdf1.merge(pdf2, on="a").merge(pdf3[pdf3.y > 1], on="b"),
+        check_index=False,
+    )
+
+    # Outer joins are not reordered
+    result = df1.merge(df2[["a", "b"]], on="a").merge(df3, on="b", how="outer")
+    expr = result.expr.simplify()
+    assert expr.rewrite(kind="tune")._name == expr._name
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("on_index", [True, False])
+def test_merge_known_unequal_divisions_range_join(how, on_index):
+    pdf1 = pd.DataFrame({"a": range(100)}, index=pd.Index(range(100), name="i"))
+    pdf2 = pd.DataFrame({"b": range(60)}, index=pd.Index(range(20, 140, 2), name="i"))
+    df1 = from_pandas(pdf1, npartitions=7)
+    df2 = from_pandas(pdf2, npartitions=4)
+    if on_index:
+        kwargs = {"left_index": True, "right_index": True}
+    else:
+        kwargs = {"on": "i"}
+
+    result = df1.merge(df2, how=how, **kwargs)
+    assert_eq(result, pdf1.merge(pdf2, how=how, **kwargs))
+
+    range_joins = list(result.optimize(fuse=False).find_operations(RangeJoin))
+    if how in ("outer", "right"):
+        # The right side has fewer partitions than the left side
+        assert not range_joins
+    else:
+        assert len(range_joins) == 1
+        assert result.divisions == df1.divisions
+        (join,) = range_joins
+        divisions, other = join.left.divisions, join.right.divisions
+        for i in range(join.npartitions):
+            lower, upper = divisions[i], divisions[i + 1]
+            assert join._overlapping_partitions(i) == [
+                j
+                for j in range(len(other) - 1)
+                if other[j] <= upper and other[j + 1] >= lower
+            ]
+        # No repartitioning of either side
+        assert not list(result.optimize(fuse=False).find_operations(Repartition))
+
+    result = df2.merge(df1, how=how, **kwargs)
+    assert_eq(result, pdf2.merge(pdf1, how=how, **kwargs))
+    if how == "right":
+        assert len(list(result.optimize(fuse=False).find_operations(RangeJoin))) == 1
+        assert result.divisions == df1.divisions
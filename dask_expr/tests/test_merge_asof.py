@@ -1,4 +1,8 @@
+import numpy as np
+import pytest
+
 from dask_expr import from_pandas, merge_asof
+from dask_expr._merge_asof import MergeAsofByKey
 from dask_expr.tests._util import _backend_library, assert_eq
 
 pd = _backend_library()
@@ -32,3 +36,99 @@ def test_merge_asof_on_basic():
     c = merge_asof(a, b, on="a")
     # merge_asof does not preserve index
     assert_eq(c, C, check_index=False)
+
+
+@pytest.mark.parametrize("direction", ["backward", "forward", "nearest"])
+def test_merge_asof_by_key(direction):
+    rs = np.random.RandomState(42)
+    A = pd.DataFrame(
+        {
+            "time": np.sort(rs.choice(1000, 100, replace=False)),
+            "sym": rs.choice(list("abcdef"), 100),
+            "qty": np.arange(100),
+        }
+    )
+    B = pd.DataFrame(
+        {
+            "time": np.sort(rs.choice(1000, 300, replace=False)),
+            "sym": rs.choice(list("abcdef"), 300),
+            "bid": rs.random_sample(300),
+        }
+    )
+    # Neither side needs to be globally sorted, but the result is only
+    # ordered within the hash partitions
+    a = from_pandas(A.sample(frac=1, random_state=1), npartitions=4, sort=False)
+    b = from_pandas(B.sample(frac=1, random_state=2), npartitions=3, sort=False)
+
+    c = merge_asof(a, b, on="time", by="sym", direction=direction, shuffle_by_key=True)
+    assert c.npartitions == a.npartitions
+    assert list(c.optimize(fuse=False).find_operations(MergeAsofByKey))
+    C = pd.merge_asof(A, B, on="time", by="sym", direction=direction)
+    assert_eq(c.compute().sort_values("qty"), C.sort_values("qty"), check_index=False)
+
+    c = merge_asof(
+        a.set_index("time", sort=False),
+        b.set_index("time", sort=False),
+        left_index=True,
+        right_index=True,
+        by="sym",
+        direction=direction,
+        shuffle_by_key=True,
+    )
+    C = pd.merge_asof(
+        A.set_index("time"),
+        B.set_index("time"),
+        left_index=True,
+        right_index=True,
+        by="sym",
+        direction=direction,
+    )
+    assert_eq(c.compute().sort_values("qty"), C.sort_values("qty"))
+
+
+def test_merge_asof_by_key_ordered():
+    rs = np.random.RandomState(42)
+    A = pd.DataFrame(
+        {
+            "time": np.sort(rs.choice(1000, 100, replace=False)),
+            "sym": rs.choice(list("abcdef"), 100),
+            "qty": np.arange(100),
+        }
+    )
+    B = pd.DataFrame(
+        {
+            "time": np.sort(rs.choice(1000, 300, replace=False)),
+            "sym": rs.choice(list("abcdef"), 300),
+            "bid": rs.random_sample(300),
+        }
+    )
+    a = from_pandas(A, npartitions=4)
+    b = from_pandas(B, npartitions=3)
+
+    c = merge_asof(a, b, on="time", by="sym")
+    assert not list(c.optimize(fuse=False).find_operations(MergeAsofByKey))
+    C = pd.merge_asof(A, B, on="time", by="sym")
+    assert_eq(c, C, check_index=False)
+
+    # Known divisions keep the ordered merge even when asked to shuffle
+    c = merge_asof(
+        a.set_index("time"),
+        b.set_index("time"),
+        left_index=True,
+        right_index=True,
+        by="sym",
+        shuffle_by_key=True,
+    )
+    assert not list(c.optimize(fuse=False).find_operations(MergeAsofByKey))
+    assert c.known_divisions
+    C = pd.merge_asof(
+        A.set_index("time"),
+        B.set_index("time"),
+        left_index=True,
+        right_index=True,
+        by="sym",
+    )
+    assert_eq(c, C)
+
+    with pytest.raises(ValueError, match="shuffle_by_key requires by"):
+        merge_asof(a, b, on="time", shuffle_by_key=True)
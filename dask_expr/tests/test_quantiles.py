@@ -1,3 +1,6 @@
+import dask
+import pytest
+
 from dask_expr import from_pandas
 from dask_expr.tests._util import _backend_library, assert_eq
 
@@ -17,3 +20,53 @@ def test_repartition_quantiles():
     result = df.a._repartition_quantiles(npartitions=4)
     expected = pd.Series([1, 2, 5, 8, 15], index=[0, 0.25, 0.5, 0.75, 1], name="a")
     assert_eq(result, expected, check_exact=False)
+
+
+def test_repartition_quantiles_sketch():
+    pdf = pd.DataFrame({"a": [1, 2, 3, 4, 5, 15, 7, 8, 9, 10, 11], "d": 3})
+    df = from_pandas(pdf, npartitions=5)
+    result = df.a._repartition_quantiles(npartitions=4, method="sketch")
+    expected = pd.Series([1, 4, 7, 10, 15], index=[0, 0.25, 0.5, 0.75, 1], name="a")
+    assert_eq(result, expected)
+
+    pdf = pd.DataFrame({"a": pd.date_range("2000", periods=100, freq="h")})
+    df = from_pandas(pdf, npartitions=5)
+    result = df.a._repartition_quantiles(npartitions=4, method="sketch").compute()
+    assert result.dtype == pdf.a.dtype
+    assert result.iloc[0] == pdf.a.min()
+    assert result.iloc[-1] == pdf.a.max()
+
+
+def test_set_index_sketch_divisions(monkeypatch):
+    from dask_expr._quantiles import RepartitionQuantiles
+    from dask_expr._shuffle import divisions_lru
+
+    calls = []
+    sketch_layer = RepartitionQuantiles._sketch_layer
+
+    def _sketch_layer(self, *args):
+        calls.append(self)
+        return sketch_layer(self, *args)
+
+    monkeypatch.setattr(RepartitionQuantiles, "_sketch_layer", _sketch_layer)
+    pdf = pd.DataFrame({"a": range(1000, 0, -1), "b": 1})
+    df = from_pandas(pdf, npartitions=10, sort=False)
+
+    # The config only sets the size of the sketches
+    with dask.config.set({"dataframe.quantile.sketch-size": 100}):
+        assert_eq(df.set_index("a"), pdf.set_index("a"))
+        assert not calls
+
+        divisions_lru.clear()
+        result = df.set_index("a", divisions_method="sketch")
+        assert_eq(result, pdf.set_index("a"))
+        assert calls and {q.sketch_size for q in calls} == {100}
+        calls.clear()
+        divisions_lru.clear()
+        assert_eq(df.sort_values("a", divisions_method="sketch"), pdf.sort_values("a"))
+        assert calls and {q.sketch_size for q in calls} == {100}
+
+    # The sketch size is part of the expression
+    assert df.set_index("a", divisions_method="sketch")._name != result._name
+    with pytest.raises(ValueError, match="divisions_method"):
+        df.set_index("a", divisions_method="tdigest")
@@ -2,11 +2,15 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import dask
 import numpy as np
 import pytest
+from dask.base import collections_to_dsk
 from dask.utils import M
 
-from dask_expr import from_pandas
+from dask_expr import _collection, from_pandas
+from dask_expr._expr import _ExprSequence
+from dask_expr._reductions import FusedChunk, FusedReduction, TreeReduce
 from dask_expr.tests._util import _backend_library, assert_eq, xfail_gpu
 
 # Set DataFrame backend for this module
@@ -114,6 +118,24 @@ def test_value_counts_sort(pdf):
     )
 
 
+@pytest.mark.parametrize("split_every", [False, None, 3])
+@pytest.mark.parametrize("dropna", [True, False])
+@pytest.mark.parametrize("normalize", [True, False])
+def test_value_counts_categorical_dense(split_every, dropna, normalize):
+    pdf = pd.DataFrame({"x": list("abcab") * 20 + [None] * 3})
+    pdf["x"] = pdf.x.astype(pd.CategoricalDtype(list("dcba")))
+    df = from_pandas(pdf, npartitions=5)
+    result = df.x.value_counts(
+        split_every=split_every, dropna=dropna, normalize=normalize
+    )
+    assert result.expr._dense
+    assert_eq(result, pdf.x.value_counts(dropna=dropna, normalize=normalize))
+
+    # Unknown categories are counted by hashing
+    df = df.assign(x=df.x.cat.as_unknown())
+    assert not df.x.value_counts().expr._dense
+
+
 @pytest.mark.parametrize("split_every", [None, 5])
 @pytest.mark.parametrize("split_out", [1, True])
 def test_unique(pdf, df, split_every, split_out):
@@ -521,3 +543,53 @@ def test_reduction_split_every_false():
     df = from_pandas(pdf, npartitions=1)
     result = df.reduction(chunk=lambda x: x, split_every=False)
     assert_eq(result, pdf)
+
+
+def test_fuse_reductions(pdf, df, monkeypatch):
+    pdf["z"] = 1.5
+    df = from_pandas(pdf, npartitions=10)
+
+    chunks = []
+    chunk = FusedReduction.chunk.__func__
+
+    def counting_chunk(cls, df, specs):
+        chunks.append(len(df))
+        return chunk(cls, df, specs)
+
+    monkeypatch.setattr(FusedReduction, "chunk", classmethod(counting_chunk))
+    # dask.compute optimizes the collections together, so that all
+    # reductions share a single pass over the partitions
+    result = dask.compute(df.x.sum(), df.y.mean(), df.z.max(), df.x.nunique())
+    expected = (pdf.x.sum(), pdf.y.mean(), pdf.z.max(), pdf.x.nunique())
+    assert result == expected
+    assert len(chunks) == df.npartitions
+    monkeypatch.undo()
+
+    seq = _ExprSequence(df.x.sum().expr, df.y.mean().expr, df.z.max().expr)
+    optimized = seq.optimize(fuse=True)
+    assert len(list(optimized.find_operations(TreeReduce))) == 1
+    (chunked,) = optimized.find_operations(FusedChunk)
+    assert len(chunked.chunk_kwargs["specs"]) == 4
+
+    # Single expressions are left alone
+    q = df.y.mean().optimize()
+    assert len(list(q.find_operations(FusedChunk))) == 0
+    assert_eq(q, pdf.y.mean())
+    # and optimized collections aren't optimized again
+    graph = collections_to_dsk([q, df.x.sum().optimize()])
+    assert set(graph) == set(q.dask) | set(df.x.sum().optimize().dask)
+
+    # Reductions over different frames are not fused
+    seq = _ExprSequence((df.x + 1).sum().expr, df.y.sum().expr)
+    assert len(list(seq.optimize().find_operations(FusedChunk))) == 0
+    result = dask.compute((df.x + 1).sum(), df.y.sum())
+    assert result == ((pdf.x + 1).sum(), pdf.y.sum())
+
+    result = dask.compute(df.x.sum(), df[df.x > 10].y.max(), df, 1)
+    assert result[0] == pdf.x.sum()
+    assert result[1] == pdf[pdf.x > 10].y.max()
+    assert_eq(result[2], pdf)
+    assert result[3] == 1
+
+    # Internal callers, e.g. DataFrame.info, keep using dask.compute
+    assert _collection.compute is dask.compute
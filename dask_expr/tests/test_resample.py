@@ -1,8 +1,10 @@
 from itertools import product
 
+import numpy as np
 import pytest
 
 from dask_expr import from_pandas
+from dask_expr._resample import ResamplePartialAggregation
 from dask_expr.tests._util import _backend_library, assert_eq
 
 # Set DataFrame backend for this module
@@ -128,3 +130,25 @@ def test_resample_has_correct_fill_value(method):
     assert_eq(
         getattr(ds.resample("30min"), method)(), getattr(ps.resample("30min"), method)()
     )
+
+
+@pytest.mark.parametrize(
+    "method", ["count", "size", "sum", "min", "max", "first", "last", "mean"]
+)
+@pytest.mark.parametrize("freq", ["h", "7h", "D"])
+@pytest.mark.parametrize("closed,label", [("left", "left"), ("right", "right")])
+def test_resample_partial_aggregates(method, freq, closed, label):
+    rng = np.random.default_rng(42)
+    index = pd.Timestamp("2000-01-01") + pd.to_timedelta(
+        np.sort(rng.integers(0, 10 * 86400, 1000)), unit="s"
+    )
+    pdf = pd.DataFrame(
+        {"a": rng.normal(size=1000), "b": rng.integers(0, 10, 1000)}, index=index
+    )
+    pdf.loc[pdf.index[::5], "a"] = np.nan
+    df = from_pandas(pdf, npartitions=17)
+
+    result = getattr(df.resample(freq, closed=closed, label=label), method)()
+    expected = getattr(pdf.resample(freq, closed=closed, label=label), method)()
+    assert list(result.optimize(fuse=False).find_operations(ResamplePartialAggregation))
+    assert_eq(result, expected)
@@ -3,6 +3,7 @@ import pandas as pd
 import pytest
 
 from dask_expr import from_pandas
+from dask_expr._rolling import RollingBoundaryAggregation
 from dask_expr.tests._util import _backend_library, assert_eq
 
 # Set DataFrame backend for this module
@@ -135,6 +136,32 @@ def test_time_rolling_large_window_variable_chunks(window):
     assert_eq(ddf.rolling(window).mean(), df.rolling(window).mean())
 
 
+@pytest.mark.parametrize("api", ["count", "sum", "mean", "var", "std", "min", "max"])
+@pytest.mark.parametrize("window,min_periods", [("100s", None), ("1000s", 0)])
+def test_time_rolling_boundary_aggregates(api, window, min_periods):
+    rng = np.random.default_rng(42)
+    index = pd.Timestamp("2000") + pd.to_timedelta(
+        np.sort(rng.integers(0, 3000, 300)), unit="s"
+    )
+    pdf = pd.DataFrame(
+        {"a": rng.normal(1e6, 1, 300), "b": rng.integers(0, 10, 300)}, index=index
+    )
+    pdf.loc[pdf.index[::7], "a"] = np.nan
+    pdf.loc[pdf.index[100:140], "a"] = np.nan
+    df = from_pandas(pdf, npartitions=30)
+
+    result = getattr(df.rolling(window, min_periods=min_periods), api)()
+    expected = getattr(pdf.rolling(window, min_periods=min_periods), api)()
+    assert list(result.optimize(fuse=False).find_operations(RollingBoundaryAggregation))
+    # The index has duplicates, so compare without sorting
+    assert_eq(result, expected, sort_results=False)
+    assert_eq(
+        getattr(df.a.rolling(window, min_periods=min_periods), api)(),
+        getattr(pdf.a.rolling(window, min_periods=min_periods), api)(),
+        sort_results=False,
+    )
+
+
 def test_rolling_one_element_window_empty_after(df, pdf):
     pdf.index = pd.date_range("2000-01-01", periods=12, freq="2s")
     df = from_pandas(pdf, npartitions=3)